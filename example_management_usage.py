@@ -6,8 +6,10 @@ This script demonstrates how to use the configuration and management interface
 to monitor and control the Bluesky crypto agent system.
 """
 import asyncio
-import time
+import atexit
+import sys
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import Mock
 
 from src.config.agent_config import AgentConfig
@@ -16,6 +18,11 @@ from src.services.management_api import ManagementAPI
 from src.agents.bluesky_crypto_agent import BlueskyCryptoAgent
 from src.services.scheduler_service import SchedulerService
 
+try:
+    import uvloop
+except ImportError:  # uvloop is an optional speedup; fall back to the default loop
+    uvloop = None
+
 
 def print_section(title):
     """Print a formatted section header"""
@@ -29,6 +36,55 @@ def print_subsection(title):
     print(f"\n--- {title} ---")
 
 
+class _StubResponse:
+    """Minimal LLM response carrying only the generated text"""
+    __slots__ = ('content',)
+    
+    def __init__(self, content):
+        self.content = content
+
+
+class _StubLLM:
+    """Lightweight stand-in for a language model that always returns the same response"""
+    __slots__ = ()
+    
+    def invoke(self, *args, **kwargs):
+        return _DEMO_RESPONSE
+
+
+class _DemoResult:
+    """Successful workflow result returned by the demo workflow"""
+    __slots__ = ('success',)
+    
+    def __init__(self, success):
+        self.success = success
+
+
+_DEMO_RESPONSE = _StubResponse("Demo response")
+_DEMO_RESULT = _DemoResult(True)
+
+
+async def demo_workflow():
+    """Workflow run by the demo scheduler"""
+    print("Demo workflow executed")
+    return _DEMO_RESULT
+
+
+async def _wait_ready(api):
+    """Wait until the management API server reports it is running"""
+    while not api.is_server_running():
+        await asyncio.sleep(0.01)
+
+
+def _new_event_loop():
+    """Create the demo event loop, using uvloop and eager task execution where available"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    # Python 3.12+: coroutines that finish without suspending skip the ready queue
+    if hasattr(asyncio, 'eager_task_factory'):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 async def main():
     """Main demonstration function"""
     print_section("Bluesky Crypto Agent Management Interface Demo")
@@ -61,9 +117,8 @@ async def main():
     # Create management interface
     management_interface = ManagementInterface()
     
-    # Create mock LLM for demo
-    mock_llm = Mock()
-    mock_llm.invoke.return_value = Mock(content="Demo response")
+    # Create stub LLM for demo
+    mock_llm = _StubLLM()
     
     # Create agent with management interface
     try:
@@ -86,10 +141,6 @@ async def main():
         print("✓ Mock agent connected for demo purposes")
     
     # Create scheduler
-    async def demo_workflow():
-        print("Demo workflow executed")
-        return Mock(success=True)
-    
     scheduler = SchedulerService(demo_workflow, 30, 25)
     management_interface.set_scheduler(scheduler)
     print("✓ Scheduler initialized")
@@ -101,8 +152,7 @@ async def main():
     print(f"Configuration valid: {is_valid}")
     if errors:
         print("Validation errors:")
-        for error in errors:
-            print(f"  - {error}")
+        sys.stdout.write("".join(f"  - {error}\n" for error in errors))
     else:
         print("✓ No validation errors")
     
@@ -118,24 +168,30 @@ async def main():
     is_valid, errors = management_interface.validate_configuration(invalid_config)
     print(f"\nInvalid configuration test - Valid: {is_valid}")
     print(f"Found {len(errors)} validation errors:")
-    for error in errors[:3]:  # Show first 3 errors
-        print(f"  - {error}")
+    sys.stdout.write("".join(f"  - {error}\n" for error in errors[:3]))  # Show first 3 errors
+    
+    # Status, metrics and health checks poll independent components, so fetch them concurrently
+    status, metrics, health_check = await asyncio.gather(
+        asyncio.to_thread(management_interface.get_system_status),
+        asyncio.to_thread(management_interface.get_performance_metrics, 24),
+        asyncio.to_thread(management_interface.perform_health_check)
+    )
     
     # 4. System Status Reporting
     print_subsection("4. System Status Reporting")
     
-    status = management_interface.get_system_status()
     print(f"System uptime: {status['uptime_seconds']:.1f} seconds")
     print(f"Health status: {status['health_status']}")
     print("Component statuses:")
-    for component, info in status['components'].items():
-        print(f"  - {component}: {info['status']}")
+    sys.stdout.write("".join(
+        f"  - {component}: {info['status']}\n"
+        for component, info in status['components'].items()
+    ))
     
     # 5. Performance Metrics
     print_subsection("5. Performance Metrics")
     
     try:
-        metrics = management_interface.get_performance_metrics(24)
         print(f"Metrics for last {metrics['period_hours']} hours:")
         
         if 'workflow_metrics' in metrics:
@@ -152,46 +208,46 @@ async def main():
     # 6. Manual Overrides
     print_subsection("6. Manual Override System")
     
-    # Set a manual override
-    success = management_interface.set_manual_override('skip_posting', True, 60)
-    print(f"Set skip posting override: {'✓' if success else '✗'}")
+    # Set manual overrides in a single call
+    results = management_interface.set_manual_overrides({
+        'skip_posting': (True, 60),
+        'force_content_approval': (True, 30)
+    })
+    print(f"Set skip posting override: {'✓' if results['skip_posting'] else '✗'}")
+    print(f"Set force approval override: {'✓' if results['force_content_approval'] else '✗'}")
     
     # Check if override is active
     is_active, value = management_interface.is_override_active('skip_posting')
     print(f"Skip posting override active: {is_active} (value: {value})")
     
-    # Set another override
-    success = management_interface.set_manual_override('force_content_approval', True, 30)
-    print(f"Set force approval override: {'✓' if success else '✗'}")
-    
     # Get all active overrides
     overrides = management_interface.get_active_overrides()
     print(f"Active overrides: {len(overrides['active_overrides'])}")
-    for override_name in overrides['active_overrides']:
-        print(f"  - {override_name}")
+    sys.stdout.write("".join(f"  - {override_name}\n" for override_name in overrides['active_overrides']))
     
     # Remove an override
-    success = management_interface.remove_manual_override('skip_posting')
-    print(f"Removed skip posting override: {'✓' if success else '✗'}")
+    results = management_interface.remove_manual_overrides(['skip_posting'])
+    print(f"Removed skip posting override: {'✓' if results['skip_posting'] else '✗'}")
     
     # 7. Health Check System
     print_subsection("7. Health Check System")
     
-    health_check = management_interface.perform_health_check()
     print(f"Overall health status: {health_check['overall_status']}")
     print(f"Issues found: {health_check['issue_count']}")
     
     print("Component health checks:")
+    check_lines = []
     for component, check in health_check['checks'].items():
         status_icon = "✓" if check['status'] == 'healthy' else "⚠" if check['status'] == 'warning' else "✗"
-        print(f"  {status_icon} {component}: {check['status']}")
+        check_lines.append(f"  {status_icon} {component}: {check['status']}\n")
+    sys.stdout.write("".join(check_lines))
     
     if health_check['issues']:
         print("Issues:")
-        for issue in health_check['issues'][:3]:  # Show first 3 issues
-            print(f"  - {issue}")
+        sys.stdout.write("".join(f"  - {issue}\n" for issue in health_check['issues'][:3]))  # Show first 3 issues
     
-    # Get health summary
+    # Get health summary. Not part of the gather above: the summary reports the
+    # status recorded by perform_health_check, so it has to run after that check.
     summary = management_interface.get_health_summary()
     print(f"\nHealth summary: {summary['status']}")
     
@@ -214,7 +270,10 @@ async def main():
     # Start API server in background (for demo)
     try:
         api.start(threaded=True)
-        time.sleep(1)  # Give server time to start
+        try:
+            await asyncio.wait_for(_wait_ready(api), timeout=2.0)
+        except asyncio.TimeoutError:
+            pass
         
         if api.is_server_running():
             print("✓ Management API server started on http://127.0.0.1:8080")
@@ -223,7 +282,7 @@ async def main():
             
             # Keep server running for a moment
             print("\nAPI server running for 5 seconds...")
-            time.sleep(5)
+            await asyncio.sleep(5)
             
             api.stop()
             print("✓ API server stopped")
@@ -236,13 +295,16 @@ async def main():
     print_subsection("9. Configuration File Operations")
     
     # Save configuration to file
-    config_file = "demo_config.json"
-    success, errors = management_interface.save_configuration_to_file(config, config_file)
+    config_file = Path("demo_config.json")
+    success, errors = management_interface.save_configuration_to_file(config, str(config_file))
     print(f"Save configuration to {config_file}: {'✓' if success else '✗'}")
     
     if success:
+        # Make sure the file is removed even if the demo is interrupted from here on
+        atexit.register(config_file.unlink, missing_ok=True)
+        
         # Load configuration from file
-        loaded_config, errors = management_interface.load_configuration_from_file(config_file)
+        loaded_config, errors = management_interface.load_configuration_from_file(str(config_file))
         if loaded_config:
             print("✓ Configuration loaded from file")
             print(f"  Loaded themes: {loaded_config.content_themes}")
@@ -250,11 +312,10 @@ async def main():
             print(f"✗ Failed to load configuration: {errors}")
         
         # Clean up
-        import os
         try:
-            os.remove(config_file)
+            config_file.unlink(missing_ok=True)
             print(f"✓ Cleaned up {config_file}")
-        except:
+        except OSError:
             pass
     
     print_section("Demo Complete")
@@ -270,4 +331,5 @@ async def main():
 
 if __name__ == "__main__":
     # Run the demo
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        runner.run(main())
\ No newline at end of file
@@ -2,7 +2,9 @@
 """
 Example usage of the A/B Testing and Content Optimization Framework
 """
+import asyncio
 import json
+import sys
 from datetime import datetime
 
 from src.config.agent_config import AgentConfig
@@ -12,7 +14,30 @@ from src.services.ab_testing_framework import ContentStrategy, TestVariant
 from src.tools.content_generation_tool import create_content_generation_tool
 
 
-def main():
+# Bounded queue of pending performance records and how many are recorded per batch
+RECORD_QUEUE_SIZE = 1024
+RECORD_BATCH_SIZE = 256
+RECORD_IDLE_SLEEP_SECONDS = 0.005
+
+# Simulated engagement per news item: base + index * step for each metric
+ENGAGEMENT_KEYS = ("likes", "reposts", "replies", "clicks")
+ENGAGEMENT_BASE = (15, 8, 3, 12)
+ENGAGEMENT_STEP = (5, 2, 1, 3)
+
+SAMPLE_NEWS_ROWS = (
+    ("Bitcoin Reaches New All-Time High of $80,000",
+     "Bitcoin has surged to a new record high of $80,000, driven by institutional adoption and ETF approvals.",
+     "CryptoNews", 0.95, ("Bitcoin", "Price", "ATH", "Institutional")),
+    ("Ethereum 2.0 Staking Rewards Increase to 5.2%",
+     "Ethereum staking rewards have increased to 5.2% APY as more validators join the network.",
+     "EthereumDaily", 0.88, ("Ethereum", "Staking", "Rewards", "ETH2")),
+    ("DeFi Protocol Launches Revolutionary Yield Farming",
+     "A new DeFi protocol has launched with innovative yield farming mechanisms offering up to 15% APY.",
+     "DeFiTimes", 0.82, ("DeFi", "Yield Farming", "Innovation")),
+)
+
+
+async def main():
     """Demonstrate A/B testing and content optimization"""
     
     # Create configuration
@@ -38,47 +63,77 @@ def main():
     # Show active tests
     active_tests = optimization_service.ab_framework.get_active_tests()
     print(f"   📊 Active tests: {len(active_tests)}")
-    for test in active_tests:
-        print(f"      - {test['name']}: {test['variants']} variants")
-    
-    # Create sample news items
-    sample_news = [
-        NewsItem(
-            headline="Bitcoin Reaches New All-Time High of $80,000",
-            summary="Bitcoin has surged to a new record high of $80,000, driven by institutional adoption and ETF approvals.",
-            source="CryptoNews",
-            timestamp=datetime.now(),
-            relevance_score=0.95,
-            topics=["Bitcoin", "Price", "ATH", "Institutional"]
-        ),
-        NewsItem(
-            headline="Ethereum 2.0 Staking Rewards Increase to 5.2%",
-            summary="Ethereum staking rewards have increased to 5.2% APY as more validators join the network.",
-            source="EthereumDaily",
-            timestamp=datetime.now(),
-            relevance_score=0.88,
-            topics=["Ethereum", "Staking", "Rewards", "ETH2"]
-        ),
-        NewsItem(
-            headline="DeFi Protocol Launches Revolutionary Yield Farming",
-            summary="A new DeFi protocol has launched with innovative yield farming mechanisms offering up to 15% APY.",
-            source="DeFiTimes",
-            timestamp=datetime.now(),
-            relevance_score=0.82,
-            topics=["DeFi", "Yield Farming", "Innovation"]
-        )
-    ]
+    sys.stdout.write("".join(f"      - {test['name']}: {test['variants']} variants\n" for test in active_tests))
+    
+    # Create sample news items: (headline, summary, source, relevance_score, topics)
+    sample_news = NewsItem.from_rows(SAMPLE_NEWS_ROWS)
     
     print(f"\n2. Generating Optimized Content for {len(sample_news)} News Items...")
     
-    # Generate content using A/B testing
-    generated_contents = []
-    for i, news_item in enumerate(sample_news):
-        print(f"\n   📰 News {i+1}: {news_item.headline[:50]}...")
-        
+    # Generate content using A/B testing. Generation and recording update the service's
+    # A/B tests and optimizer state, which are not thread-safe, so both run on the event
+    # loop thread; only genuinely blocking I/O should be moved to a worker thread.
+    generate = optimization_service.generate_optimized_content
+    record_bulk = optimization_service.record_post_performance_bulk
+    records_q: asyncio.Queue = asyncio.Queue(maxsize=RECORD_QUEUE_SIZE)
+    
+    # Simulated posting time and engagement data, built once for all items
+    posted_at = datetime.now()
+    engagement_table = [
+        dict(zip(ENGAGEMENT_KEYS, (base + i * step for base, step in zip(ENGAGEMENT_BASE, ENGAGEMENT_STEP))))
+        for i in range(len(sample_news))
+    ]
+    
+    async def process(i, news_item):
         # Generate optimized content
-        content = optimization_service.generate_optimized_content(news_item, content_tool)
+        content = generate(news_item, content_tool)
+        
+        # Simulate posting and record performance
+        post_result = PostResult(
+            success=True,
+            post_id=f"post_{i+1}",
+            timestamp=posted_at,
+            content=content
+        )
+        engagement_data = engagement_table[i]
+        
+        # Queue performance for the batch recorder
+        await records_q.put((content, post_result, engagement_data))
+        return content, engagement_data
+    
+    async def consume_records():
+        # Drain whatever is queued without waiting per item, then record it as one batch
+        while True:
+            batch = []
+            try:
+                while len(batch) < RECORD_BATCH_SIZE:
+                    batch.append(records_q.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+            
+            if batch:
+                try:
+                    record_bulk(batch)
+                except Exception as e:
+                    print(f"   ⚠️  Failed to record {len(batch)} performance records: {e}")
+                finally:
+                    for _ in batch:
+                        records_q.task_done()
+            else:
+                await asyncio.sleep(RECORD_IDLE_SLEEP_SECONDS)
+    
+    consumer = asyncio.create_task(consume_records())
+    results = await asyncio.gather(*(process(i, news_item) for i, news_item in enumerate(sample_news)))
+    
+    # Wait for every queued record to be persisted before reporting
+    await records_q.join()
+    consumer.cancel()
+    
+    # Report results in news order once every item has been processed
+    generated_contents = []
+    for i, (news_item, (content, engagement_data)) in enumerate(zip(sample_news, results)):
         generated_contents.append(content)
+        print(f"\n   📰 News {i+1}: {news_item.headline[:50]}...")
         
         # Show which strategy was used
         strategy = content.metadata.get("generation_strategy", "unknown")
@@ -90,25 +145,6 @@ def main():
         print(f"   📝 Content: {content.text}")
         print(f"   📊 Engagement Score: {content.engagement_score:.2f}")
         print(f"   🏷️  Hashtags: {', '.join(content.hashtags)}")
-        
-        # Simulate posting and record performance
-        post_result = PostResult(
-            success=True,
-            post_id=f"post_{i+1}",
-            timestamp=datetime.now(),
-            content=content
-        )
-        
-        # Simulate engagement data
-        engagement_data = {
-            "likes": 15 + (i * 5),
-            "reposts": 8 + (i * 2),
-            "replies": 3 + i,
-            "clicks": 12 + (i * 3)
-        }
-        
-        # Record performance
-        optimization_service.record_post_performance(content, post_result, engagement_data)
         print(f"   📈 Simulated Engagement: {engagement_data}")
     
     print(f"\n3. Running Optimization Cycle...")
@@ -118,8 +154,10 @@ def main():
     print(f"   ✅ Optimization Status: {optimization_result['status']}")
     print(f"   🔧 Actions Taken: {len(optimization_result['actions'])}")
     
-    for action in optimization_result['actions']:
-        print(f"      - {action['rule']}: {action['action']} for {action['strategy']}")
+    sys.stdout.write("".join(
+        f"      - {action['rule']}: {action['action']} for {action['strategy']}\n"
+        for action in optimization_result['actions']
+    ))
     
     print(f"\n4. Performance Analytics...")
     
@@ -132,9 +170,11 @@ def main():
     print(f"   🎯 Avg Engagement: {analytics['avg_engagement_score']:.2f}")
     
     print(f"\n   📈 Strategy Performance:")
-    for strategy, stats in analytics['strategy_performance'].items():
-        if stats['count'] > 0:
-            print(f"      - {strategy}: {stats['avg_score']:.2f} avg ({stats['count']} posts)")
+    sys.stdout.write("".join(
+        f"      - {strategy}: {stats['avg_score']:.2f} avg ({stats['count']} posts)\n"
+        for strategy, stats in analytics['strategy_performance'].items()
+        if stats['count'] > 0
+    ))
     
     print(f"\n5. A/B Test Analysis...")
     
@@ -148,9 +188,11 @@ def main():
         print(f"   ✅ Sufficient Data: {analysis['has_sufficient_data']}")
         
         print(f"\n   🏆 Variant Performance:")
-        for variant_id, variant_data in analysis['variants'].items():
-            print(f"      - {variant_data['name']}: {variant_data['avg_engagement_score']:.2f} avg score")
-            print(f"        ({variant_data['impressions']} impressions, {variant_data['engagement_rate']:.1%} engagement)")
+        sys.stdout.write("".join(
+            f"      - {variant_data['name']}: {variant_data['avg_engagement_score']:.2f} avg score\n"
+            f"        ({variant_data['impressions']} impressions, {variant_data['engagement_rate']:.1%} engagement)\n"
+            for variant_data in analysis['variants'].values()
+        ))
         
         if analysis['has_winner']:
             winner = analysis['winner']
@@ -161,8 +203,7 @@ def main():
         recommendations = optimization_service.ab_framework.get_optimization_recommendations(test_id)
         if recommendations['recommendations']:
             print(f"\n   💡 Recommendations:")
-            for rec in recommendations['recommendations']:
-                print(f"      - {rec['message']}")
+            sys.stdout.write("".join(f"      - {rec['message']}\n" for rec in recommendations['recommendations']))
     
     print(f"\n6. Export Data...")
     
@@ -178,4 +219,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
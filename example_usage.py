@@ -3,6 +3,7 @@
 Example usage of the Bluesky Crypto Agent components
 """
 import os
+import sys
 from datetime import datetime
 from unittest.mock import Mock
 
@@ -112,13 +113,15 @@ def main():
     
     config_dict = config.to_dict()
     print("✅ Configuration exported to dictionary:")
+    export_lines = []
     for key, value in config_dict.items():
         if key in ['perplexity_api_key', 'bluesky_password']:
             continue  # Skip sensitive data
         if isinstance(value, list):
-            print(f"   {key}: [{len(value)} items]")
+            export_lines.append(f"   {key}: [{len(value)} items]\n")
         else:
-            print(f"   {key}: {value}")
+            export_lines.append(f"   {key}: {value}\n")
+    sys.stdout.write("".join(export_lines))
     
     print("\n" + "=" * 50)
     print("🎉 Demo completed successfully!")
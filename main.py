@@ -5,10 +5,12 @@ Runs the agent continuously with scheduled posting
 """
 import os
 import sys
-import time
+import asyncio
 import signal
 import logging
+import random
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -17,7 +19,16 @@ load_dotenv()
 
 from src.config.agent_config import AgentConfig
 from src.agents.bluesky_crypto_agent import BlueskyCryptoAgent
+from src.models.data_models import PostResult
 from src.utils.logging_config import setup_logging
+from src.utils.bloom_filter import BloomFilter
+
+
+# Placeholder LLM; the agent's tools make their own API calls
+_MOCK_LLM = SimpleNamespace(name="MockLLM")
+
+# First retry delay after a transient cycle failure; doubles up to the posting interval
+INITIAL_BACKOFF_SECONDS = 30.0
 
 
 class BlueskyCryptoAgentRunner:
@@ -29,6 +40,14 @@ class BlueskyCryptoAgentRunner:
         self.scheduler = None
         self.running = False
         self.logger = None
+        # Event loop reused by every posting cycle, created in setup()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Scheduled posting task, set while run_scheduled() drives the loop
+        self._main_task: Optional[asyncio.Task] = None
+        self._in_cycle = False
+        self._shutdown_requested = False
+        self._stopped = False
+        self._backoff_seconds = INITIAL_BACKOFF_SECONDS
         
     def setup(self):
         """Initialize the agent and all components"""
@@ -45,7 +64,7 @@ class BlueskyCryptoAgentRunner:
             self.logger = logging.getLogger(__name__)
             
             self.logger.info("Starting Bluesky Crypto Agent...")
-            self.logger.info(f"Configuration: {self.config.to_dict()}")
+            self.logger.info("Configuration: %s", self.config.to_dict())
             
             # Validate configuration
             if not self.config.validate():
@@ -53,93 +72,180 @@ class BlueskyCryptoAgentRunner:
                 return False
             
             # Initialize agent (tools are initialized internally)
-            # Create a mock LLM for now - in production you'd use a real LLM
-            from unittest.mock import Mock
-            mock_llm = Mock()
-            mock_llm.name = "MockLLM"
-            
+            # Use a placeholder LLM for now - in production you'd use a real LLM
             self.agent = BlueskyCryptoAgent(
-                llm=mock_llm,
+                llm=_MOCK_LLM,
                 config=self.config
             )
             
+            # Remember which news has been posted about across restarts
+            self.agent.seen_news = self._load_seen_news()
+            
             # No separate scheduler needed - we'll handle scheduling in the main loop
             
+            # One event loop for the life of the runner instead of one per cycle
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            
             self.logger.info("Agent initialization completed successfully")
             return True
             
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Failed to initialize agent: {e}")
+                self.logger.error("Failed to initialize agent: %s", e)
             else:
                 print(f"ERROR: Failed to initialize agent: {e}")
             return False
     
+    def _load_seen_news(self) -> Optional[BloomFilter]:
+        """Load the persisted seen-news filter, or start a new one"""
+        path = self.config.seen_news_file_path
+        if not path:
+            return None
+        
+        if os.path.exists(path):
+            try:
+                seen_news = BloomFilter.load(path)
+                self.logger.info("Loaded seen-news filter with %d entries from %s", len(seen_news), path)
+                return seen_news
+            except (OSError, ValueError) as e:
+                self.logger.warning("Could not load seen-news filter, starting fresh: %s", e)
+        
+        return BloomFilter(capacity=10000, error_rate=0.001)
+    
+    def _save_seen_news(self):
+        """Persist the seen-news filter"""
+        seen_news = self.agent.seen_news if self.agent else None
+        if seen_news is None:
+            return
+        
+        try:
+            seen_news.save(self.config.seen_news_file_path)
+        except OSError as e:
+            self.logger.warning("Could not save seen-news filter: %s", e)
+    
     def run_single_cycle(self):
         """Run a single posting cycle"""
+        result = self._loop.run_until_complete(self._run_cycle())
+        return result is not None and result.success
+    
+    async def _run_cycle(self) -> Optional[PostResult]:
+        """
+        Run one posting cycle on the runner's event loop
+        
+        Returns:
+            The workflow result, or None if the cycle raised
+        """
+        self._in_cycle = True
         try:
             self.logger.info("Starting posting cycle...")
             
             # Execute the complete workflow using the agent's main method
             # This handles: retrieve news -> generate content -> filter -> post
-            import asyncio
-            
-            # Run the async workflow
-            if hasattr(asyncio, 'run'):
-                # Python 3.7+
-                result = asyncio.run(self.agent.execute_workflow("latest cryptocurrency news"))
-            else:
-                # Python 3.6 compatibility
-                loop = asyncio.get_event_loop()
-                result = loop.run_until_complete(self.agent.execute_workflow("latest cryptocurrency news"))
+            result = await self.agent.execute_workflow("latest cryptocurrency news")
             
             if result.success:
-                self.logger.info(f"Successfully posted: {result.content.text[:50] if result.content else 'N/A'}...")
-                self.logger.info(f"Post ID: {result.post_id}")
-                return True
+                self.logger.info("Successfully posted: %s...", result.content.text[:50] if result.content else 'N/A')
+                self.logger.info("Post ID: %s", result.post_id)
+                self._save_seen_news()
             else:
-                self.logger.warning(f"Posting cycle failed: {result.error_message}")
-                return False
-            
+                self.logger.warning("Posting cycle failed: %s", result.error_message)
+            return result
+        
         except Exception as e:
-            self.logger.error(f"Error in posting cycle: {e}")
-            return False
+            self.logger.error("Error in posting cycle: %s", e)
+            return None
+        finally:
+            self._in_cycle = False
     
-    def run_scheduled(self):
-        """Run the agent with scheduled posting"""
-        self.logger.info(f"Starting scheduled mode - posting every {self.config.posting_interval_minutes} minutes")
-        
-        self.running = True
-        next_post_time = datetime.now()
+    async def _run_forever(self):
+        """Post every interval until shutdown is requested, sleeping on the loop's timer in between"""
+        loop = asyncio.get_running_loop()
+        interval_seconds = self.config.posting_interval_minutes * 60
         
         while self.running:
+            # loop.time() is monotonic, so wall-clock jumps don't skew the schedule
+            cycle_started_at = loop.time()
             try:
-                current_time = datetime.now()
+                self.logger.info("Time for next posting cycle")
+                result = await self._run_cycle()
                 
-                if current_time >= next_post_time:
-                    self.logger.info("Time for next posting cycle")
-                    
-                    # Run posting cycle
-                    success = self.run_single_cycle()
-                    
-                    # Schedule next post
-                    next_post_time = current_time + timedelta(minutes=self.config.posting_interval_minutes)
-                    self.logger.info(f"Next post scheduled for: {next_post_time}")
-                    
-                    if success:
+                if result is None or result.retryable:
+                    # Transient failure: retry before the next interval
+                    delay = self._next_backoff_delay(interval_seconds)
+                    self.logger.warning("Posting cycle failed; retrying in %.0f seconds", delay)
+                else:
+                    # Skipped, filtered or all-seen cycles wait the regular interval like posts do
+                    self._backoff_seconds = INITIAL_BACKOFF_SECONDS
+                    if result.success:
                         self.logger.info("Posting cycle completed successfully")
                     else:
                         self.logger.warning("Posting cycle completed with issues")
+                    delay = max(0.0, cycle_started_at + interval_seconds - loop.time())
                 
-                # Sleep for 1 minute before checking again
-                time.sleep(60)
-                
-            except KeyboardInterrupt:
-                self.logger.info("Received interrupt signal, shutting down...")
-                break
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Next post scheduled for: %s", datetime.now() + timedelta(seconds=delay))
+            
             except Exception as e:
-                self.logger.error(f"Unexpected error in main loop: {e}")
-                time.sleep(60)  # Wait before retrying
+                delay = self._next_backoff_delay(interval_seconds)
+                self.logger.error("Unexpected error in main loop: %s; retrying in %.0f seconds", e, delay)
+            
+            if self.running:
+                await asyncio.sleep(delay)
+    
+    def _next_backoff_delay(self, interval_seconds: float) -> float:
+        """
+        Delay before retrying after a transient cycle failure, doubling the next one
+        
+        Args:
+            interval_seconds: Posting interval, which caps the backoff
+            
+        Returns:
+            Seconds to wait, with jitter so an outage isn't retried in lockstep
+        """
+        # Jitter is applied before the cap so a retry never waits longer than the interval
+        delay = min(self._backoff_seconds * (0.5 + random.random()), interval_seconds)
+        self._backoff_seconds = min(self._backoff_seconds * 2, interval_seconds)
+        return delay
+    
+    def run_scheduled(self):
+        """Run the agent with scheduled posting"""
+        self.logger.info("Starting scheduled mode - posting every %d minutes", self.config.posting_interval_minutes)
+        
+        # A shutdown requested before the loop starts still applies
+        self.running = not self._shutdown_requested
+        if not self.running:
+            return
+        
+        self._main_task = self._loop.create_task(self._run_forever())
+        registered_signals = self._add_loop_signal_handlers()
+        try:
+            self._loop.run_until_complete(self._main_task)
+        except asyncio.CancelledError:
+            self.logger.info("Scheduled posting cancelled")
+        except KeyboardInterrupt:
+            self.logger.info("Received interrupt signal, shutting down...")
+        finally:
+            for signum in registered_signals:
+                self._loop.remove_signal_handler(signum)
+            self._main_task = None
+    
+    def _add_loop_signal_handlers(self):
+        """
+        Route SIGINT/SIGTERM through the event loop while it runs the schedule
+        
+        Returns:
+            Signals that were registered; empty where the loop doesn't support
+            signal handlers, leaving the handlers installed by main() in place
+        """
+        registered_signals = []
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(signum, self.handle_signal, signum, None)
+            except (NotImplementedError, RuntimeError, ValueError):
+                continue
+            registered_signals.append(signum)
+        return registered_signals
     
     def run_once(self):
         """Run the agent once and exit"""
@@ -153,38 +259,60 @@ class BlueskyCryptoAgentRunner:
             self.logger.error("Single cycle failed")
             return 1
     
+    def handle_signal(self, signum, frame):
+        """
+        Request a cooperative shutdown when SIGINT/SIGTERM arrives
+        
+        The current posting cycle is allowed to finish; a second signal cancels it.
+        """
+        if self._shutdown_requested:
+            if self._main_task is None:
+                raise SystemExit(0)
+            self._main_task.cancel()
+            return
+        
+        print(f"\nReceived signal {signum}, shutting down gracefully...")
+        self._shutdown_requested = True
+        self.running = False
+        # Between cycles the task is only sleeping, so cancel it straight away
+        if self._main_task is not None and not self._in_cycle:
+            self._main_task.cancel()
+    
     def stop(self):
-        """Stop the agent"""
+        """Stop the agent and release its resources (safe to call more than once)"""
+        if self._stopped:
+            return
+        self._stopped = True
+        
         self.logger.info("Stopping agent...")
         self.running = False
+        self._shutdown_requested = True
         
         if self.scheduler:
             self.scheduler.stop()
-
-
-def signal_handler(signum, frame):
-    """Handle shutdown signals"""
-    print(f"\nReceived signal {signum}, shutting down gracefully...")
-    global agent_runner
-    if agent_runner:
-        agent_runner.stop()
-    sys.exit(0)
+        
+        self._save_seen_news()
+        
+        if self._loop is not None and not self._loop.is_closed():
+            if not self._loop.is_running():
+                try:
+                    self._loop.run_until_complete(self.agent.aclose())
+                finally:
+                    self._loop.close()
 
 
 def main():
     """Main entry point"""
-    global agent_runner
-    
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Parse command line arguments
     mode = sys.argv[1] if len(sys.argv) > 1 else "scheduled"
     
     # Initialize agent runner
     agent_runner = BlueskyCryptoAgentRunner()
     
+    # Setup signal handlers
+    signal.signal(signal.SIGINT, agent_runner.handle_signal)
+    signal.signal(signal.SIGTERM, agent_runner.handle_signal)
+    
     # Setup agent
     if not agent_runner.setup():
         print("Failed to initialize agent")
@@ -205,13 +333,12 @@ def main():
             
     except Exception as e:
         if agent_runner.logger:
-            agent_runner.logger.error(f"Fatal error: {e}")
+            agent_runner.logger.error("Fatal error: %s", e)
         else:
             print(f"FATAL ERROR: {e}")
         return 1
     finally:
-        if agent_runner:
-            agent_runner.stop()
+        agent_runner.stop()
 
 
 if __name__ == "__main__":
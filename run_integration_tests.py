@@ -3,14 +3,47 @@
 Comprehensive integration test runner for Bluesky Crypto Agent
 This script runs all integration tests and validates the complete system
 """
+import io
 import os
 import sys
+import hashlib
 import subprocess
 import time
 import json
+import threading
+from collections import deque
+import tempfile
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from xml.etree import ElementTree
+
+
+# Files and directories copied into the Docker image; a change to any of them invalidates the build cache
+DOCKER_BUILD_INPUTS = (
+    'Dockerfile', 'requirements.txt', 'main.py', 'example_usage.py', 'docker-entrypoint.sh', 'src'
+)
+DOCKER_BUILD_CACHE_FILE = Path('.docker_build_cache.json')
+
+# Full results, including captured output, are appended here as each step finishes
+RESULTS_FILE = Path('integration_test_results.jsonl')
+
+# Result fields kept in memory for the summary; everything else is only written to RESULTS_FILE
+SUMMARY_FIELDS = ('success', 'duration', 'error', 'cached', 'return_code', 'message', 'timestamp',
+                  'tests', 'failures', 'errors', 'skipped')
+
+# Maximum number of output lines kept from a streamed subprocess
+MAX_SUMMARY_LINES = 200
+
+
+def is_pytest_summary_line(line: str) -> bool:
+    """Return True for pytest output lines worth keeping in the results"""
+    return 'PASSED' in line or 'FAILED' in line or 'ERROR' in line or '===' in line
+
+
+def is_validation_summary_line(line: str) -> bool:
+    """Return True for system validation lines reporting a check outcome"""
+    return '✅' in line or '❌' in line or '⚠️' in line
 
 
 class IntegrationTestRunner:
@@ -18,13 +51,20 @@ class IntegrationTestRunner:
     
     def __init__(self):
         self.start_time = datetime.now()
+        # Durations are measured on the monotonic clock; start_time is only for reporting
+        self._start_monotonic = time.monotonic()
         self.results = {}
+        # Per-test-file results parsed from the batched pytest run
+        self.file_results: Dict[str, Dict[str, Any]] = {}
         
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all integration tests and return results"""
         print("🚀 Starting Comprehensive Integration Tests")
         print("=" * 60)
         
+        # Start a fresh results file for this run
+        RESULTS_FILE.write_text('', encoding='utf-8')
+        
         try:
             # 1. Run unit tests
             self.run_unit_tests()
@@ -45,62 +85,207 @@ class IntegrationTestRunner:
             return self.generate_summary_report()
             
         except Exception as e:
-            self.results['error'] = {
+            self.record_result('error', {
                 'message': str(e),
                 'timestamp': datetime.now().isoformat()
-            }
+            })
             return self.generate_summary_report()
     
+    def record_result(self, name: str, payload: Dict[str, Any]):
+        """
+        Persist a step's full result and keep only its summary in memory
+        
+        Args:
+            name: Result name
+            payload: Result details, possibly including captured output
+        """
+        try:
+            with open(RESULTS_FILE, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'name': name, **payload}, default=str))
+                f.write('\n')
+        except OSError as e:
+            print(f"⚠️  Could not write {RESULTS_FILE}: {str(e)}")
+        
+        self.results[name] = {key: payload[key] for key in SUMMARY_FIELDS if key in payload}
+    
+    def run_streaming(self, command: List[str], timeout: float,
+                      keep_line: Optional[Callable[[str], bool]] = None,
+                      env: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
+        """
+        Run a command, reading its combined output line by line as it is produced
+        
+        Only the most recent matching lines are retained, so memory use stays bounded
+        regardless of how much output the command writes.
+        
+        Args:
+            command: Command and arguments to execute
+            timeout: Seconds to wait before the process is killed
+            keep_line: Predicate selecting lines to retain (all lines when None)
+            env: Environment for the process (inherits the current one when None)
+            
+        Returns:
+            Tuple of (return code, retained output)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
+        """
+        summary_lines = deque(maxlen=MAX_SUMMARY_LINES)
+        
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1, env=env) as process:
+            # Reading blocks until output arrives, so the deadline is enforced by a timer
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+            
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.start()
+            try:
+                for line in process.stdout:
+                    if keep_line is None or keep_line(line):
+                        summary_lines.append(line)
+                return_code = process.wait()
+            finally:
+                timer.cancel()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(command, timeout)
+        
+        return return_code, ''.join(summary_lines)
+    
     def run_unit_tests(self):
-        """Run unit tests"""
+        """Run the whole test suite once and record per-file results"""
         print("\n🧪 Running Unit Tests")
         print("-" * 40)
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        report_fd, report_path = tempfile.mkstemp(prefix="pytest_", suffix=".xml")
+        os.close(report_fd)
         
         try:
-            result = subprocess.run([
+            # A single pytest run covers unit, component and final integration tests;
+            # the later steps read their results from the JUnit XML report
+            return_code, output = self.run_streaming([
                 sys.executable, '-m', 'pytest', 
                 'tests/', 
                 '-v', 
                 '--tb=short',
-                '--maxfail=5',
-                '-x'  # Stop on first failure for faster feedback
-            ], capture_output=True, text=True, timeout=300)
+                '-p', 'no:cacheprovider',
+                f'--junitxml={report_path}',
+                '-o', 'junit_family=xunit2'
+            ], timeout=900, keep_line=is_pytest_summary_line)
             
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
+            self.file_results = self.parse_junit_report(report_path)
             
-            self.results['unit_tests'] = {
-                'success': result.returncode == 0,
+            self.record_result('unit_tests', {
+                'success': return_code == 0,
                 'duration': duration,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode
-            }
+                'stdout': output,
+                'return_code': return_code
+            })
             
-            if result.returncode == 0:
+            if return_code == 0:
                 print(f"✅ Unit tests passed ({duration:.1f}s)")
             else:
                 print(f"❌ Unit tests failed ({duration:.1f}s)")
                 print("First few lines of output:")
-                print(result.stdout[:500] + "..." if len(result.stdout) > 500 else result.stdout)
+                print(output[:500] + "..." if len(output) > 500 else output)
                 
         except subprocess.TimeoutExpired:
-            self.results['unit_tests'] = {
+            self.record_result('unit_tests', {
                 'success': False,
-                'duration': 300,
-                'error': 'Tests timed out after 5 minutes'
-            }
+                'duration': 900,
+                'error': 'Tests timed out after 15 minutes'
+            })
             print("❌ Unit tests timed out")
         except Exception as e:
-            self.results['unit_tests'] = {
+            self.record_result('unit_tests', {
                 'success': False,
                 'error': str(e)
-            }
+            })
             print(f"❌ Unit tests failed with error: {str(e)}")
+        finally:
+            Path(report_path).unlink(missing_ok=True)
+    
+    def parse_junit_report(self, report_path: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate a JUnit XML report into per-test-file results
+        
+        Args:
+            report_path: Path to the XML report written by pytest
+            
+        Returns:
+            Dictionary mapping test file stem to its aggregated results
+        """
+        file_results: Dict[str, Dict[str, Any]] = {}
+        
+        for _, element in ElementTree.iterparse(report_path):
+            if element.tag != 'testcase':
+                continue
+            
+            # classname looks like "tests.test_content_filter.TestContentFilter"
+            module_parts = [part for part in element.get('classname', '').split('.') if part.startswith('test_')]
+            test_name = module_parts[0] if module_parts else 'unknown'
+            
+            file_result = file_results.setdefault(test_name, {
+                'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0, 'duration': 0.0
+            })
+            file_result['tests'] += 1
+            file_result['duration'] += float(element.get('time') or 0.0)
+            
+            for child in element:
+                if child.tag == 'failure':
+                    file_result['failures'] += 1
+                elif child.tag == 'error':
+                    file_result['errors'] += 1
+                elif child.tag == 'skipped':
+                    file_result['skipped'] += 1
+            
+            element.clear()
+        
+        return file_results
+    
+    def record_file_result(self, test_file: str, result_key: Optional[str] = None):
+        """
+        Record the results of one test file from the batched test run
+        
+        Args:
+            test_file: Path of the test file
+            result_key: Key to store the result under (defaults to the file stem)
+        """
+        test_name = Path(test_file).stem
+        result_key = result_key or test_name
+        file_result = self.file_results.get(test_name)
+        
+        if file_result is None:
+            self.record_result(result_key, {
+                'success': False,
+                'error': 'No results found in test run'
+            })
+            print(f"❌ {test_name}: no results found")
+            return
+        
+        success = file_result['failures'] == 0 and file_result['errors'] == 0
+        self.record_result(result_key, {
+            'success': success,
+            'duration': file_result['duration'],
+            'tests': file_result['tests'],
+            'failures': file_result['failures'],
+            'errors': file_result['errors'],
+            'skipped': file_result['skipped']
+        })
+        
+        if success:
+            print(f"✅ {test_name} passed ({file_result['duration']:.1f}s)")
+        else:
+            print(f"❌ {test_name} failed ({file_result['failures']} failures, "
+                  f"{file_result['errors']} errors, {file_result['duration']:.1f}s)")
     
     def run_component_tests(self):
-        """Run component integration tests"""
+        """Report component integration test results"""
         print("\n🔧 Running Component Integration Tests")
         print("-" * 40)
         
@@ -111,207 +296,192 @@ class IntegrationTestRunner:
             'tests/test_content_filter.py'
         ]
         
+        # One directory read instead of a stat per test file
+        present = {entry.name for entry in os.scandir('tests')} if os.path.isdir('tests') else set()
         for test_file in component_tests:
-            if Path(test_file).exists():
-                self.run_single_test_file(test_file)
-    
-    def run_single_test_file(self, test_file: str):
-        """Run a single test file"""
-        test_name = Path(test_file).stem
-        start_time = time.time()
-        
-        try:
-            result = subprocess.run([
-                sys.executable, '-m', 'pytest', 
-                test_file, 
-                '-v', 
-                '--tb=short'
-            ], capture_output=True, text=True, timeout=180)
-            
-            duration = time.time() - start_time
-            
-            self.results[test_name] = {
-                'success': result.returncode == 0,
-                'duration': duration,
-                'return_code': result.returncode
-            }
-            
-            if result.returncode == 0:
-                print(f"✅ {test_name} passed ({duration:.1f}s)")
-            else:
-                print(f"❌ {test_name} failed ({duration:.1f}s)")
-                
-        except subprocess.TimeoutExpired:
-            self.results[test_name] = {
-                'success': False,
-                'duration': 180,
-                'error': 'Test timed out'
-            }
-            print(f"❌ {test_name} timed out")
-        except Exception as e:
-            self.results[test_name] = {
-                'success': False,
-                'error': str(e)
-            }
-            print(f"❌ {test_name} failed: {str(e)}")
+            if os.path.basename(test_file) in present:
+                self.record_file_result(test_file)
     
     def run_final_integration_tests(self):
-        """Run final integration tests"""
+        """Report final integration test results"""
         print("\n🎯 Running Final Integration Tests")
         print("-" * 40)
         
-        start_time = time.time()
-        
-        try:
-            result = subprocess.run([
-                sys.executable, '-m', 'pytest', 
-                'tests/test_final_integration.py', 
-                '-v', 
-                '--tb=short'
-            ], capture_output=True, text=True, timeout=600)
-            
-            duration = time.time() - start_time
-            
-            self.results['final_integration'] = {
-                'success': result.returncode == 0,
-                'duration': duration,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode
-            }
-            
-            if result.returncode == 0:
-                print(f"✅ Final integration tests passed ({duration:.1f}s)")
-            else:
-                print(f"❌ Final integration tests failed ({duration:.1f}s)")
-                # Show test summary
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'FAILED' in line or 'PASSED' in line:
-                        print(f"  {line}")
-                        
-        except subprocess.TimeoutExpired:
-            self.results['final_integration'] = {
-                'success': False,
-                'duration': 600,
-                'error': 'Tests timed out after 10 minutes'
-            }
-            print("❌ Final integration tests timed out")
-        except Exception as e:
-            self.results['final_integration'] = {
-                'success': False,
-                'error': str(e)
-            }
-            print(f"❌ Final integration tests failed: {str(e)}")
+        self.record_file_result('tests/test_final_integration.py', 'final_integration')
     
     def run_system_validation(self):
         """Run system validation"""
         print("\n🔍 Running System Validation")
         print("-" * 40)
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        shared_results_path = None
+        env = None
         
         try:
-            result = subprocess.run([
+            # Let validate_system.py reuse this run's test results instead of re-running pytest
+            if self.file_results:
+                shared_fd, shared_results_path = tempfile.mkstemp(prefix="test_results_", suffix=".json")
+                with os.fdopen(shared_fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.file_results, f)
+                env = {**os.environ, 'INTEGRATION_TEST_FILE_RESULTS': shared_results_path}
+            
+            return_code, output = self.run_streaming([
                 sys.executable, 'validate_system.py'
-            ], capture_output=True, text=True, timeout=300)
+            ], timeout=300, keep_line=is_validation_summary_line, env=env)
             
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             
-            self.results['system_validation'] = {
-                'success': result.returncode == 0,
+            self.record_result('system_validation', {
+                'success': return_code == 0,
                 'duration': duration,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'return_code': result.returncode
-            }
+                'stdout': output,
+                'return_code': return_code
+            })
             
-            if result.returncode == 0:
+            if return_code == 0:
                 print(f"✅ System validation passed ({duration:.1f}s)")
             else:
                 print(f"⚠️  System validation had issues ({duration:.1f}s)")
                 # Show key validation results
-                lines = result.stdout.split('\n')
-                for line in lines:
+                for line in output.splitlines():
                     if '✅' in line or '❌' in line:
                         print(f"  {line}")
                         
         except subprocess.TimeoutExpired:
-            self.results['system_validation'] = {
+            self.record_result('system_validation', {
                 'success': False,
                 'duration': 300,
                 'error': 'System validation timed out'
-            }
+            })
             print("❌ System validation timed out")
         except Exception as e:
-            self.results['system_validation'] = {
+            self.record_result('system_validation', {
                 'success': False,
                 'error': str(e)
-            }
+            })
             print(f"❌ System validation failed: {str(e)}")
+        finally:
+            if shared_results_path:
+                Path(shared_results_path).unlink(missing_ok=True)
     
     def test_docker_build(self):
         """Test Docker build if Docker is available"""
         print("\n🐳 Testing Docker Build")
         print("-" * 40)
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        build_hash = self.compute_docker_build_hash()
+        
+        if self.load_docker_build_hash() == build_hash:
+            self.record_result('docker_build', {
+                'success': True,
+                'cached': True,
+                'duration': 0.0
+            })
+            print("✅ Docker build inputs unchanged since last successful build, skipping")
+            return
         
         try:
             # Check if Docker is available
-            docker_check = subprocess.run(['docker', '--version'], 
-                                        capture_output=True, text=True, timeout=10)
+            docker_check = subprocess.run(['docker', '--version'], stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True, timeout=10)
             
             if docker_check.returncode != 0:
-                self.results['docker_build'] = {
+                self.record_result('docker_build', {
                     'success': False,
                     'error': 'Docker not available'
-                }
+                })
                 print("⚠️  Docker not available, skipping build test")
                 return
             
             # Test Docker build
-            result = subprocess.run([
+            return_code, output = self.run_streaming([
                 'docker', 'build', '-t', 'bluesky-crypto-agent-test', '.'
-            ], capture_output=True, text=True, timeout=300)
+            ], timeout=300, env={**os.environ, 'DOCKER_BUILDKIT': '1'})
             
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             
-            self.results['docker_build'] = {
-                'success': result.returncode == 0,
+            self.record_result('docker_build', {
+                'success': return_code == 0,
                 'duration': duration,
-                'return_code': result.returncode
-            }
+                'return_code': return_code
+            })
             
-            if result.returncode == 0:
+            if return_code == 0:
                 print(f"✅ Docker build successful ({duration:.1f}s)")
+                self.save_docker_build_hash(build_hash)
                 
                 # Clean up test image
                 subprocess.run(['docker', 'rmi', 'bluesky-crypto-agent-test'], 
-                             capture_output=True)
+                             stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
             else:
                 print(f"❌ Docker build failed ({duration:.1f}s)")
                 print("Build error:")
-                print(result.stderr[:500] + "..." if len(result.stderr) > 500 else result.stderr)
+                # The tail of the build output holds the failing step
+                print("..." + output[-500:] if len(output) > 500 else output)
                 
         except subprocess.TimeoutExpired:
-            self.results['docker_build'] = {
+            self.record_result('docker_build', {
                 'success': False,
                 'duration': 300,
                 'error': 'Docker build timed out'
-            }
+            })
             print("❌ Docker build timed out")
         except Exception as e:
-            self.results['docker_build'] = {
+            self.record_result('docker_build', {
                 'success': False,
                 'error': str(e)
-            }
+            })
             print(f"❌ Docker build test failed: {str(e)}")
     
+    def compute_docker_build_hash(self) -> str:
+        """
+        Fingerprint the Docker build inputs from their paths, modification times and sizes
+        
+        Returns:
+            Hex digest identifying the current state of the build inputs
+        """
+        entries = []
+        for input_name in DOCKER_BUILD_INPUTS:
+            input_path = Path(input_name)
+            if input_path.is_dir():
+                paths = (path for path in input_path.rglob('*') if path.is_file() and '__pycache__' not in path.parts)
+            elif input_path.exists():
+                paths = (input_path,)
+            else:
+                continue
+            
+            for path in paths:
+                stat = path.stat()
+                entries.append((path.as_posix(), stat.st_mtime_ns, stat.st_size))
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for path, mtime_ns, size in sorted(entries):
+            digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode())
+        return digest.hexdigest()
+    
+    def load_docker_build_hash(self) -> Optional[str]:
+        """Return the build input hash of the last successful Docker build, if recorded"""
+        try:
+            return json.loads(DOCKER_BUILD_CACHE_FILE.read_text()).get('hash')
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def save_docker_build_hash(self, build_hash: str):
+        """Record the build input hash of a successful Docker build"""
+        try:
+            DOCKER_BUILD_CACHE_FILE.write_text(json.dumps({
+                'hash': build_hash,
+                'timestamp': datetime.now().isoformat()
+            }))
+        except OSError as e:
+            print(f"⚠️  Could not write Docker build cache: {str(e)}")
+    
     def generate_summary_report(self) -> Dict[str, Any]:
         """Generate summary report"""
         end_time = datetime.now()
-        total_duration = (end_time - self.start_time).total_seconds()
+        total_duration = time.monotonic() - self._start_monotonic
         
         # Calculate overall success
         successful_tests = sum(1 for result in self.results.values() 
@@ -361,72 +531,76 @@ class IntegrationTestRunner:
         report_file = Path("INTEGRATION_TESTING_SUMMARY.md")
         self.save_markdown_report(summary, report_file)
         print(f"\n📄 Detailed report saved to: {report_file}")
+        print(f"📄 Full step results written to: {RESULTS_FILE}")
         
         return summary
     
     def save_markdown_report(self, summary: Dict[str, Any], report_file: Path):
         """Save detailed report in markdown format"""
-        with open(report_file, 'w') as f:
-            f.write("# Integration Testing Summary\n\n")
-            f.write(f"**Generated:** {summary['end_time']}\n")
-            f.write(f"**Duration:** {summary['total_duration']:.1f} seconds\n")
-            f.write(f"**Success Rate:** {summary['success_rate']:.1%}\n\n")
-            
-            f.write("## Overall Status\n\n")
-            status = "✅ PASSED" if summary['overall_success'] else "❌ FAILED"
-            f.write(f"**Status:** {status}\n\n")
-            
-            f.write("## Test Results\n\n")
-            for test_name, result in summary['detailed_results'].items():
-                if isinstance(result, dict):
-                    status = "✅ PASS" if result.get('success', False) else "❌ FAIL"
-                    duration = result.get('duration', 0)
-                    f.write(f"- **{test_name}:** {status} ({duration:.1f}s)\n")
-                    
-                    if 'error' in result:
-                        f.write(f"  - Error: {result['error']}\n")
-            
-            f.write("\n## System Validation\n\n")
-            if 'system_validation' in summary['detailed_results']:
-                validation_result = summary['detailed_results']['system_validation']
-                if validation_result.get('success'):
-                    f.write("✅ All system components validated successfully\n")
-                else:
-                    f.write("⚠️ System validation found issues (see validation_report.json)\n")
-            
-            f.write("\n## Docker Build\n\n")
-            if 'docker_build' in summary['detailed_results']:
-                docker_result = summary['detailed_results']['docker_build']
-                if docker_result.get('success'):
-                    f.write("✅ Docker build successful\n")
-                elif 'error' in docker_result and 'not available' in docker_result['error']:
-                    f.write("⚠️ Docker not available for testing\n")
-                else:
-                    f.write("❌ Docker build failed\n")
-            
-            f.write("\n## Requirements Validation\n\n")
-            f.write("All system requirements have been validated:\n\n")
-            f.write("1. ✅ **News Retrieval** - Perplexity API integration with retry logic\n")
-            f.write("2. ✅ **Content Generation** - AI-powered content creation with filtering\n")
-            f.write("3. ✅ **Bluesky Posting** - AT Protocol integration with authentication\n")
-            f.write("4. ✅ **Scheduling** - Automated execution every 30 minutes\n")
-            f.write("5. ✅ **Docker Deployment** - Containerized deployment with persistence\n")
-            f.write("6. ✅ **Configuration & Monitoring** - Environment-based config with logging\n")
-            
-            f.write("\n## Next Steps\n\n")
-            if summary['overall_success']:
-                f.write("🚀 **System Ready for Production**\n\n")
-                f.write("1. Set up production environment variables\n")
-                f.write("2. Deploy using Docker Compose\n")
-                f.write("3. Monitor logs and metrics\n")
-                f.write("4. Set up alerting for failures\n")
+        # Build the report in memory so the file is written in a single call
+        report = io.StringIO()
+        report.write("# Integration Testing Summary\n\n")
+        report.write(f"**Generated:** {summary['end_time']}\n")
+        report.write(f"**Duration:** {summary['total_duration']:.1f} seconds\n")
+        report.write(f"**Success Rate:** {summary['success_rate']:.1%}\n\n")
+        
+        report.write("## Overall Status\n\n")
+        status = "✅ PASSED" if summary['overall_success'] else "❌ FAILED"
+        report.write(f"**Status:** {status}\n\n")
+        
+        report.write("## Test Results\n\n")
+        for test_name, result in summary['detailed_results'].items():
+            if isinstance(result, dict):
+                status = "✅ PASS" if result.get('success', False) else "❌ FAIL"
+                duration = result.get('duration', 0)
+                report.write(f"- **{test_name}:** {status} ({duration:.1f}s)\n")
+                
+                if 'error' in result:
+                    report.write(f"  - Error: {result['error']}\n")
+        
+        report.write("\n## System Validation\n\n")
+        if 'system_validation' in summary['detailed_results']:
+            validation_result = summary['detailed_results']['system_validation']
+            if validation_result.get('success'):
+                report.write("✅ All system components validated successfully\n")
             else:
-                f.write("🔧 **Issues to Address**\n\n")
-                f.write("1. Review failed test details\n")
-                f.write("2. Fix any configuration issues\n")
-                f.write("3. Ensure all dependencies are installed\n")
-                f.write("4. Re-run tests after fixes\n")
-
+                report.write("⚠️ System validation found issues (see validation_report.json)\n")
+        
+        report.write("\n## Docker Build\n\n")
+        if 'docker_build' in summary['detailed_results']:
+            docker_result = summary['detailed_results']['docker_build']
+            if docker_result.get('success'):
+                report.write("✅ Docker build successful\n")
+            elif 'error' in docker_result and 'not available' in docker_result['error']:
+                report.write("⚠️ Docker not available for testing\n")
+            else:
+                report.write("❌ Docker build failed\n")
+        
+        report.write("\n## Requirements Validation\n\n")
+        report.write("All system requirements have been validated:\n\n")
+        report.write("1. ✅ **News Retrieval** - Perplexity API integration with retry logic\n")
+        report.write("2. ✅ **Content Generation** - AI-powered content creation with filtering\n")
+        report.write("3. ✅ **Bluesky Posting** - AT Protocol integration with authentication\n")
+        report.write("4. ✅ **Scheduling** - Automated execution every 30 minutes\n")
+        report.write("5. ✅ **Docker Deployment** - Containerized deployment with persistence\n")
+        report.write("6. ✅ **Configuration & Monitoring** - Environment-based config with logging\n")
+        
+        report.write("\n## Next Steps\n\n")
+        if summary['overall_success']:
+            report.write("🚀 **System Ready for Production**\n\n")
+            report.write("1. Set up production environment variables\n")
+            report.write("2. Deploy using Docker Compose\n")
+            report.write("3. Monitor logs and metrics\n")
+            report.write("4. Set up alerting for failures\n")
+        else:
+            report.write("🔧 **Issues to Address**\n\n")
+            report.write("1. Review failed test details\n")
+            report.write("2. Fix any configuration issues\n")
+            report.write("3. Ensure all dependencies are installed\n")
+            report.write("4. Re-run tests after fixes\n")
+        
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(report.getvalue())
 
 def main():
     """Main entry point"""
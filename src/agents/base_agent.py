@@ -5,12 +5,18 @@ from langchain.memory import ConversationBufferMemory
 class BaseAgent:
     def __init__(self, llm):
         self.llm = llm
-        self.memory = ConversationBufferMemory(memory_key="chat_history")
+        self.tools = []
+        self._memory = None
+    
+    @property
+    def memory(self):
+        """Conversation memory, created on first use"""
+        if self._memory is None:
+            self._memory = ConversationBufferMemory(memory_key="chat_history")
+        return self._memory
         
     def add_tool(self, tool):
         """Add a tool to the agent's toolkit"""
-        if not hasattr(self, 'tools'):
-            self.tools = []
         self.tools.append(tool)
     
     def initialize(self):
@@ -19,4 +25,4 @@ class BaseAgent:
     
     async def run(self, input_text):
         """Run the agent with given input"""
-        pass
\ No newline at end of file
+        pass
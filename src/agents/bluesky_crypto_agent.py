@@ -2,20 +2,23 @@
 """
 Bluesky Crypto Agent - Main agent class for automated crypto content creation and posting
 """
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import asyncio
+import hashlib
 import logging
-import json
-import traceback
 import time
 
 from .base_agent import BaseAgent
-from ..utils.logging_config import log_performance
-from ..utils.metrics_collector import get_metrics_collector, timer
+from ..utils.logging_config import log_performance, ContextLoggerAdapter
+from ..utils.metrics_collector import get_metrics_collector, timer, MetricsBatch, MetricCounter
 from ..utils.alert_system import get_alert_manager, AlertSeverity
 from ..utils.error_handler import get_error_handler, handle_errors, ErrorContext
-from ..utils.circuit_breaker import get_circuit_breaker_manager, CircuitBreakerError
+from ..utils.circuit_breaker import get_circuit_breaker_manager, CircuitBreakerError, CircuitState
+from ..utils.bloom_filter import BloomFilter
+from ..utils.serialization import dumps_bytes, loads
 from ..models.data_models import NewsItem, GeneratedContent, PostResult, ContentType
 from ..config.agent_config import AgentConfig
 from ..services.content_filter import ContentFilter
@@ -25,6 +28,69 @@ from ..tools.bluesky_social_tool import BlueskySocialTool
 
 logger = logging.getLogger(__name__)
 
+# Generated content is reused for an identical news batch for up to an hour
+CONTENT_CACHE_TTL_SECONDS = 3600.0
+CONTENT_CACHE_MAX_ENTRIES = 256
+
+# Fallback post templates in order of preference, with how much of the headline each includes
+_FALLBACK_TEMPLATES = (
+    ("🚀 {}... What are your thoughts on this crypto development?", 100),
+    ("📈 Latest in crypto: {}... #crypto #blockchain", 120),
+    ("💡 Crypto insight: {}... Stay informed! #cryptocurrency", 110),
+    ("🔥 Breaking: {}... #bitcoin #ethereum #crypto", 130),
+)
+_FALLBACK_DEFAULT_TEXT = "🚀 Crypto update: Stay informed about the latest developments! #crypto"
+# Characters dropped when turning a topic into a hashtag
+_HASHTAG_STRIP = str.maketrans('', '', ' -')
+
+# Fields generated content must carry, in the order missing ones are reported
+_CONTENT_RESULT_FIELDS = ('success', 'content')
+_CONTENT_FIELDS = ('text', 'hashtags', 'engagement_score', 'content_type', 'source_news')
+_CONTENT_RESULT_FIELD_SET = frozenset(_CONTENT_RESULT_FIELDS)
+_CONTENT_FIELD_SET = frozenset(_CONTENT_FIELDS)
+
+# Log context for workflow steps, built once instead of per log call
+_NEWS_RETRIEVAL_STEP = {"step": "news_retrieval"}
+_CONTENT_GENERATION_STEP = {"step": "content_generation"}
+_CONTENT_FILTERING_STEP = {"step": "content_filtering"}
+_BLUESKY_POSTING_STEP = {"step": "bluesky_posting"}
+_MANUAL_OVERRIDE_STEP = {"step": "manual_override"}
+
+# Counters incremented on every workflow run, bound once at import
+_WORKFLOW_STARTED = MetricCounter("workflow_started", "bluesky_crypto_agent")
+_NEWS_RETRIEVAL_FAILURES = MetricCounter("news_retrieval_failures", "bluesky_crypto_agent")
+_NEWS_ALL_SEEN = MetricCounter("news_all_seen", "bluesky_crypto_agent")
+_NEWS_RETRIEVAL_SUCCESS = MetricCounter("news_retrieval_success", "bluesky_crypto_agent")
+_CONTENT_GENERATION_FAILURES = MetricCounter("content_generation_failures", "bluesky_crypto_agent")
+_CONTENT_GENERATION_SUCCESS = MetricCounter("content_generation_success", "bluesky_crypto_agent")
+_CONTENT_PARSING_FAILURES = MetricCounter("content_parsing_failures", "bluesky_crypto_agent")
+_CONTENT_FILTERED = MetricCounter("content_filtered", "bluesky_crypto_agent")
+_CONTENT_APPROVED = MetricCounter("content_approved", "bluesky_crypto_agent")
+_WORKFLOW_SUCCESS = MetricCounter("workflow_success", "bluesky_crypto_agent")
+_POSTS_PUBLISHED = MetricCounter("posts_published", "bluesky_crypto_agent")
+_POSTING_FAILURES = MetricCounter("posting_failures", "bluesky_crypto_agent")
+_WORKFLOW_EXCEPTIONS = MetricCounter("workflow_exceptions", "bluesky_crypto_agent")
+_CONTENT_CACHE_HITS = MetricCounter("content_cache_hits", "bluesky_crypto_agent")
+_CONTENT_CACHE_MISSES = MetricCounter("content_cache_misses", "bluesky_crypto_agent")
+
+def _error_placeholder_content(timestamp: datetime) -> GeneratedContent:
+    """Build the content that stands in for an error result without generated content"""
+    return GeneratedContent(
+        text="Workflow execution failed",
+        hashtags=[],
+        engagement_score=0.0,
+        content_type=ContentType.NEWS,
+        source_news=NewsItem(
+            headline="Error in workflow",
+            summary="Workflow execution failed",
+            source="System",
+            timestamp=timestamp,
+            relevance_score=0.0,
+            topics=["Error"]
+        ),
+        created_at=timestamp
+    )
+
 
 class BlueskyCryptoAgent(BaseAgent):
     """
@@ -44,7 +110,27 @@ class BlueskyCryptoAgent(BaseAgent):
         super().__init__(llm)
         self.config = config
         self.management_interface = management_interface
-        self.content_history: List[GeneratedContent] = []
+        # Manual override expiry times pushed by the management interface: override type -> expires_at.
+        # None when the interface can't push changes, in which case overrides are checked on it directly.
+        self._override_expiry: Optional[Dict[str, datetime]] = None
+        if callable(getattr(type(management_interface), 'subscribe_overrides', None)):
+            self._override_expiry = {}
+            management_interface.subscribe_overrides(self._on_override_change)
+        # Workflow logs carry the component name on every record
+        self._log = ContextLoggerAdapter(logger, {"component": "bluesky_crypto_agent"})
+        # Recent content, oldest first; the deque drops the oldest item once full (default 50 items)
+        self.content_history: Deque[GeneratedContent] = deque(maxlen=getattr(config, 'max_history_size', 50))
+        # Successful news retrievals by query: query -> (monotonic fetch time, news data)
+        self._news_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Generated content by news batch key, least recently used first: key -> (monotonic time, content data)
+        self._content_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # News already posted about; when set, those items are skipped before content generation
+        self.seen_news: Optional[BloomFilter] = None
+        # Cap LLM and posting calls in flight when workflows run concurrently on this agent
+        self._llm_semaphore = asyncio.Semaphore(getattr(config, 'max_concurrent_llm_calls', 4))
+        self._post_semaphore = asyncio.Semaphore(getattr(config, 'max_concurrent_posts', 2))
+        # Background Bluesky login shared by workflows until it finishes
+        self._login_task: Optional[asyncio.Task] = None
         self.content_filter = ContentFilter(
             duplicate_threshold=config.duplicate_threshold,
             quality_threshold=config.min_engagement_score
@@ -53,6 +139,16 @@ class BlueskyCryptoAgent(BaseAgent):
         # Initialize tools
         self._initialize_tools()
         
+        # Bind shared monitoring and resilience components once instead of per workflow
+        self._metrics = get_metrics_collector()
+        self._alerts = get_alert_manager()
+        self._error_handler = get_error_handler()
+        circuit_breaker_manager = get_circuit_breaker_manager()
+        self._news_circuit = circuit_breaker_manager.get_circuit_breaker("perplexity_api")
+        self._post_circuit = circuit_breaker_manager.get_circuit_breaker("bluesky_post")
+        self._max_post_length = config.max_post_length
+        self._min_engagement_score = config.min_engagement_score
+        
         # Workflow statistics
         self.workflow_stats = {
             'total_executions': 0,
@@ -63,7 +159,7 @@ class BlueskyCryptoAgent(BaseAgent):
             'last_success': None
         }
         
-        logger.info(f"BlueskyCryptoAgent initialized with {len(self.tools)} tools")
+        logger.info("BlueskyCryptoAgent initialized with %d tools", len(self.tools))
     
     def _initialize_tools(self):
         """Initialize all required tools for the agent"""
@@ -83,7 +179,7 @@ class BlueskyCryptoAgent(BaseAgent):
             logger.info("All tools initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize tools: {str(e)}")
+            logger.error("Failed to initialize tools: %s", e)
             raise
     
     @log_performance(component="bluesky_crypto_agent")
@@ -97,45 +193,51 @@ class BlueskyCryptoAgent(BaseAgent):
         Returns:
             PostResult object containing execution results
         """
+        # Wall-clock start for stats and results; durations use the monotonic clock
         workflow_start = datetime.now()
-        metrics_collector = get_metrics_collector()
-        alert_manager = get_alert_manager()
+        started_at = time.monotonic()
+        # Stage this workflow's metrics and apply them in one pass when it finishes
+        metrics_collector = MetricsBatch()
+        alert_manager = self._alerts
         
         # Initialize workflow tracking
         self.workflow_stats['total_executions'] += 1
         self.workflow_stats['last_execution'] = workflow_start
         
         # Log workflow start event
-        logger.info(f"Starting Bluesky crypto agent workflow with query: '{query}'", extra={
-            "workflow_id": f"workflow_{int(time.time())}",
-            "query": query,
-            "execution_count": self.workflow_stats['total_executions']
-        })
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info("Starting Bluesky crypto agent workflow with query: '%s'", query, extra={
+                "workflow_id": f"workflow_{int(workflow_start.timestamp())}",
+                "query": query,
+                "execution_count": self.workflow_stats['total_executions']
+            })
         
         # Record workflow start metrics
-        metrics_collector.increment_counter("workflow_started", "bluesky_crypto_agent")
-        metrics_collector.set_gauge("active_workflows", 1, "bluesky_crypto_agent")
+        metrics_collector.increment(_WORKFLOW_STARTED)
+        # Published immediately so the gauge is visible while the workflow runs
+        self._metrics.set_gauge("active_workflows", 1, "bluesky_crypto_agent")
         
         try:
             # Check for manual overrides before starting workflow
-            if self.management_interface:
-                skip_posting, _ = self.management_interface.is_override_active('skip_posting')
-                if skip_posting:
-                    logger.info("Workflow skipped due to manual override", extra={"step": "manual_override"})
-                    return self._create_error_result("Workflow skipped by manual override", workflow_start)
+            if self._is_override_active('skip_posting'):
+                self._log.info("Workflow skipped due to manual override", extra=_MANUAL_OVERRIDE_STEP)
+                return self._create_error_result("Workflow skipped by manual override")
+            
+            # Log in to Bluesky while news is retrieved and content generated; posting waits for it
+            login_task = self._start_login()
             
             # Step 1: Retrieve cryptocurrency news
-            logger.info("Step 1: Retrieving cryptocurrency news", extra={"step": "news_retrieval"})
+            self._log.info("Step 1: Retrieving cryptocurrency news", extra=_NEWS_RETRIEVAL_STEP)
             
             with metrics_collector.timer("news_retrieval", "bluesky_crypto_agent"):
-                news_data = await self._retrieve_news(query)
+                news_data = await self._get_news(query)
             
             if not news_data or not news_data.get('success', False):
                 error_msg = "Failed to retrieve news data"
-                logger.error(error_msg, extra={"step": "news_retrieval", "error_type": "retrieval_failure"})
+                self._log.error(error_msg, extra={"step": "news_retrieval", "error_type": "retrieval_failure"})
                 
                 # Record failure metrics and trigger alert
-                metrics_collector.increment_counter("news_retrieval_failures", "bluesky_crypto_agent")
+                metrics_collector.increment(_NEWS_RETRIEVAL_FAILURES)
                 alert_manager.trigger_alert(
                     title="News Retrieval Failed",
                     message=error_msg,
@@ -144,24 +246,33 @@ class BlueskyCryptoAgent(BaseAgent):
                     metadata={"query": query, "step": "news_retrieval"}
                 )
                 
-                return self._create_error_result(error_msg, workflow_start)
+                return self._create_error_result(error_msg, retryable=True)
+            
+            # Drop news that earlier cycles already posted about
+            if self.seen_news is not None:
+                news_data = self._drop_seen_news(news_data)
+                if not news_data['news_items']:
+                    error_msg = "No unseen news items to post about"
+                    self._log.info(error_msg, extra=_NEWS_RETRIEVAL_STEP)
+                    metrics_collector.increment(_NEWS_ALL_SEEN)
+                    return self._create_error_result(error_msg)
             
             # Record successful news retrieval
-            metrics_collector.increment_counter("news_retrieval_success", "bluesky_crypto_agent")
+            metrics_collector.increment(_NEWS_RETRIEVAL_SUCCESS)
             metrics_collector.record_metric("news_items_retrieved", news_data.get('count', 0), "count", "bluesky_crypto_agent")
             
             # Step 2: Generate content from news
-            logger.info("Step 2: Generating viral content", extra={"step": "content_generation"})
+            self._log.info("Step 2: Generating viral content", extra=_CONTENT_GENERATION_STEP)
             
             with metrics_collector.timer("content_generation", "bluesky_crypto_agent"):
-                content_data = await self._generate_content(news_data)
+                content_data = await self._get_content(news_data)
             
             if not content_data or not content_data.get('success', False):
                 error_msg = "Failed to generate content"
-                logger.error(error_msg, extra={"step": "content_generation", "error_type": "generation_failure"})
+                self._log.error(error_msg, extra={"step": "content_generation", "error_type": "generation_failure"})
                 
                 # Record failure metrics and trigger alert
-                metrics_collector.increment_counter("content_generation_failures", "bluesky_crypto_agent")
+                metrics_collector.increment(_CONTENT_GENERATION_FAILURES)
                 alert_manager.trigger_alert(
                     title="Content Generation Failed",
                     message=error_msg,
@@ -170,35 +281,32 @@ class BlueskyCryptoAgent(BaseAgent):
                     metadata={"step": "content_generation"}
                 )
                 
-                return self._create_error_result(error_msg, workflow_start)
+                return self._create_error_result(error_msg, retryable=True)
             
             # Record successful content generation
-            metrics_collector.increment_counter("content_generation_success", "bluesky_crypto_agent")
+            metrics_collector.increment(_CONTENT_GENERATION_SUCCESS)
             
             # Step 3: Filter and validate content
-            logger.info("Step 3: Filtering and validating content", extra={"step": "content_filtering"})
+            self._log.info("Step 3: Filtering and validating content", extra=_CONTENT_FILTERING_STEP)
             
-            with metrics_collector.timer("content_parsing", "bluesky_crypto_agent"):
+            # Parsing and filtering are timed as one step; filtering only runs on parsed content
+            with metrics_collector.timer("content_filtering", "bluesky_crypto_agent"):
                 generated_content = self._parse_generated_content(content_data['content'])
+                if generated_content:
+                    is_approved, filter_details = self.content_filter.filter_content(generated_content)
             
             if not generated_content:
                 error_msg = "Failed to parse generated content"
-                logger.error(error_msg, extra={"step": "content_filtering", "error_type": "parsing_failure"})
+                self._log.error(error_msg, extra={"step": "content_filtering", "error_type": "parsing_failure"})
                 
-                metrics_collector.increment_counter("content_parsing_failures", "bluesky_crypto_agent")
-                return self._create_error_result(error_msg, workflow_start)
-            
-            # Apply content filtering
-            with metrics_collector.timer("content_filtering", "bluesky_crypto_agent"):
-                is_approved, filter_details = self.content_filter.filter_content(generated_content)
+                metrics_collector.increment(_CONTENT_PARSING_FAILURES)
+                self._discard_cached_content(news_data)
+                return self._create_error_result(error_msg)
             
             # Check for manual content approval override
-            force_approval = False
-            if self.management_interface:
-                force_approval, _ = self.management_interface.is_override_active('force_content_approval')
-                if force_approval:
-                    logger.info("Content approval forced by manual override", extra={"step": "manual_override"})
-                    is_approved = True
+            if self._is_override_active('force_content_approval'):
+                self._log.info("Content approval forced by manual override", extra=_MANUAL_OVERRIDE_STEP)
+                is_approved = True
             
             # Record content quality metrics
             metrics_collector.record_metric("content_engagement_score", generated_content.engagement_score, "score", "bluesky_crypto_agent")
@@ -206,53 +314,65 @@ class BlueskyCryptoAgent(BaseAgent):
             if not is_approved:
                 self.workflow_stats['filtered_content'] += 1
                 error_msg = f"Content filtered out: {filter_details.get('reasons', ['Unknown reason'])}"
-                logger.warning(error_msg, extra={
+                self._log.warning(error_msg, extra={
                     "step": "content_filtering", 
                     "filter_reasons": filter_details.get('reasons', []),
                     "engagement_score": generated_content.engagement_score
                 })
                 
                 # Record filtering metrics
-                metrics_collector.increment_counter("content_filtered", "bluesky_crypto_agent")
+                metrics_collector.increment(_CONTENT_FILTERED)
                 metrics_collector.record_metric("filtered_content_engagement_score", generated_content.engagement_score, "score", "bluesky_crypto_agent")
                 
-                return self._create_error_result(error_msg, workflow_start, generated_content)
+                # Regenerate next time instead of resubmitting rejected content
+                self._discard_cached_content(news_data)
+                return self._create_error_result(error_msg, generated_content)
             
             # Record successful content filtering
-            metrics_collector.increment_counter("content_approved", "bluesky_crypto_agent")
+            metrics_collector.increment(_CONTENT_APPROVED)
             
             # Step 4: Post to Bluesky
-            logger.info("Step 4: Posting to Bluesky", extra={"step": "bluesky_posting"})
+            self._log.info("Step 4: Posting to Bluesky", extra=_BLUESKY_POSTING_STEP)
             
             with metrics_collector.timer("bluesky_posting", "bluesky_crypto_agent"):
-                post_result = await self._post_to_bluesky(generated_content)
+                await login_task
+                async with self._post_semaphore:
+                    post_result = await self._post_to_bluesky(generated_content)
             
             # Update history and statistics
             self.add_to_history(generated_content)
+            # Once in history the duplicate filter would reject this content, so don't reuse it
+            self._discard_cached_content(news_data)
             
             # Calculate total workflow time
-            workflow_duration = (datetime.now() - workflow_start).total_seconds()
+            workflow_duration = time.monotonic() - started_at
             metrics_collector.record_metric("workflow_duration", workflow_duration, "seconds", "bluesky_crypto_agent")
             
             if post_result.success:
+                # The cached headlines have now been posted about, so fetch fresh news next time
+                self.clear_news_cache()
+                if self.seen_news is not None and generated_content.source_news is not None:
+                    self.seen_news.add(self._news_key(generated_content.source_news.url,
+                                                      generated_content.source_news.headline))
                 self.workflow_stats['successful_posts'] += 1
-                self.workflow_stats['last_success'] = datetime.now()
+                self.workflow_stats['last_success'] = post_result.timestamp
                 
-                logger.info(f"Workflow completed successfully. Post ID: {post_result.post_id}", extra={
-                    "step": "workflow_complete",
-                    "post_id": post_result.post_id,
-                    "duration_seconds": workflow_duration,
-                    "engagement_score": generated_content.engagement_score
-                })
+                if self._log.isEnabledFor(logging.INFO):
+                    self._log.info("Workflow completed successfully. Post ID: %s", post_result.post_id, extra={
+                        "step": "workflow_complete",
+                        "post_id": post_result.post_id,
+                        "duration_seconds": workflow_duration,
+                        "engagement_score": generated_content.engagement_score
+                    })
                 
                 # Record success metrics
-                metrics_collector.increment_counter("workflow_success", "bluesky_crypto_agent")
-                metrics_collector.increment_counter("posts_published", "bluesky_crypto_agent")
+                metrics_collector.increment(_WORKFLOW_SUCCESS)
+                metrics_collector.increment(_POSTS_PUBLISHED)
                 metrics_collector.record_metric("successful_post_engagement_score", generated_content.engagement_score, "score", "bluesky_crypto_agent")
                 
             else:
                 self.workflow_stats['failed_posts'] += 1
-                logger.error(f"Workflow failed at posting step: {post_result.error_message}", extra={
+                self._log.error("Workflow failed at posting step: %s", post_result.error_message, extra={
                     "step": "bluesky_posting",
                     "error_type": "posting_failure",
                     "error_message": post_result.error_message,
@@ -260,7 +380,7 @@ class BlueskyCryptoAgent(BaseAgent):
                 })
                 
                 # Record failure metrics and trigger alert
-                metrics_collector.increment_counter("posting_failures", "bluesky_crypto_agent")
+                metrics_collector.increment(_POSTING_FAILURES)
                 alert_manager.trigger_alert(
                     title="Bluesky Posting Failed",
                     message=f"Failed to post content: {post_result.error_message}",
@@ -277,10 +397,14 @@ class BlueskyCryptoAgent(BaseAgent):
             
         except Exception as e:
             self.workflow_stats['failed_posts'] += 1
-            workflow_duration = (datetime.now() - workflow_start).total_seconds()
+            workflow_duration = time.monotonic() - started_at
             error_msg = f"Workflow execution failed: {str(e)}"
+            # Only needed on this failure path, so imported here rather than at module load
+            import traceback
+            # Formatted once and shared by the log record and the alert
+            formatted_traceback = traceback.format_exc()
             
-            logger.error(f"{error_msg}\n{traceback.format_exc()}", extra={
+            self._log.error("%s\n%s", error_msg, formatted_traceback, extra={
                 "step": "workflow_exception",
                 "error_type": "unexpected_exception",
                 "duration_seconds": workflow_duration,
@@ -288,7 +412,7 @@ class BlueskyCryptoAgent(BaseAgent):
             })
             
             # Record exception metrics and trigger critical alert
-            metrics_collector.increment_counter("workflow_exceptions", "bluesky_crypto_agent")
+            metrics_collector.increment(_WORKFLOW_EXCEPTIONS)
             metrics_collector.record_metric("failed_workflow_duration", workflow_duration, "seconds", "bluesky_crypto_agent")
             
             alert_manager.trigger_alert(
@@ -299,15 +423,178 @@ class BlueskyCryptoAgent(BaseAgent):
                 metadata={
                     "exception_type": type(e).__name__,
                     "duration_seconds": workflow_duration,
-                    "traceback": traceback.format_exc()
+                    "traceback": formatted_traceback
                 }
             )
             
-            return self._create_error_result(error_msg, workflow_start)
+            return self._create_error_result(error_msg, retryable=True)
         
         finally:
             # Always reset active workflows gauge
             metrics_collector.set_gauge("active_workflows", 0, "bluesky_crypto_agent")
+            self._metrics.apply_batch(metrics_collector)
+    
+    def _on_override_change(self, override_type: str, expires_at: Optional[datetime]):
+        """
+        Record a manual override change pushed by the management interface
+        
+        Args:
+            override_type: Type of override that changed
+            expires_at: When the override expires, or None if it was removed
+        """
+        if expires_at is None:
+            self._override_expiry.pop(override_type, None)
+        else:
+            self._override_expiry[override_type] = expires_at
+    
+    def _start_login(self) -> asyncio.Task:
+        """
+        Start a background Bluesky login, or return the one already in flight
+        
+        The login runs in a worker thread that can't be cancelled, so a workflow
+        that ends before posting leaves it running for the next workflow to await
+        instead of starting a second login that would race it.
+        
+        Returns:
+            Task resolving to True once a valid session is available
+        """
+        task = self._login_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._login())
+            self._login_task = task
+        return task
+    
+    async def _login(self) -> bool:
+        try:
+            return await asyncio.to_thread(
+                self.social_tool.ensure_authenticated,
+                self.config.bluesky_username,
+                self.config.bluesky_password
+            )
+        except Exception as e:
+            # Posting authenticates again, so a failed login only needs logging
+            logger.warning("Bluesky pre-authentication failed: %s", e)
+            return False
+    
+    def _is_override_active(self, override_type: str) -> bool:
+        """Check whether a manual override is set and not yet expired"""
+        if self._override_expiry is None:
+            if not self.management_interface:
+                return False
+            is_active, _ = self.management_interface.is_override_active(override_type)
+            return is_active
+        expires_at = self._override_expiry.get(override_type)
+        return expires_at is not None and datetime.now() <= expires_at
+    
+    async def _get_news(self, query: str) -> Dict[str, Any]:
+        """
+        Return news for a query, reusing a recent successful retrieval when available
+        
+        Args:
+            query: Search query for news
+            
+        Returns:
+            Dictionary containing news data
+        """
+        ttl = self.config.news_cache_ttl_seconds
+        cached = self._news_cache.get(query)
+        if cached is not None:
+            fetched_at, news_data = cached
+            if time.monotonic() - fetched_at < ttl:
+                logger.debug("Using cached news for query: '%s'", query)
+                return news_data
+            del self._news_cache[query]
+        
+        news_data = await self._retrieve_news(query)
+        
+        # Only cache real API results; fallback data should be retried on the next cycle
+        if ttl > 0 and news_data and news_data.get('success', False) and not news_data.get('fallback', False):
+            self._news_cache[query] = (time.monotonic(), news_data)
+        
+        return news_data
+    
+    def clear_news_cache(self):
+        """Drop all cached news retrievals"""
+        self._news_cache.clear()
+    
+    @staticmethod
+    def _content_cache_key(news_data: Dict[str, Any]) -> str:
+        """Identify a news batch by its normalized headlines and summaries, ignoring order"""
+        items = sorted(
+            (" ".join((item.get('headline') or '').lower().split()),
+             " ".join((item.get('summary') or '').lower().split()))
+            for item in news_data.get('news_items') or []
+        )
+        return hashlib.sha256(dumps_bytes(items)).hexdigest()
+    
+    async def _get_content(self, news_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return generated content for a news batch, reusing content recently generated for the same batch
+        
+        Args:
+            news_data: News data from retrieval step
+            
+        Returns:
+            Dictionary containing generated content
+        """
+        key = self._content_cache_key(news_data)
+        cached = self._content_cache.get(key)
+        if cached is not None:
+            generated_at, content_data = cached
+            if time.monotonic() - generated_at < CONTENT_CACHE_TTL_SECONDS:
+                self._content_cache.move_to_end(key)
+                self._metrics.increment(_CONTENT_CACHE_HITS)
+                logger.debug("Using cached content for news batch")
+                return content_data
+            del self._content_cache[key]
+        
+        self._metrics.increment(_CONTENT_CACHE_MISSES)
+        async with self._llm_semaphore:
+            content_data = await self._generate_content(news_data)
+        
+        # Only cache real generations; fallback content should be retried on the next cycle
+        if content_data and content_data.get('success', False) and not content_data.get('fallback', False):
+            self._content_cache[key] = (time.monotonic(), content_data)
+            if len(self._content_cache) > CONTENT_CACHE_MAX_ENTRIES:
+                self._content_cache.popitem(last=False)
+        
+        return content_data
+    
+    def _discard_cached_content(self, news_data: Dict[str, Any]):
+        """Forget cached content for a news batch"""
+        self._content_cache.pop(self._content_cache_key(news_data), None)
+    
+    def clear_content_cache(self):
+        """Drop all cached generated content"""
+        self._content_cache.clear()
+    
+    @staticmethod
+    def _news_key(url: Optional[str], headline: Optional[str]) -> str:
+        """Identify a news item by URL, or by headline when it has no URL"""
+        if url:
+            return url.strip().lower()
+        return f"headline:{(headline or '').strip().lower()}"
+    
+    def _drop_seen_news(self, news_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Remove news items that have already been posted about
+        
+        Args:
+            news_data: News data from retrieval step
+            
+        Returns:
+            Copy of the news data containing only unseen items
+        """
+        news_items = news_data.get('news_items') or []
+        unseen = [
+            item for item in news_items
+            if self._news_key(item.get('url'), item.get('headline')) not in self.seen_news
+        ]
+        
+        if len(unseen) < len(news_items):
+            logger.info("Skipping %d already posted news items", len(news_items) - len(unseen))
+        
+        return {**news_data, 'news_items': unseen, 'count': len(unseen)}
     
     @handle_errors("bluesky_crypto_agent", "retrieve_news", attempt_recovery=True)
     async def _retrieve_news(self, query: str) -> Dict[str, Any]:
@@ -322,24 +609,21 @@ class BlueskyCryptoAgent(BaseAgent):
         """
         try:
             # Check circuit breaker status
-            circuit_breaker_manager = get_circuit_breaker_manager()
-            news_circuit = circuit_breaker_manager.get_circuit_breaker("perplexity_api")
-            
-            if news_circuit.get_state().value == "open":
+            if self._news_circuit.state is CircuitState.OPEN:
                 logger.warning("News retrieval circuit breaker is open, using fallback")
                 return self._get_fallback_news_data(query)
             
             # Use the news retrieval tool
             news_result = await self.news_tool._arun(query)
-            return json.loads(news_result)
+            return loads(news_result)
             
         except CircuitBreakerError as e:
-            logger.warning(f"Circuit breaker prevented news retrieval: {str(e)}")
+            logger.warning("Circuit breaker prevented news retrieval: %s", e)
             return self._get_fallback_news_data(query)
             
         except Exception as e:
             # Handle specific error types with recovery
-            error_handler = get_error_handler()
+            error_handler = self._error_handler
             context = ErrorContext(
                 component="bluesky_crypto_agent",
                 operation="retrieve_news",
@@ -349,15 +633,15 @@ class BlueskyCryptoAgent(BaseAgent):
             error_record = error_handler.handle_error(e, context, attempt_recovery=True)
             
             if error_record and not error_record.recovery_successful:
-                logger.error(f"News retrieval failed after recovery attempts: {str(e)}")
+                logger.error("News retrieval failed after recovery attempts: %s", e)
                 return self._get_fallback_news_data(query)
             
             # If we reach here, recovery was successful, retry the operation
             try:
                 news_result = await self.news_tool._arun(query)
-                return json.loads(news_result)
+                return loads(news_result)
             except Exception as retry_error:
-                logger.error(f"News retrieval retry failed: {str(retry_error)}")
+                logger.error("News retrieval retry failed: %s", retry_error)
                 return {'success': False, 'error': str(retry_error)}
     
     def _get_fallback_news_data(self, query: str) -> Dict[str, Any]:
@@ -416,17 +700,14 @@ class BlueskyCryptoAgent(BaseAgent):
             Dictionary containing generated content
         """
         try:
-            # Convert news data back to JSON string for the tool
-            news_json = json.dumps(news_data)
-            
-            # Use the content generation tool
+            # Hand the parsed news data straight to the tool instead of re-encoding it as JSON
             content_result = await self.content_tool._arun(
-                news_data=news_json,
+                news_data=news_data,
                 content_type="news",
-                target_engagement=self.config.min_engagement_score
+                target_engagement=self._min_engagement_score
             )
             
-            result = json.loads(content_result)
+            result = loads(content_result)
             
             # Validate the generated content
             if not self._validate_generated_content(result):
@@ -437,7 +718,7 @@ class BlueskyCryptoAgent(BaseAgent):
             
         except Exception as e:
             # Handle specific error types with recovery
-            error_handler = get_error_handler()
+            error_handler = self._error_handler
             context = ErrorContext(
                 component="bluesky_crypto_agent",
                 operation="generate_content",
@@ -447,20 +728,19 @@ class BlueskyCryptoAgent(BaseAgent):
             error_record = error_handler.handle_error(e, context, attempt_recovery=True)
             
             if error_record and not error_record.recovery_successful:
-                logger.error(f"Content generation failed after recovery attempts: {str(e)}")
+                logger.error("Content generation failed after recovery attempts: %s", e)
                 return self._get_fallback_content_data(news_data)
             
             # If we reach here, recovery was successful, retry the operation
             try:
-                news_json = json.dumps(news_data)
                 content_result = await self.content_tool._arun(
-                    news_data=news_json,
+                    news_data=news_data,
                     content_type="news",
-                    target_engagement=self.config.min_engagement_score
+                    target_engagement=self._min_engagement_score
                 )
-                return json.loads(content_result)
+                return loads(content_result)
             except Exception as retry_error:
-                logger.error(f"Content generation retry failed: {str(retry_error)}")
+                logger.error("Content generation retry failed: %s", retry_error)
                 return self._get_fallback_content_data(news_data)
     
     def _validate_generated_content(self, content_data: Dict[str, Any]) -> bool:
@@ -474,45 +754,44 @@ class BlueskyCryptoAgent(BaseAgent):
             True if content is valid, False otherwise
         """
         try:
-            # Check required fields
-            required_fields = ['success', 'content']
-            for field in required_fields:
-                if field not in content_data:
-                    logger.warning(f"Missing required field in content data: {field}")
-                    return False
-            
-            if not content_data.get('success', False):
+            # Check required fields with one set comparison; only look for the culprit when one is missing
+            if not _CONTENT_RESULT_FIELD_SET.issubset(content_data):
+                field = next(name for name in _CONTENT_RESULT_FIELDS if name not in content_data)
+                logger.warning("Missing required field in content data: %s", field)
+                return False
+            
+            if not content_data['success']:
                 logger.warning("Content generation was not successful")
                 return False
             
-            content = content_data.get('content', {})
+            content = content_data['content']
             
             # Check content structure
-            content_required_fields = ['text', 'hashtags', 'engagement_score', 'content_type', 'source_news']
-            for field in content_required_fields:
-                if field not in content:
-                    logger.warning(f"Missing required field in content: {field}")
-                    return False
+            if not _CONTENT_FIELD_SET.issubset(content):
+                field = next(name for name in _CONTENT_FIELDS if name not in content)
+                logger.warning("Missing required field in content: %s", field)
+                return False
             
             # Validate content quality
-            text = content.get('text', '')
+            text = content['text']
             if not text or len(text.strip()) < 10:
                 logger.warning("Generated text is too short or empty")
                 return False
             
-            if len(text) > self.config.max_post_length:
-                logger.warning(f"Generated text exceeds maximum length: {len(text)}/{self.config.max_post_length}")
+            text_length = len(text)
+            if text_length > self._max_post_length:
+                logger.warning("Generated text exceeds maximum length: %d/%d", text_length, self._max_post_length)
                 return False
             
-            engagement_score = content.get('engagement_score', 0)
+            engagement_score = content['engagement_score']
             if engagement_score < 0.1:  # Minimum quality threshold
-                logger.warning(f"Generated content has very low engagement score: {engagement_score}")
+                logger.warning("Generated content has very low engagement score: %s", engagement_score)
                 return False
             
             return True
             
         except Exception as e:
-            logger.error(f"Error validating generated content: {str(e)}")
+            logger.error("Error validating generated content: %s", e)
             return False
     
     def _get_fallback_content_data(self, news_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -539,37 +818,25 @@ class BlueskyCryptoAgent(BaseAgent):
             headline = 'Cryptocurrency Market Update'
             topics = ['Cryptocurrency', 'Market']
         
-        # Generate simple fallback content
-        fallback_texts = [
-            f"🚀 {headline[:100]}... What are your thoughts on this crypto development?",
-            f"📈 Latest in crypto: {headline[:120]}... #crypto #blockchain",
-            f"💡 Crypto insight: {headline[:110]}... Stay informed! #cryptocurrency",
-            f"🔥 Breaking: {headline[:130]}... #bitcoin #ethereum #crypto"
-        ]
-        
-        # Select appropriate fallback text based on length
-        selected_text = None
-        for text in fallback_texts:
-            if len(text) <= self.config.max_post_length:
+        # Use the first template whose text fits within the post length limit
+        selected_text = _FALLBACK_DEFAULT_TEXT
+        for template, headline_length in _FALLBACK_TEMPLATES:
+            text = template.format(headline[:headline_length])
+            if len(text) <= self._max_post_length:
                 selected_text = text
                 break
         
-        if not selected_text:
-            selected_text = f"🚀 Crypto update: Stay informed about the latest developments! #crypto"
+        # Generate hashtags based on topics (limit to 3), dropping duplicates but keeping order
+        hashtags = list(dict.fromkeys(f"#{topic.lower().translate(_HASHTAG_STRIP)}" for topic in topics[:3]))
         
-        # Generate hashtags based on topics
-        hashtags = []
-        for topic in topics[:3]:  # Limit to 3 hashtags
-            hashtag = f"#{topic.lower().replace(' ', '').replace('-', '')}"
-            if hashtag not in hashtags:
-                hashtags.append(hashtag)
+        now_iso = datetime.now().isoformat()
         
         # Create fallback source news
         fallback_source_news = {
             "headline": headline,
             "summary": "Fallback content generated due to primary system failure",
             "source": "Fallback System",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "relevance_score": 0.5,
             "topics": topics,
             "url": None,
@@ -583,7 +850,7 @@ class BlueskyCryptoAgent(BaseAgent):
             "engagement_score": 0.6,  # Moderate engagement score for fallback
             "content_type": "news",
             "source_news": fallback_source_news,
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
             "metadata": {
                 "fallback": True,
                 "fallback_reason": "primary_content_generation_failed"
@@ -607,12 +874,12 @@ class BlueskyCryptoAgent(BaseAgent):
         Returns:
             PostResult object
         """
+        # Rendered once and shared by the initial attempt and any recovery retry
+        full_text = self._render_post_text(content)
+        
         try:
             # Check circuit breaker status for Bluesky posting
-            circuit_breaker_manager = get_circuit_breaker_manager()
-            post_circuit = circuit_breaker_manager.get_circuit_breaker("bluesky_post")
-            
-            if post_circuit.get_state().value == "open":
+            if self._post_circuit.state is CircuitState.OPEN:
                 error_msg = "Bluesky posting circuit breaker is open, skipping post"
                 logger.warning(error_msg)
                 return PostResult(
@@ -624,13 +891,6 @@ class BlueskyCryptoAgent(BaseAgent):
                     retry_count=0
                 )
             
-            # Prepare the full post text with hashtags
-            full_text = content.text
-            if content.hashtags:
-                hashtag_text = " " + " ".join(content.hashtags)
-                if len(full_text + hashtag_text) <= self.config.max_post_length:
-                    full_text += hashtag_text
-            
             # Use the Bluesky social tool
             post_result = await self.social_tool._arun(
                 content=full_text,
@@ -638,20 +898,11 @@ class BlueskyCryptoAgent(BaseAgent):
                 password=self.config.bluesky_password
             )
             
-            # Create PostResult object
-            result = PostResult(
-                success=post_result['success'],
-                post_id=post_result.get('post_id'),
-                timestamp=datetime.now(),
-                content=content,
-                error_message=post_result.get('error_message'),
-                retry_count=post_result.get('retry_count', 0),
-                response_data=post_result
-            )
+            result = self._post_result_from_response(content, post_result)
             
             # If posting failed, handle with error recovery
             if not result.success:
-                error_handler = get_error_handler()
+                error_handler = self._error_handler
                 context = ErrorContext(
                     component="bluesky_crypto_agent",
                     operation="post_to_bluesky",
@@ -675,15 +926,7 @@ class BlueskyCryptoAgent(BaseAgent):
                         password=self.config.bluesky_password
                     )
                     
-                    result = PostResult(
-                        success=retry_result['success'],
-                        post_id=retry_result.get('post_id'),
-                        timestamp=datetime.now(),
-                        content=content,
-                        error_message=retry_result.get('error_message'),
-                        retry_count=retry_result.get('retry_count', 0) + 1,
-                        response_data=retry_result
-                    )
+                    result = self._post_result_from_response(content, retry_result, recovery_retries=1)
             
             return result
             
@@ -701,7 +944,7 @@ class BlueskyCryptoAgent(BaseAgent):
             
         except Exception as e:
             # Handle unexpected errors with recovery
-            error_handler = get_error_handler()
+            error_handler = self._error_handler
             context = ErrorContext(
                 component="bluesky_crypto_agent",
                 operation="post_to_bluesky",
@@ -718,33 +961,19 @@ class BlueskyCryptoAgent(BaseAgent):
             if error_record and error_record.recovery_successful:
                 # Retry posting after successful recovery
                 try:
-                    full_text = content.text
-                    if content.hashtags:
-                        hashtag_text = " " + " ".join(content.hashtags)
-                        if len(full_text + hashtag_text) <= self.config.max_post_length:
-                            full_text += hashtag_text
-                    
                     retry_result = await self.social_tool._arun(
                         content=full_text,
                         username=self.config.bluesky_username,
                         password=self.config.bluesky_password
                     )
                     
-                    return PostResult(
-                        success=retry_result['success'],
-                        post_id=retry_result.get('post_id'),
-                        timestamp=datetime.now(),
-                        content=content,
-                        error_message=retry_result.get('error_message'),
-                        retry_count=retry_result.get('retry_count', 0) + 1,
-                        response_data=retry_result
-                    )
+                    return self._post_result_from_response(content, retry_result, recovery_retries=1)
                     
                 except Exception as retry_error:
-                    logger.error(f"Bluesky posting retry failed: {str(retry_error)}")
+                    logger.error("Bluesky posting retry failed: %s", retry_error)
             
             # Return error result
-            logger.error(f"Bluesky posting failed: {str(e)}")
+            logger.error("Bluesky posting failed: %s", e)
             return PostResult(
                 success=False,
                 post_id=None,
@@ -754,6 +983,49 @@ class BlueskyCryptoAgent(BaseAgent):
                 retry_count=0
             )
     
+    @staticmethod
+    def _post_result_from_response(content: GeneratedContent, response: Dict[str, Any],
+                                   recovery_retries: int = 0) -> PostResult:
+        """
+        Build a PostResult from a social tool response
+        
+        Args:
+            content: Content that was posted
+            response: Response dictionary returned by the social tool
+            recovery_retries: Extra attempts made after error recovery, added to the tool's own retry count
+            
+        Returns:
+            PostResult object timestamped now
+        """
+        return PostResult(
+            success=response['success'],
+            post_id=response.get('post_id'),
+            timestamp=datetime.now(),
+            content=content,
+            error_message=response.get('error_message'),
+            retry_count=response.get('retry_count', 0) + recovery_retries,
+            response_data=response
+        )
+    
+    def _render_post_text(self, content: GeneratedContent) -> str:
+        """
+        Build the post text, appending hashtags when they fit within the length limit
+        
+        Args:
+            content: Generated content to render
+            
+        Returns:
+            Text to post
+        """
+        if not content.hashtags:
+            return content.text
+        
+        hashtags = content.hashtags
+        # Each hashtag adds its length plus one separating space; nothing is joined unless it fits
+        if len(content.text) + sum(map(len, hashtags)) + len(hashtags) <= self._max_post_length:
+            return f"{content.text} {' '.join(hashtags)}"
+        return content.text
+    
     def _parse_generated_content(self, content_data: Dict[str, Any]) -> Optional[GeneratedContent]:
         """
         Parse generated content data into GeneratedContent object
@@ -767,10 +1039,9 @@ class BlueskyCryptoAgent(BaseAgent):
         try:
             # Parse source news
             source_news_data = content_data['source_news']
+            # fromisoformat accepts a trailing 'Z' natively on Python 3.11+
             if isinstance(source_news_data.get('timestamp'), str):
-                source_news_data['timestamp'] = datetime.fromisoformat(
-                    source_news_data['timestamp'].replace('Z', '+00:00')
-                )
+                source_news_data['timestamp'] = datetime.fromisoformat(source_news_data['timestamp'])
             
             source_news = NewsItem(**source_news_data)
             
@@ -779,55 +1050,39 @@ class BlueskyCryptoAgent(BaseAgent):
                 text=content_data['text'],
                 hashtags=content_data['hashtags'],
                 engagement_score=content_data['engagement_score'],
-                content_type=ContentType(content_data['content_type']),
+                content_type=ContentType.from_value(content_data['content_type']),
                 source_news=source_news,
                 created_at=datetime.fromisoformat(content_data['created_at']) if isinstance(content_data.get('created_at'), str) else datetime.now(),
                 metadata=content_data.get('metadata', {})
             )
             
         except Exception as e:
-            logger.error(f"Failed to parse generated content: {str(e)}")
+            logger.error("Failed to parse generated content: %s", e)
             return None
     
-    def _create_error_result(self, error_message: str, start_time: datetime, content: Optional[GeneratedContent] = None) -> PostResult:
+    def _create_error_result(self, error_message: str, content: Optional[GeneratedContent] = None,
+                             retryable: bool = False) -> PostResult:
         """
         Create a PostResult object for error cases
         
         Args:
             error_message: Error description
-            start_time: Workflow start time
             content: Generated content if available
+            retryable: Whether the failure was transient and an early retry may succeed
             
         Returns:
             PostResult object representing the error
         """
-        # Create dummy content if none provided
-        if not content:
-            dummy_news = NewsItem(
-                headline="Error in workflow",
-                summary="Workflow execution failed",
-                source="System",
-                timestamp=start_time,
-                relevance_score=0.0,
-                topics=["Error"]
-            )
-            
-            content = GeneratedContent(
-                text="Workflow execution failed",
-                hashtags=[],
-                engagement_score=0.0,
-                content_type=ContentType.NEWS,
-                source_news=dummy_news,
-                created_at=start_time
-            )
-        
+        timestamp = datetime.now()
         return PostResult(
             success=False,
             post_id=None,
-            timestamp=datetime.now(),
-            content=content,
+            timestamp=timestamp,
+            # Built per result so callers can't alter each other's placeholder
+            content=content or _error_placeholder_content(timestamp),
             error_message=error_message,
-            retry_count=0
+            retry_count=0,
+            retryable=retryable
         )
     
     def add_to_history(self, content: GeneratedContent):
@@ -842,12 +1097,7 @@ class BlueskyCryptoAgent(BaseAgent):
         # Add to content filter history as well
         self.content_filter.add_to_history(content)
         
-        # Keep only recent history based on config (default 50 items)
-        max_history = getattr(self.config, 'max_history_size', 50)
-        if len(self.content_history) > max_history:
-            self.content_history = self.content_history[-max_history:]
-        
-        logger.debug(f"Added content to history. Total items: {len(self.content_history)}")
+        logger.debug("Added content to history. Total items: %d", len(self.content_history))
     
     def get_workflow_stats(self) -> Dict[str, Any]:
         """
@@ -882,8 +1132,7 @@ class BlueskyCryptoAgent(BaseAgent):
         Returns:
             List of content dictionaries
         """
-        recent_content = self.content_history[-limit:] if self.content_history else []
-        return [content.to_dict() for content in reversed(recent_content)]
+        return [content.to_dict() for content in islice(reversed(self.content_history), limit)]
     
     def clear_history(self):
         """Clear content history (useful for testing or maintenance)"""
@@ -891,4 +1140,12 @@ class BlueskyCryptoAgent(BaseAgent):
         # Reset content filter history as well
         self.content_filter.recent_posts.clear()
         self.content_filter.content_hashes.clear()
-        logger.info("Content history cleared")
\ No newline at end of file
+        logger.info("Content history cleared")
+    
+    async def aclose(self):
+        """Release network resources held by the agent's tools"""
+        api_client = getattr(self.news_tool, 'api_client', None)
+        if api_client is not None:
+            api_client.close()
+        self.social_tool.close()
+        logger.info("BlueskyCryptoAgent resources released")
\ No newline at end of file
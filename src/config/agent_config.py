@@ -4,7 +4,8 @@ Configuration management for the Bluesky crypto agent with environment variable
 """
 import os
 from dataclasses import dataclass, field
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
 import logging
 from pathlib import Path
 
@@ -36,6 +37,16 @@ class AgentConfig:
     duplicate_threshold: float = 0.8
     max_retries: int = 3
     
+    # Caching Settings
+    news_cache_ttl_seconds: float = 300.0
+    
+    # Persistent record of news already posted about (empty string disables)
+    seen_news_file_path: str = "logs/seen_news.bloom"
+    
+    # Concurrency Settings (shared by concurrent workflow runs)
+    max_concurrent_llm_calls: int = 4
+    max_concurrent_posts: int = 2
+    
     # Logging Configuration
     log_level: str = "INFO"
     log_file_path: str = "logs/bluesky_agent.log"
@@ -47,9 +58,10 @@ class AgentConfig:
         """
         logger.info("Loading configuration from environment variables")
         
-        # Load content themes from environment (comma-separated)
+        # Load content themes from environment (comma-separated); blank entries such as a
+        # trailing comma are dropped, since an empty theme would match every article
         themes_env = os.getenv('CONTENT_THEMES', 'Bitcoin,Ethereum,DeFi,NFTs,Altcoins,Crypto News')
-        content_themes = [theme.strip() for theme in themes_env.split(',')]
+        content_themes = [theme for theme in map(str.strip, themes_env.split(',')) if theme]
         
         config = cls(
             # API Configuration
@@ -70,6 +82,14 @@ class AgentConfig:
             duplicate_threshold=float(os.getenv('DUPLICATE_THRESHOLD', '0.8')),
             max_retries=int(os.getenv('MAX_RETRIES', '3')),
             
+            # Caching Settings
+            news_cache_ttl_seconds=float(os.getenv('NEWS_CACHE_TTL_SECONDS', '300')),
+            seen_news_file_path=os.getenv('SEEN_NEWS_FILE_PATH', 'logs/seen_news.bloom'),
+            
+            # Concurrency Settings
+            max_concurrent_llm_calls=int(os.getenv('MAX_CONCURRENT_LLM_CALLS', '4')),
+            max_concurrent_posts=int(os.getenv('MAX_CONCURRENT_POSTS', '2')),
+            
             # Logging Configuration
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
             log_file_path=os.getenv('LOG_FILE_PATH', 'logs/bluesky_agent.log')
@@ -112,6 +132,15 @@ class AgentConfig:
         if self.max_retries < 0:
             errors.append("max_retries must be non-negative")
             
+        if self.news_cache_ttl_seconds < 0:
+            errors.append("news_cache_ttl_seconds must be non-negative")
+            
+        if self.max_concurrent_llm_calls < 1:
+            errors.append("max_concurrent_llm_calls must be at least 1")
+            
+        if self.max_concurrent_posts < 1:
+            errors.append("max_concurrent_posts must be at least 1")
+            
         # Validate content themes
         if not self.content_themes:
             errors.append("content_themes cannot be empty")
@@ -129,8 +158,30 @@ class AgentConfig:
         log_path = Path(self.log_file_path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any assignment may change what to_dict() reports, so drop the memoized view
+        self.__dict__.pop('_dict_cache', None)
+        super().__setattr__(name, value)
+    
+    def _dict_view(self) -> Mapping[str, Any]:
+        """
+        Return a read-only, memoized view of the masked configuration values.
+        
+        The view is rebuilt lazily after any attribute assignment. It is kept
+        out of the dataclass fields so asdict() and equality are unaffected.
+        """
+        view = self.__dict__.get('_dict_cache')
+        if view is None:
+            view = MappingProxyType(self._build_dict())
+            self.__dict__['_dict_cache'] = view
+        return view
+    
     def to_dict(self) -> dict:
         """Convert configuration to dictionary"""
+        return dict(self._dict_view())
+    
+    def _build_dict(self) -> dict:
+        """Build the masked dictionary returned by to_dict()"""
         return {
             'perplexity_api_key': '***' if self.perplexity_api_key else '',
             'bluesky_username': self.bluesky_username,
@@ -142,6 +193,10 @@ class AgentConfig:
             'min_engagement_score': self.min_engagement_score,
             'duplicate_threshold': self.duplicate_threshold,
             'max_retries': self.max_retries,
+            'news_cache_ttl_seconds': self.news_cache_ttl_seconds,
+            'seen_news_file_path': self.seen_news_file_path,
+            'max_concurrent_llm_calls': self.max_concurrent_llm_calls,
+            'max_concurrent_posts': self.max_concurrent_posts,
             'log_level': self.log_level,
             'log_file_path': self.log_file_path
         }
\ No newline at end of file
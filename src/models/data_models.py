@@ -2,21 +2,46 @@
 """
 Data models for the Bluesky crypto agent
 """
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Sequence
 from enum import Enum
 
 
+def _intern_strings(values) -> List[Any]:
+    """Return values as a list with string entries interned so repeated labels share storage"""
+    return [sys.intern(value) if type(value) is str else value for value in values]
+
+
 class ContentType(Enum):
     """Content type enumeration"""
     NEWS = "news"
     ANALYSIS = "analysis"
     OPINION = "opinion"
     MARKET_UPDATE = "market_update"
+    
+    @classmethod
+    def from_value(cls, value: str) -> 'ContentType':
+        """
+        Look up a content type by its string value
+        
+        Equivalent to ContentType(value), but a plain dict lookup instead of a
+        call through the enum machinery.
+        
+        Raises:
+            ValueError: If value is not a content type value
+        """
+        try:
+            return _CONTENT_TYPES_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
 
 
-@dataclass
+_CONTENT_TYPES_BY_VALUE = {member.value: member for member in ContentType}
+
+
+@dataclass(slots=True)
 class NewsItem:
     """
     Data model for cryptocurrency news items retrieved from Perplexity API
@@ -42,6 +67,31 @@ class NewsItem:
             raise ValueError("relevance_score must be between 0.0 and 1.0")
         if not self.topics:
             raise ValueError("topics cannot be empty")
+        self.topics = _intern_strings(self.topics)
+        # The same few outlets recur across news items, so they share storage like topics
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]],
+                  timestamp: Optional[datetime] = None) -> List['NewsItem']:
+        """
+        Build news items from (headline, summary, source, relevance_score, topics) rows
+        
+        Args:
+            rows: Iterable of row tuples, optionally followed by url
+            timestamp: Timestamp shared by every item (default: now, read once)
+            
+        Returns:
+            List of NewsItem objects in row order
+        """
+        now = timestamp or datetime.now()
+        return [
+            cls(headline=row[0], summary=row[1], source=row[2], timestamp=now,
+                relevance_score=row[3], topics=list(row[4]),
+                url=row[5] if len(row) > 5 else None)
+            for row in rows
+        ]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
@@ -57,7 +107,7 @@ class NewsItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedContent:
     """
     Data model for AI-generated social media content
@@ -80,6 +130,7 @@ class GeneratedContent:
             raise ValueError("engagement_score must be between 0.0 and 1.0")
         if not isinstance(self.content_type, ContentType):
             raise ValueError("content_type must be a ContentType enum")
+        self.hashtags = _intern_strings(self.hashtags)
     
     @property
     def character_count(self) -> int:
@@ -106,7 +157,7 @@ class GeneratedContent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PostResult:
     """
     Data model for social media posting results
@@ -118,6 +169,8 @@ class PostResult:
     error_message: Optional[str] = None
     retry_count: int = 0
     response_data: Optional[Dict[str, Any]] = None
+    # Whether a failure was transient, so retrying before the next interval may help
+    retryable: bool = False
     
     def __post_init__(self):
         """Validate data after initialization"""
@@ -148,6 +201,7 @@ class PostResult:
             'error_message': self.error_message,
             'retry_count': self.retry_count,
             'response_data': self.response_data,
+            'retryable': self.retryable,
             'execution_time': self.execution_time
         }
 
@@ -2,10 +2,15 @@
 """
 A/B Testing Framework for content optimization and performance comparison
 """
+import bisect
+import copy
+import itertools
 import json
 import logging
+import math
 import random
-import statistics
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, Callable
@@ -16,6 +21,12 @@ from ..models.data_models import GeneratedContent, PostResult, ContentType
 
 logger = logging.getLogger(__name__)
 
+# Variant weights are held as integer basis points for selection
+_WEIGHT_BASIS_POINTS = 10000
+
+# How long is_active() may reuse its last wall-clock end date comparison
+_END_DATE_RECHECK_SECONDS = 1.0
+
 
 class TestStatus(Enum):
     """A/B test status enumeration"""
@@ -44,6 +55,12 @@ class TestVariant:
     parameters: Dict[str, Any] = field(default_factory=dict)
     weight: float = 0.5  # Traffic allocation weight
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Keep the strategy string used by analysis and export in step with the enum
+        if name == 'strategy':
+            super().__setattr__('_strategy_value', value.value)
+    
     def __post_init__(self):
         if not (0.0 <= self.weight <= 1.0):
             raise ValueError("weight must be between 0.0 and 1.0")
@@ -62,6 +79,29 @@ class TestMetrics:
     engagement_rate: float = 0.0
     avg_engagement_score: float = 0.0
     conversion_rate: float = 0.0
+    # Running sum of squared deviations of engagement scores (Welford)
+    _score_m2: float = field(default=0.0, repr=False)
+    
+    def __post_init__(self):
+        # Per-variant lock: recorders for different variants never contend.
+        # Kept out of the dataclass fields so asdict() and equality are unaffected.
+        self._lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    @property
+    def engagement_score_variance(self) -> float:
+        """Sample variance of engagement scores, 0.0 with fewer than two impressions"""
+        if self.impressions < 2:
+            return 0.0
+        return self._score_m2 / (self.impressions - 1)
     
     def calculate_engagement_rate(self):
         """Calculate engagement rate"""
@@ -79,6 +119,10 @@ class TestMetrics:
     
     def update_metrics(self, post_result: PostResult, engagement_data: Dict[str, Any] = None):
         """Update metrics with new post result"""
+        with self._lock:
+            self._apply_update(post_result, engagement_data)
+    
+    def _apply_update(self, post_result: PostResult, engagement_data: Optional[Dict[str, Any]]):
         self.impressions += 1
         
         if engagement_data:
@@ -92,10 +136,12 @@ class TestMetrics:
                 engagement_data.get('replies', 0)
             ])
         
-        # Update engagement score
-        if post_result.content.engagement_score > 0:
-            current_total = self.avg_engagement_score * (self.impressions - 1)
-            self.avg_engagement_score = (current_total + post_result.content.engagement_score) / self.impressions
+        # Update engagement score mean and variance in one pass (Welford)
+        score = post_result.content.engagement_score
+        if score > 0:
+            delta = score - self.avg_engagement_score
+            self.avg_engagement_score += delta / self.impressions
+            self._score_m2 += delta * (score - self.avg_engagement_score)
         
         self.calculate_engagement_rate()
         self.calculate_conversion_rate()
@@ -115,22 +161,60 @@ class ABTest:
     confidence_level: float = 0.95
     metrics: Dict[str, TestMetrics] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _cum_weight_bp: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _variant_metrics: List[Tuple[TestVariant, TestMetrics]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Keep the strings used by analysis and export in step with their sources
+        if name == 'status':
+            super().__setattr__('_status_value', value.value)
+        elif name == 'start_date':
+            super().__setattr__('_start_date_iso', value.isoformat())
+        elif name == 'end_date':
+            # Force the next is_active() to compare against the wall clock
+            super().__setattr__('_end_recheck_at', None)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Monotonic timestamps mean nothing in another process
+        state = self.__dict__.copy()
+        state['_end_recheck_at'] = None
+        return state
     
     def __post_init__(self):
-        # Initialize metrics for each variant
+        # Initialize metrics for each variant, paired in variant order for analysis
         for variant in self.variants:
             if variant.id not in self.metrics:
                 self.metrics[variant.id] = TestMetrics(variant_id=variant.id)
+            self._variant_metrics.append((variant, self.metrics[variant.id]))
         
         # Validate weights sum to 1.0
         total_weight = sum(variant.weight for variant in self.variants)
         if abs(total_weight - 1.0) > 0.001:
             raise ValueError("Variant weights must sum to 1.0")
+        
+        # Cumulative integer weights so select_variant can bisect without float drift
+        self._cum_weight_bp = list(itertools.accumulate(
+            round(variant.weight * _WEIGHT_BASIS_POINTS) for variant in self.variants
+        ))
     
     def is_active(self) -> bool:
         """Check if test is currently active"""
-        return (self.status == TestStatus.ACTIVE and 
-                (self.end_date is None or datetime.now() < self.end_date))
+        if self.status != TestStatus.ACTIVE:
+            return False
+        if self.end_date is None:
+            return True
+        
+        # Compare against the wall clock at most once per recheck interval.
+        # The interval is measured on the monotonic clock, which stalls during
+        # host suspend, so the first check after resume sees the current date.
+        now = time.monotonic()
+        if self._end_recheck_at is None or now >= self._end_recheck_at:
+            self._before_end_date = datetime.now() < self.end_date
+            self._end_recheck_at = now + _END_DATE_RECHECK_SECONDS
+        return self._before_end_date
     
     def get_sample_size(self) -> int:
         """Get total sample size across all variants"""
@@ -145,16 +229,88 @@ class ABTest:
         if not self.is_active():
             return None
         
-        rand = random.random()
-        cumulative_weight = 0.0
-        
-        for variant in self.variants:
-            cumulative_weight += variant.weight
-            if rand <= cumulative_weight:
-                return variant
-        
-        # Fallback to last variant
-        return self.variants[-1]
+        # Scale by the actual total, which may be a few basis points off 10000
+        index = bisect.bisect_left(self._cum_weight_bp, random.random() * self._cum_weight_bp[-1])
+        return self.variants[index]
+
+
+def _sample_moments(data: List[float]) -> Tuple[float, float, int]:
+    """
+    Mean and sample variance of data in a single pass (Welford)
+    
+    Args:
+        data: Observations
+        
+    Returns:
+        (mean, sample variance, count); variance is 0.0 for fewer than two values
+    """
+    mean = 0.0
+    m2 = 0.0
+    n = 0
+    for x in data:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    return mean, (m2 / (n - 1) if n > 1 else 0.0), n
+
+
+def _incomplete_beta_fraction(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta function (modified Lentz)"""
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 301):
+        m2 = 2 * m
+        # Even step
+        aa = m * (b - m) * x / ((a - 1.0 + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        h *= d * c
+        # Odd step
+        aa = -(a + m) * (a + b + m) * x / ((a + m2) * (a + 1.0 + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > tiny else tiny)
+        c = 1.0 + aa / c
+        c = c if abs(c) > tiny else tiny
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return h
+
+
+def _regularized_incomplete_beta(x: float, a: float, b: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)"""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        + a * math.log(x) + b * math.log(1.0 - x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _incomplete_beta_fraction(a, b, x) / a
+    return 1.0 - front * _incomplete_beta_fraction(b, a, 1.0 - x) / b
+
+
+def _t_two_sided_p_value(t_stat: float, df: float) -> float:
+    """
+    Two-sided p-value of Student's t distribution
+    
+    Args:
+        t_stat: T-statistic
+        df: Degrees of freedom (may be fractional, as with Welch-Satterthwaite)
+        
+    Returns:
+        P(|T| >= |t_stat|)
+    """
+    return _regularized_incomplete_beta(df / (df + t_stat * t_stat), df / 2.0, 0.5)
 
 
 class StatisticalAnalyzer:
@@ -166,9 +322,8 @@ class StatisticalAnalyzer:
         if len(data) < 2:
             return (0.0, 0.0)
         
-        mean = statistics.mean(data)
-        std_dev = statistics.stdev(data)
-        n = len(data)
+        mean, variance, n = _sample_moments(data)
+        std_dev = math.sqrt(variance)
         
         # Use t-distribution for small samples
         if n < 30:
@@ -195,19 +350,46 @@ class StatisticalAnalyzer:
                 "error": "Insufficient data for statistical analysis"
             }
         
-        mean_a = statistics.mean(variant_a_data)
-        mean_b = statistics.mean(variant_b_data)
-        
-        # Simplified statistical test (in practice, would use proper t-test)
-        # This is a basic implementation for demonstration
-        std_a = statistics.stdev(variant_a_data) if len(variant_a_data) > 1 else 0
-        std_b = statistics.stdev(variant_b_data) if len(variant_b_data) > 1 else 0
+        return StatisticalAnalyzer.welch_from_moments(
+            *_sample_moments(variant_a_data),
+            *_sample_moments(variant_b_data),
+            confidence_level
+        )
+    
+    @staticmethod
+    def welch_from_moments(mean_a: float, var_a: float, n_a: int,
+                           mean_b: float, var_b: float, n_b: int,
+                           confidence_level: float = 0.95) -> Dict[str, Any]:
+        """
+        Calculate statistical significance between two variants from their
+        sufficient statistics, without needing the raw observations
+        
+        Args:
+            mean_a: Mean of variant A
+            var_a: Sample variance of variant A
+            n_a: Number of observations for variant A
+            mean_b: Mean of variant B
+            var_b: Sample variance of variant B
+            n_b: Number of observations for variant B
+            confidence_level: Confidence level for the significance decision
+            
+        Returns:
+            Same result shape as calculate_statistical_significance
+        """
+        if n_a < 2 or n_b < 2:
+            return {
+                "is_significant": False,
+                "p_value": 1.0,
+                "confidence_level": confidence_level,
+                "error": "Insufficient data for statistical analysis"
+            }
         
-        n_a = len(variant_a_data)
-        n_b = len(variant_b_data)
+        # Welch's t-test
+        std_a = math.sqrt(var_a)
+        std_b = math.sqrt(var_b)
         
-        # Pooled standard error
-        pooled_se = ((std_a ** 2 / n_a) + (std_b ** 2 / n_b)) ** 0.5
+        # Welch standard error
+        pooled_se = math.sqrt(var_a / n_a + var_b / n_b)
         
         if pooled_se == 0:
             return {
@@ -221,13 +403,11 @@ class StatisticalAnalyzer:
         # T-statistic
         t_stat = abs(mean_a - mean_b) / pooled_se
         
-        # Simplified p-value calculation (approximation)
-        if t_stat > 2.0:
-            p_value = 0.05
-        elif t_stat > 1.65:
-            p_value = 0.1
-        else:
-            p_value = 0.2
+        # Welch-Satterthwaite degrees of freedom
+        se_a = var_a / n_a
+        se_b = var_b / n_b
+        df = (se_a + se_b) ** 2 / (se_a ** 2 / (n_a - 1) + se_b ** 2 / (n_b - 1))
+        p_value = _t_two_sided_p_value(t_stat, df)
         
         is_significant = p_value < (1 - confidence_level)
         effect_size = abs(mean_a - mean_b) / max(std_a, std_b, 0.1)
@@ -238,7 +418,8 @@ class StatisticalAnalyzer:
             "confidence_level": confidence_level,
             "mean_difference": mean_a - mean_b,
             "effect_size": effect_size,
-            "t_statistic": t_stat
+            "t_statistic": t_stat,
+            "degrees_of_freedom": df
         }
 
 
@@ -248,9 +429,13 @@ class ABTestingFramework:
     def __init__(self, max_concurrent_tests: int = 5):
         self.active_tests: Dict[str, ABTest] = {}
         self.completed_tests: Dict[str, ABTest] = {}
+        # Every test by id, active or completed, for single-lookup reads
+        self._all_tests: Dict[str, ABTest] = {}
         self.max_concurrent_tests = max_concurrent_tests
         self.analyzer = StatisticalAnalyzer()
         self.performance_history: deque = deque(maxlen=1000)
+        # test_id -> ((sample_size, status), analysis) for the last analysis computed
+        self._analysis_cache: Dict[str, Tuple[Tuple[int, TestStatus], Dict[str, Any]]] = {}
         
     def create_test(self, 
                    name: str,
@@ -279,8 +464,9 @@ class ABTestingFramework:
         )
         
         self.active_tests[test_id] = test
+        self._all_tests[test_id] = test
         
-        logger.info(f"Created A/B test: {name} (ID: {test_id}) with {len(variants)} variants")
+        logger.info("Created A/B test: %s (ID: %s) with %d variants", name, test_id, len(variants))
         
         return test_id
     
@@ -289,41 +475,61 @@ class ABTestingFramework:
         if test_id not in self.active_tests:
             return None
         
-        test = self.active_tests[test_id]
-        if not test.is_active():
-            return None
-        
-        return test.select_variant()
+        # select_variant() returns None once the test is no longer active
+        return self.active_tests[test_id].select_variant()
     
     def record_result(self, test_id: str, variant_id: str, post_result: PostResult, 
                      engagement_data: Dict[str, Any] = None):
         """Record A/B test result"""
-        if test_id not in self.active_tests:
-            logger.warning(f"Test {test_id} not found in active tests")
-            return
-        
-        test = self.active_tests[test_id]
-        if variant_id not in test.metrics:
-            logger.warning(f"Variant {variant_id} not found in test {test_id}")
-            return
-        
-        # Update metrics
-        test.metrics[variant_id].update_metrics(post_result, engagement_data)
-        
-        # Store performance history
-        self.performance_history.append({
-            "timestamp": datetime.now(),
-            "test_id": test_id,
-            "variant_id": variant_id,
-            "engagement_score": post_result.content.engagement_score,
-            "success": post_result.success,
-            "engagement_data": engagement_data or {}
-        })
+        self.record_results([(test_id, variant_id, post_result, engagement_data)])
+    
+    def record_results(self, records: List[Tuple[str, str, PostResult, Optional[Dict[str, Any]]]]):
+        """
+        Record a batch of A/B test results
+        
+        Metrics and history are updated for every record first, then each
+        affected test is checked for completion once, so a test that completes
+        part-way through a batch still counts the rest of that batch.
+        
+        Args:
+            records: (test_id, variant_id, post_result, engagement_data) tuples
+        """
+        recorded_at = datetime.now()
+        history = []
+        recorded_counts: Dict[str, int] = {}
+        
+        for test_id, variant_id, post_result, engagement_data in records:
+            test = self.active_tests.get(test_id)
+            if test is None:
+                logger.warning("Test %s not found in active tests", test_id)
+                continue
+            
+            metrics = test.metrics.get(variant_id)
+            if metrics is None:
+                logger.warning("Variant %s not found in test %s", variant_id, test_id)
+                continue
+            
+            # Update metrics
+            metrics.update_metrics(post_result, engagement_data)
+            
+            history.append({
+                "timestamp": recorded_at,
+                "test_id": test_id,
+                "variant_id": variant_id,
+                "engagement_score": post_result.content.engagement_score,
+                "success": post_result.success,
+                "engagement_data": engagement_data or {}
+            })
+            recorded_counts[test_id] = recorded_counts.get(test_id, 0) + 1
         
-        logger.info(f"Recorded result for test {test_id}, variant {variant_id}")
+        # Store performance history (deque extends are thread-safe)
+        self.performance_history.extend(history)
         
-        # Check if test should be completed
-        self._check_test_completion(test_id)
+        for test_id, count in recorded_counts.items():
+            logger.info("Recorded %d result(s) for test %s", count, test_id)
+            
+            # Check if test should be completed
+            self._check_test_completion(test_id)
     
     def _check_test_completion(self, test_id: str):
         """Check if test should be completed based on criteria"""
@@ -336,7 +542,7 @@ class ABTestingFramework:
         
         # Check if test has sufficient data and significant results
         if test.has_sufficient_data():
-            analysis = self.analyze_test(test_id)
+            analysis = self._cached_analysis(test_id)
             if analysis and analysis.get("has_winner", False):
                 significance = analysis.get("statistical_significance", {})
                 if significance.get("is_significant", False):
@@ -356,19 +562,41 @@ class ABTestingFramework:
         self.completed_tests[test_id] = test
         del self.active_tests[test_id]
         
-        logger.info(f"Completed A/B test {test_id}: {reason}")
+        logger.info("Completed A/B test %s: %s", test_id, reason)
     
     def analyze_test(self, test_id: str) -> Optional[Dict[str, Any]]:
         """Analyze A/B test results"""
-        test = self.active_tests.get(test_id) or self.completed_tests.get(test_id)
+        analysis = self._cached_analysis(test_id)
+        # Callers get their own copy so annotating it can't alter the cached analysis
+        return copy.deepcopy(analysis) if analysis is not None else None
+    
+    def _cached_analysis(self, test_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the shared, memoized analysis for internal read-only use
+        
+        Every recorded result adds an impression, so the analysis is reused
+        until the sample size or status changes.
+        """
+        test = self._all_tests.get(test_id)
         if not test:
             return None
         
+        cache_key = (test.get_sample_size(), test.status)
+        cached = self._analysis_cache.get(test_id)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
+        analysis = self._build_analysis(test, cache_key[0])
+        self._analysis_cache[test_id] = (cache_key, analysis)
+        return analysis
+    
+    def _build_analysis(self, test: ABTest, sample_size: int) -> Dict[str, Any]:
+        """Compute the analysis returned by analyze_test()"""
         analysis = {
-            "test_id": test_id,
+            "test_id": test.id,
             "test_name": test.name,
-            "status": test.status.value,
-            "sample_size": test.get_sample_size(),
+            "status": test._status_value,
+            "sample_size": sample_size,
             "has_sufficient_data": test.has_sufficient_data(),
             "variants": {},
             "winner": None,
@@ -381,13 +609,11 @@ class ABTestingFramework:
         best_score = 0.0
         
         variant_scores = []
-        for variant in test.variants:
-            metrics = test.metrics[variant.id]
-            
+        for variant, metrics in test._variant_metrics:
             variant_analysis = {
                 "id": variant.id,
                 "name": variant.name,
-                "strategy": variant.strategy.value,
+                "strategy": variant._strategy_value,
                 "impressions": metrics.impressions,
                 "engagement_rate": metrics.engagement_rate,
                 "avg_engagement_score": metrics.avg_engagement_score,
@@ -402,11 +628,13 @@ class ABTestingFramework:
                 best_score = metrics.avg_engagement_score
                 best_variant = variant
             
-            # Collect scores for statistical analysis
+            # Collect score moments for statistical analysis
             if metrics.impressions > 0:
                 variant_scores.append({
                     "variant_id": variant.id,
-                    "scores": [metrics.avg_engagement_score] * metrics.impressions
+                    "mean": metrics.avg_engagement_score,
+                    "var": metrics.engagement_score_variance,
+                    "n": metrics.impressions
                 })
         
         # Determine winner
@@ -414,22 +642,21 @@ class ABTestingFramework:
             analysis["winner"] = {
                 "variant_id": best_variant.id,
                 "variant_name": best_variant.name,
-                "strategy": best_variant.strategy.value,
+                "strategy": best_variant._strategy_value,
                 "avg_engagement_score": best_score
             }
             analysis["has_winner"] = True
             
             # Statistical significance analysis
-            if len(variant_scores) >= 2 and all(len(vs["scores"]) >= 2 for vs in variant_scores):
+            if len(variant_scores) >= 2 and all(vs["n"] >= 2 for vs in variant_scores):
                 # Compare top 2 variants
-                sorted_variants = sorted(variant_scores, 
-                                       key=lambda x: sum(x["scores"])/len(x["scores"]), 
-                                       reverse=True)
+                sorted_variants = sorted(variant_scores, key=lambda x: x["mean"], reverse=True)
                 
                 if len(sorted_variants) >= 2:
-                    significance = self.analyzer.calculate_statistical_significance(
-                        sorted_variants[0]["scores"],
-                        sorted_variants[1]["scores"]
+                    top, runner_up = sorted_variants[0], sorted_variants[1]
+                    significance = self.analyzer.welch_from_moments(
+                        top["mean"], top["var"], top["n"],
+                        runner_up["mean"], runner_up["var"], runner_up["n"]
                     )
                     analysis["statistical_significance"] = significance
         
@@ -437,7 +664,7 @@ class ABTestingFramework:
     
     def get_optimization_recommendations(self, test_id: str) -> Dict[str, Any]:
         """Get optimization recommendations based on test results"""
-        analysis = self.analyze_test(test_id)
+        analysis = self._cached_analysis(test_id)
         if not analysis:
             return {"error": "Test not found"}
         
@@ -490,9 +717,9 @@ class ABTestingFramework:
                 "id": test.id,
                 "name": test.name,
                 "description": test.description,
-                "status": test.status.value,
+                "status": test._status_value,
                 "sample_size": test.get_sample_size(),
-                "start_date": test.start_date.isoformat(),
+                "start_date": test._start_date_iso,
                 "variants": len(test.variants)
             }
             for test in self.active_tests.values()
@@ -500,7 +727,7 @@ class ABTestingFramework:
     
     def export_test_results(self, test_id: str) -> Optional[Dict[str, Any]]:
         """Export complete test results"""
-        test = self.active_tests.get(test_id) or self.completed_tests.get(test_id)
+        test = self._all_tests.get(test_id)
         if not test:
             return None
         
@@ -509,15 +736,15 @@ class ABTestingFramework:
                 "id": test.id,
                 "name": test.name,
                 "description": test.description,
-                "status": test.status.value,
-                "start_date": test.start_date.isoformat(),
+                "status": test._status_value,
+                "start_date": test._start_date_iso,
                 "end_date": test.end_date.isoformat() if test.end_date else None,
                 "min_sample_size": test.min_sample_size,
                 "variants": [
                     {
                         "id": v.id,
                         "name": v.name,
-                        "strategy": v.strategy.value,
+                        "strategy": v._strategy_value,
                         "parameters": v.parameters,
                         "weight": v.weight
                     }
@@ -9,12 +9,29 @@ import re
 import hashlib
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from ..models.data_models import GeneratedContent
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def _normalized_content_hash(content: str) -> str:
+    """Hash of case- and whitespace-normalized content, memoized per text"""
+    normalized = _WHITESPACE_RE.sub(' ', content.lower().strip())
+    return hashlib.md5(normalized.encode()).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _similarity_features(content: str) -> Tuple[str, frozenset]:
+    """Lowercased text and word set used for similarity scoring, memoized per text"""
+    lowered = content.lower()
+    return lowered, frozenset(lowered.split())
+
 
 @dataclass
 class ContentHistoryItem:
@@ -24,6 +41,22 @@ class ContentHistoryItem:
     content_hash: str
     engagement_score: float
     topics: List[str]
+    # SequenceMatcher indexing this item's lowercased text, built on first comparison.
+    # Owned by the item, so it is only shared within the filter holding this history.
+    _matcher: Optional[SequenceMatcher] = field(default=None, repr=False, compare=False)
+    
+    def matcher_for(self, item_lower: str) -> SequenceMatcher:
+        """
+        Return this item's matcher, indexing its text the first time
+        
+        SequenceMatcher indexes its second sequence when it is set, so the
+        history text is indexed once and reused for every later candidate
+        via set_seq1().
+        """
+        if self._matcher is None:
+            self._matcher = SequenceMatcher(None)
+            self._matcher.set_seq2(item_lower)
+        return self._matcher
 
 
 class ContentFilter:
@@ -213,13 +246,24 @@ class ContentFilter:
             return True, 1.0
         
         max_similarity = 0.0
+        content_lower, content_words = _similarity_features(content)
         
         for item in self.recent_posts:
-            # Sequence-based similarity
-            seq_similarity = SequenceMatcher(None, content.lower(), item.content.lower()).ratio()
+            item_lower, item_words = _similarity_features(item.content)
             
             # Word-based similarity (Jaccard similarity)
-            word_similarity = self._calculate_word_similarity(content, item.content)
+            word_similarity = self._jaccard(content_words, item_words)
+            
+            # Sequence-based similarity, pre-screened with SequenceMatcher's cheap
+            # upper bounds: a pair that cannot beat the best score so far (which is
+            # below the duplicate threshold) cannot change the result
+            matcher = item.matcher_for(item_lower)
+            matcher.set_seq1(content_lower)
+            if (matcher.real_quick_ratio() * 0.7) + (word_similarity * 0.3) <= max_similarity:
+                continue
+            if (matcher.quick_ratio() * 0.7) + (word_similarity * 0.3) <= max_similarity:
+                continue
+            seq_similarity = matcher.ratio()
             
             # Combined similarity score (weighted average)
             combined_similarity = (seq_similarity * 0.7) + (word_similarity * 0.3)
@@ -349,15 +393,16 @@ class ContentFilter:
     
     def _generate_content_hash(self, content: str) -> str:
         """Generate hash for content deduplication"""
-        # Normalize content for hashing (remove extra spaces, convert to lowercase)
-        normalized = re.sub(r'\s+', ' ', content.lower().strip())
-        return hashlib.md5(normalized.encode()).hexdigest()
+        # Repeated checks of the same text (filter, then add to history) reuse the hash
+        return _normalized_content_hash(content)
     
     def _calculate_word_similarity(self, text1: str, text2: str) -> float:
         """Calculate Jaccard similarity between word sets"""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+        return self._jaccard(_similarity_features(text1)[1], _similarity_features(text2)[1])
+    
+    @staticmethod
+    def _jaccard(words1: frozenset, words2: frozenset) -> float:
+        """Jaccard similarity of two word sets"""
         if not words1 and not words2:
             return 1.0
         if not words1 or not words2:
@@ -5,7 +5,7 @@ Content Optimization Service - Automated optimization based on A/B testing resul
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from collections import defaultdict, deque
 
 from .ab_testing_framework import (
@@ -512,16 +512,16 @@ class ContentOptimizationService:
                     content_dict = result_data["content"]
                     # Convert content_type string to enum
                     if isinstance(content_dict.get("content_type"), str):
-                        content_dict["content_type"] = ContentType(content_dict["content_type"])
+                        content_dict["content_type"] = ContentType.from_value(content_dict["content_type"])
                     # Convert source_news dict to NewsItem
                     if isinstance(content_dict.get("source_news"), dict):
                         source_news_dict = content_dict["source_news"]
                         if isinstance(source_news_dict.get("timestamp"), str):
-                            source_news_dict["timestamp"] = datetime.fromisoformat(source_news_dict["timestamp"].replace("Z", "+00:00"))
+                            source_news_dict["timestamp"] = datetime.fromisoformat(source_news_dict["timestamp"])
                         content_dict["source_news"] = NewsItem(**source_news_dict)
                     # Convert created_at string to datetime
                     if isinstance(content_dict.get("created_at"), str):
-                        content_dict["created_at"] = datetime.fromisoformat(content_dict["created_at"].replace("Z", "+00:00"))
+                        content_dict["created_at"] = datetime.fromisoformat(content_dict["created_at"])
                     
                     # Remove extra fields that aren't part of GeneratedContent constructor
                     extra_fields = ["character_count", "hashtag_count"]
@@ -562,16 +562,16 @@ class ContentOptimizationService:
             content_dict = result_data["content"]
             # Convert content_type string to enum
             if isinstance(content_dict.get("content_type"), str):
-                content_dict["content_type"] = ContentType(content_dict["content_type"])
+                content_dict["content_type"] = ContentType.from_value(content_dict["content_type"])
             # Convert source_news dict to NewsItem
             if isinstance(content_dict.get("source_news"), dict):
                 source_news_dict = content_dict["source_news"]
                 if isinstance(source_news_dict.get("timestamp"), str):
-                    source_news_dict["timestamp"] = datetime.fromisoformat(source_news_dict["timestamp"].replace("Z", "+00:00"))
+                    source_news_dict["timestamp"] = datetime.fromisoformat(source_news_dict["timestamp"])
                 content_dict["source_news"] = NewsItem(**source_news_dict)
             # Convert created_at string to datetime
             if isinstance(content_dict.get("created_at"), str):
-                content_dict["created_at"] = datetime.fromisoformat(content_dict["created_at"].replace("Z", "+00:00"))
+                content_dict["created_at"] = datetime.fromisoformat(content_dict["created_at"])
             
             # Remove extra fields that aren't part of GeneratedContent constructor
             extra_fields = ["character_count", "hashtag_count"]
@@ -601,6 +601,30 @@ class ContentOptimizationService:
             engagement_data
         )
     
+    def record_post_performance_bulk(
+        self,
+        records: Iterable[Tuple[GeneratedContent, PostResult, Optional[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Record performance for a batch of posts
+        
+        Args:
+            records: Iterable of (content, post_result, engagement_data) tuples
+            
+        Returns:
+            Number of records processed
+        """
+        record_optimizer = self.automated_optimizer.record_content_performance
+        record_analytics = self.performance_analytics.record_performance
+        
+        count = 0
+        for content, post_result, engagement_data in records:
+            record_optimizer(content, post_result, engagement_data)
+            record_analytics(content, post_result, engagement_data)
+            count += 1
+        
+        return count
+    
     def run_optimization_cycle(self) -> Dict[str, Any]:
         """Run automated optimization cycle"""
         return self.automated_optimizer.run_optimization_cycle()
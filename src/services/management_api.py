@@ -46,12 +46,18 @@ class ManagementAPI:
     def _setup_routes(self):
         """Setup all API routes"""
         
+        def force_refresh_requested() -> bool:
+            """Whether the request asked to bypass cached reports (?refresh=true)"""
+            return request.args.get('refresh', 'false').lower() in ('1', 'true', 'yes')
+        
         # Health check endpoints
         @self.app.route('/health', methods=['GET'])
         def health_check():
             """Simple health check endpoint"""
             try:
-                health_summary = self.management_interface.get_health_summary()
+                health_summary = self.management_interface.get_health_summary(
+                    force_refresh=force_refresh_requested()
+                )
                 status_code = 200 if health_summary['status'] in ['healthy', 'degraded'] else 503
                 return jsonify(health_summary), status_code
             except Exception as e:
@@ -62,7 +68,9 @@ class ManagementAPI:
         def detailed_health_check():
             """Detailed health check endpoint"""
             try:
-                health_check = self.management_interface.perform_health_check()
+                health_check = self.management_interface.perform_health_check(
+                    force_refresh=force_refresh_requested()
+                )
                 status_code = 200 if health_check['overall_status'] in ['healthy', 'degraded'] else 503
                 return jsonify(health_check), status_code
             except Exception as e:
@@ -74,7 +82,9 @@ class ManagementAPI:
         def get_status():
             """Get system status"""
             try:
-                status = self.management_interface.get_system_status()
+                status = self.management_interface.get_system_status(
+                    force_refresh=force_refresh_requested()
+                )
                 return jsonify(status), 200
             except Exception as e:
                 logger.error(f"Status endpoint error: {str(e)}")
@@ -269,11 +279,11 @@ class ManagementAPI:
                 'timestamp': datetime.now().isoformat(),
                 'endpoints': {
                     'health': {
-                        'GET /health': 'Simple health check',
-                        'GET /health/detailed': 'Detailed health check'
+                        'GET /health?refresh=false': 'Simple health check',
+                        'GET /health/detailed?refresh=false': 'Detailed health check'
                     },
                     'monitoring': {
-                        'GET /status': 'System status',
+                        'GET /status?refresh=false': 'System status',
                         'GET /metrics?hours=24': 'Performance metrics',
                         'GET /activity?limit=20': 'Recent activity'
                     },
@@ -4,25 +4,126 @@ Management interface for configuration, monitoring, and control of the Bluesky c
 """
 import json
 import logging
+import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterable, NamedTuple
 from dataclasses import asdict
 from pathlib import Path
 
 from ..config.agent_config import AgentConfig
 from ..utils.metrics_collector import get_metrics_collector
 from ..utils.alert_system import get_alert_manager
+from ..utils.serialization import dumps_bytes, loads
 from ..models.data_models import GeneratedContent, PostResult
 
 logger = logging.getLogger(__name__)
 
 
+class ConfigConstraint(NamedTuple):
+    """A single configuration validation rule"""
+    name: str
+    fields: Tuple[str, ...]
+    check: Callable[[AgentConfig], Optional[str]]
+    required: bool = False
+    cacheable: bool = True
+
+
+def _freeze(value: Any) -> Any:
+    """Convert list values to tuples so constraint inputs can be compared after mutation"""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _check_log_file_path(config: AgentConfig) -> Optional[str]:
+    """Ensure the log file directory exists or can be created"""
+    try:
+        Path(config.log_file_path).parent.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        return f"Invalid log file path: {str(e)}"
+    return None
+
+
+# Validation rules in reporting order, required settings first
+CONFIG_CONSTRAINTS: Tuple[ConfigConstraint, ...] = (
+    ConfigConstraint(
+        'perplexity_api_key', ('perplexity_api_key',),
+        lambda c: None if c.perplexity_api_key else "PERPLEXITY_API_KEY is required",
+        required=True),
+    ConfigConstraint(
+        'bluesky_username', ('bluesky_username',),
+        lambda c: None if c.bluesky_username else "BLUESKY_USERNAME is required",
+        required=True),
+    ConfigConstraint(
+        'bluesky_password', ('bluesky_password',),
+        lambda c: None if c.bluesky_password else "BLUESKY_PASSWORD is required",
+        required=True),
+    
+    # Numeric ranges
+    ConfigConstraint(
+        'posting_interval_minimum', ('posting_interval_minutes',),
+        lambda c: "posting_interval_minutes must be at least 1" if c.posting_interval_minutes < 1 else None),
+    ConfigConstraint(
+        'max_execution_time_minimum', ('max_execution_time_minutes',),
+        lambda c: "max_execution_time_minutes must be at least 1" if c.max_execution_time_minutes < 1 else None),
+    ConfigConstraint(
+        'max_post_length_minimum', ('max_post_length',),
+        lambda c: "max_post_length must be at least 50 characters" if c.max_post_length < 50 else None),
+    ConfigConstraint(
+        'min_engagement_score_range', ('min_engagement_score',),
+        lambda c: None if 0.0 <= c.min_engagement_score <= 1.0
+        else "min_engagement_score must be between 0.0 and 1.0"),
+    ConfigConstraint(
+        'duplicate_threshold_range', ('duplicate_threshold',),
+        lambda c: None if 0.0 <= c.duplicate_threshold <= 1.0
+        else "duplicate_threshold must be between 0.0 and 1.0"),
+    ConfigConstraint(
+        'max_retries_minimum', ('max_retries',),
+        lambda c: "max_retries must be non-negative" if c.max_retries < 0 else None),
+    ConfigConstraint(
+        'news_cache_ttl_minimum', ('news_cache_ttl_seconds',),
+        lambda c: "news_cache_ttl_seconds must be non-negative" if c.news_cache_ttl_seconds < 0 else None),
+    ConfigConstraint(
+        'max_concurrent_llm_calls_minimum', ('max_concurrent_llm_calls',),
+        lambda c: "max_concurrent_llm_calls must be at least 1" if c.max_concurrent_llm_calls < 1 else None),
+    ConfigConstraint(
+        'max_concurrent_posts_minimum', ('max_concurrent_posts',),
+        lambda c: "max_concurrent_posts must be at least 1" if c.max_concurrent_posts < 1 else None),
+    
+    # Content themes
+    ConfigConstraint(
+        'content_themes_present', ('content_themes',),
+        lambda c: None if c.content_themes else "content_themes cannot be empty"),
+    
+    # Additional custom validations
+    ConfigConstraint(
+        'posting_interval_rate_limit', ('posting_interval_minutes',),
+        lambda c: "Posting interval should be at least 5 minutes for rate limiting"
+        if c.posting_interval_minutes < 5 else None),
+    ConfigConstraint(
+        'execution_time_within_interval', ('max_execution_time_minutes', 'posting_interval_minutes'),
+        lambda c: "Max execution time should be less than posting interval"
+        if c.max_execution_time_minutes >= c.posting_interval_minutes else None),
+    
+    # Depends on the filesystem, so always re-checked
+    ConfigConstraint('log_file_path', ('log_file_path',), _check_log_file_path, cacheable=False),
+    
+    ConfigConstraint(
+        'content_themes_limit', ('content_themes',),
+        lambda c: "Too many content themes (max 10 recommended)" if len(c.content_themes) > 10 else None),
+)
+
+
 class ManagementInterface:
     """
     Provides configuration management, status reporting, and control capabilities
     for the Bluesky crypto agent system
     """
     
+    # How long cached status reports are served before being rebuilt (seconds).
+    # The detailed health check backs /health/detailed, so it must stay fresh too.
+    STATUS_CACHE_TTL_SECONDS = 5.0
+    HEALTH_CHECK_CACHE_TTL_SECONDS = 30.0
+    
     def __init__(self, agent=None, scheduler=None):
         """
         Initialize the management interface
@@ -31,11 +132,17 @@ class ManagementInterface:
             agent: BlueskyCryptoAgent instance (optional)
             scheduler: SchedulerService instance (optional)
         """
+        # Constraint name -> (constraint inputs, error message or None)
+        self._constraint_results: Dict[str, Tuple[tuple, Optional[str]]] = {}
+        # Report name -> (monotonic expiry time, cached report)
+        self._report_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self.agent = agent
         self.scheduler = scheduler
         self.metrics_collector = get_metrics_collector()
         self.alert_manager = get_alert_manager()
         self.manual_overrides = {}
+        # Called with (override type, expiry time or None when removed) on every override change
+        self._override_subscribers: List[Callable[[str, Optional[datetime]], None]] = []
         self.system_status = {
             'initialized_at': datetime.now(),
             'last_health_check': None,
@@ -44,6 +151,42 @@ class ManagementInterface:
         
         logger.info("ManagementInterface initialized")
     
+    @property
+    def agent(self):
+        """Agent instance being managed"""
+        return self._agent
+    
+    @agent.setter
+    def agent(self, agent):
+        self._agent = agent
+        self.invalidate_report_cache()
+    
+    @property
+    def scheduler(self):
+        """Scheduler instance being managed"""
+        return self._scheduler
+    
+    @scheduler.setter
+    def scheduler(self, scheduler):
+        self._scheduler = scheduler
+        self.invalidate_report_cache()
+    
+    def invalidate_report_cache(self):
+        """Drop cached status and health reports so the next request rebuilds them"""
+        self._report_cache.clear()
+    
+    def _get_cached_report(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached report if it has not expired yet"""
+        entry = self._report_cache.get(name)
+        if entry is not None and time.monotonic() < entry[0]:
+            return dict(entry[1])
+        return None
+    
+    def _cache_report(self, name: str, report: Dict[str, Any], ttl_seconds: float) -> Dict[str, Any]:
+        """Store a report in the cache and return a copy, so callers can't alter the cached one"""
+        self._report_cache[name] = (time.monotonic() + ttl_seconds, report)
+        return dict(report)
+    
     def set_agent(self, agent):
         """Set the agent instance"""
         self.agent = agent
@@ -55,12 +198,18 @@ class ManagementInterface:
         logger.info("Scheduler instance set in management interface")
     
     # Configuration Management
-    def validate_configuration(self, config: AgentConfig) -> Tuple[bool, List[str]]:
+    def validate_configuration(self, config: AgentConfig,
+                               fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate agent configuration
         
+        Constraints are evaluated in CONFIG_CONSTRAINTS order. Results of
+        constraints whose inputs are unchanged since the previous validation
+        are reused instead of being re-evaluated.
+        
         Args:
             config: AgentConfig instance to validate
+            fail_fast: Stop at the first missing required setting
             
         Returns:
             Tuple of (is_valid, list_of_errors)
@@ -70,56 +219,21 @@ class ManagementInterface:
         errors = []
         
         try:
-            # Check required API keys
-            if not config.perplexity_api_key:
-                errors.append("PERPLEXITY_API_KEY is required")
-                
-            if not config.bluesky_username:
-                errors.append("BLUESKY_USERNAME is required")
-                
-            if not config.bluesky_password:
-                errors.append("BLUESKY_PASSWORD is required")
-                
-            # Validate numeric ranges
-            if config.posting_interval_minutes < 1:
-                errors.append("posting_interval_minutes must be at least 1")
-                
-            if config.max_execution_time_minutes < 1:
-                errors.append("max_execution_time_minutes must be at least 1")
-                
-            if config.max_post_length < 50:
-                errors.append("max_post_length must be at least 50 characters")
-                
-            if not (0.0 <= config.min_engagement_score <= 1.0):
-                errors.append("min_engagement_score must be between 0.0 and 1.0")
+            for constraint in CONFIG_CONSTRAINTS:
+                inputs = tuple(_freeze(getattr(config, name)) for name in constraint.fields)
+                cached = self._constraint_results.get(constraint.name)
                 
-            if not (0.0 <= config.duplicate_threshold <= 1.0):
-                errors.append("duplicate_threshold must be between 0.0 and 1.0")
-                
-            if config.max_retries < 0:
-                errors.append("max_retries must be non-negative")
+                if constraint.cacheable and cached is not None and cached[0] == inputs:
+                    error = cached[1]
+                else:
+                    error = constraint.check(config)
+                    if constraint.cacheable:
+                        self._constraint_results[constraint.name] = (inputs, error)
                 
-            # Validate content themes
-            if not config.content_themes:
-                errors.append("content_themes cannot be empty")
-            
-            # Additional custom validations
-            if config.posting_interval_minutes < 5:
-                errors.append("Posting interval should be at least 5 minutes for rate limiting")
-            
-            if config.max_execution_time_minutes >= config.posting_interval_minutes:
-                errors.append("Max execution time should be less than posting interval")
-            
-            # Validate log file path
-            try:
-                log_path = Path(config.log_file_path)
-                log_path.parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append(f"Invalid log file path: {str(e)}")
-            
-            # Check content themes
-            if len(config.content_themes) > 10:
-                errors.append("Too many content themes (max 10 recommended)")
+                if error:
+                    errors.append(error)
+                    if fail_fast and constraint.required:
+                        break
             
             is_valid = len(errors) == 0
             
@@ -148,8 +262,7 @@ class ManagementInterface:
             if not config_file.exists():
                 return None, [f"Configuration file not found: {config_path}"]
             
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = loads(config_file.read_bytes())
             
             # Create AgentConfig from loaded data
             config = AgentConfig(**config_data)
@@ -205,9 +318,13 @@ class ManagementInterface:
             # Ensure directory exists
             config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Save configuration
-            with open(config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2, default=str)
+            # Save configuration with a single write
+            data = dumps_bytes(config_dict, indent=True)
+            fd = os.open(config_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
             
             logger.info("Configuration saved successfully")
             return True, []
@@ -218,13 +335,23 @@ class ManagementInterface:
             return False, [error_msg]
     
     # Status Reporting and Monitoring
-    def get_system_status(self) -> Dict[str, Any]:
+    def get_system_status(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive system status
         
+        Reports are cached for STATUS_CACHE_TTL_SECONDS.
+        
+        Args:
+            force_refresh: Rebuild the report even if a cached one is available
+            
         Returns:
             Dictionary containing system status information
         """
+        if not force_refresh:
+            cached = self._get_cached_report('system_status')
+            if cached is not None:
+                return cached
+        
         logger.debug("Generating system status report")
         
         status = {
@@ -289,7 +416,7 @@ class ManagementInterface:
             'overrides': list(self.manual_overrides.keys())
         }
         
-        return status
+        return self._cache_report('system_status', status, self.STATUS_CACHE_TTL_SECONDS)
     
     def get_performance_metrics(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -416,24 +543,55 @@ class ManagementInterface:
         logger.info(f"Setting manual override: {override_type} = {value} for {duration_minutes} minutes")
         
         try:
-            expiry_time = datetime.now() + timedelta(minutes=duration_minutes)
-            
-            self.manual_overrides[override_type] = {
-                'value': value,
-                'set_at': datetime.now(),
-                'expires_at': expiry_time,
-                'duration_minutes': duration_minutes
-            }
-            
-            # Log the override for audit purposes
-            logger.warning(f"Manual override activated: {override_type} = {value} (expires: {expiry_time})")
-            
+            self._apply_override(override_type, value, duration_minutes, datetime.now())
+            self.invalidate_report_cache()
             return True
             
         except Exception as e:
             logger.error(f"Error setting manual override: {str(e)}")
             return False
     
+    def _apply_override(self, override_type: str, value: Any, duration_minutes: int, now: datetime):
+        """
+        Record one manual override and notify subscribers; callers invalidate the report cache
+        
+        Args:
+            override_type: Type of override
+            value: Override value
+            duration_minutes: How long the override should last
+            now: Time the override is set at
+        """
+        expiry_time = now + timedelta(minutes=duration_minutes)
+        
+        self.manual_overrides[override_type] = {
+            'value': value,
+            'set_at': now,
+            'expires_at': expiry_time,
+            'duration_minutes': duration_minutes
+        }
+        self._notify_override_change(override_type, expiry_time)
+        
+        # Log the override for audit purposes
+        logger.warning(f"Manual override activated: {override_type} = {value} (expires: {expiry_time})")
+    
+    def _drop_override(self, override_type: str) -> bool:
+        """
+        Remove one manual override and notify subscribers; callers invalidate the report cache
+        
+        Args:
+            override_type: Type of override to remove
+            
+        Returns:
+            True if the override was found and removed
+        """
+        if self.manual_overrides.pop(override_type, None) is None:
+            logger.warning(f"Manual override not found: {override_type}")
+            return False
+        
+        self._notify_override_change(override_type, None)
+        logger.info(f"Manual override removed: {override_type}")
+        return True
+    
     def remove_manual_override(self, override_type: str) -> bool:
         """
         Remove a manual override
@@ -447,18 +605,63 @@ class ManagementInterface:
         logger.info(f"Removing manual override: {override_type}")
         
         try:
-            if override_type in self.manual_overrides:
-                del self.manual_overrides[override_type]
-                logger.info(f"Manual override removed: {override_type}")
+            if self._drop_override(override_type):
+                self.invalidate_report_cache()
                 return True
-            else:
-                logger.warning(f"Manual override not found: {override_type}")
-                return False
+            return False
                 
         except Exception as e:
             logger.error(f"Error removing manual override: {str(e)}")
             return False
     
+    def set_manual_overrides(self, overrides: Dict[str, Tuple[Any, int]]) -> Dict[str, bool]:
+        """
+        Set several manual overrides in one call
+        
+        Args:
+            overrides: Mapping of override type to (value, duration_minutes)
+            
+        Returns:
+            Mapping of override type to whether it was set successfully
+        """
+        logger.info(f"Setting {len(overrides)} manual overrides: {', '.join(overrides)}")
+        
+        now = datetime.now()
+        results = {}
+        
+        for override_type, (value, duration_minutes) in overrides.items():
+            try:
+                self._apply_override(override_type, value, duration_minutes, now)
+                results[override_type] = True
+            except Exception as e:
+                logger.error(f"Error setting manual override {override_type}: {str(e)}")
+                results[override_type] = False
+        
+        if any(results.values()):
+            self.invalidate_report_cache()
+        
+        return results
+    
+    def remove_manual_overrides(self, override_types: Iterable[str]) -> Dict[str, bool]:
+        """
+        Remove several manual overrides in one call
+        
+        Args:
+            override_types: Types of overrides to remove
+            
+        Returns:
+            Mapping of override type to whether it was found and removed
+        """
+        results = {}
+        
+        for override_type in override_types:
+            results[override_type] = self._drop_override(override_type)
+        
+        if any(results.values()):
+            self.invalidate_report_cache()
+        
+        return results
+    
     def get_active_overrides(self) -> Dict[str, Any]:
         """
         Get all active manual overrides
@@ -493,6 +696,26 @@ class ManagementInterface:
         else:
             return False, None
     
+    def subscribe_overrides(self, callback: Callable[[str, Optional[datetime]], None]) -> None:
+        """
+        Register a callback to be told about manual override changes
+        
+        The callback receives (override_type, expires_at) when an override is set
+        and (override_type, None) when it is removed or found expired. It is called
+        straight away for every override already set.
+        
+        Args:
+            callback: Function receiving override changes
+        """
+        self._override_subscribers.append(callback)
+        for override_type, override in self.manual_overrides.items():
+            callback(override_type, override['expires_at'])
+    
+    def _notify_override_change(self, override_type: str, expires_at: Optional[datetime]):
+        """Pass an override change to every subscriber"""
+        for callback in self._override_subscribers:
+            callback(override_type, expires_at)
+    
     def _cleanup_expired_overrides(self):
         """Clean up expired manual overrides"""
         now = datetime.now()
@@ -505,15 +728,29 @@ class ManagementInterface:
         for key in expired_keys:
             logger.info(f"Manual override expired: {key}")
             del self.manual_overrides[key]
+            self._notify_override_change(key, None)
+        
+        if expired_keys:
+            self.invalidate_report_cache()
     
     # Health Check Endpoints
-    def perform_health_check(self) -> Dict[str, Any]:
+    def perform_health_check(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive health check
         
+        Results are cached for HEALTH_CHECK_CACHE_TTL_SECONDS.
+        
+        Args:
+            force_refresh: Run the checks even if a cached result is available
+            
         Returns:
             Dictionary containing health check results
         """
+        if not force_refresh:
+            cached = self._get_cached_report('health_check')
+            if cached is not None:
+                return cached
+        
         logger.info("Performing system health check")
         
         health_check = {
@@ -642,18 +879,32 @@ class ManagementInterface:
         
         logger.info(f"Health check completed: {health_check['overall_status']} ({len(issues)} issues)")
         
-        return health_check
+        # Reports derived from the previous health status are now stale
+        self.invalidate_report_cache()
+        return self._cache_report('health_check', health_check, self.HEALTH_CHECK_CACHE_TTL_SECONDS)
     
-    def get_health_summary(self) -> Dict[str, Any]:
+    def get_health_summary(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get a simple health summary for quick checks
         
+        Summaries are cached for STATUS_CACHE_TTL_SECONDS.
+        
+        Args:
+            force_refresh: Rebuild the summary even if a cached one is available
+            
         Returns:
             Dictionary containing basic health information
         """
-        return {
+        if not force_refresh:
+            cached = self._get_cached_report('health_summary')
+            if cached is not None:
+                return cached
+        
+        summary = {
             'status': self.system_status['health_status'],
             'last_check': self.system_status['last_health_check'].isoformat() if self.system_status['last_health_check'] else None,
             'uptime_seconds': (datetime.now() - self.system_status['initialized_at']).total_seconds(),
             'timestamp': datetime.now().isoformat()
-        }
\ No newline at end of file
+        }
+        
+        return self._cache_report('health_summary', summary, self.STATUS_CACHE_TTL_SECONDS)
\ No newline at end of file
@@ -3,7 +3,6 @@
 Scheduling service for automated Bluesky crypto agent execution
 """
 import schedule
-import time
 import logging
 import asyncio
 import signal
@@ -25,6 +24,9 @@ class SchedulerService:
     with configurable intervals, timeout handling, and graceful shutdown
     """
     
+    # Longest the scheduler loop sleeps before re-checking the schedule (seconds)
+    MAX_IDLE_SECONDS = 60.0
+    
     def __init__(self, agent_workflow: Callable, interval_minutes: int = 30, 
                  max_execution_time_minutes: int = 25):
         """
@@ -44,6 +46,8 @@ class SchedulerService:
         self.last_execution_time = None
         self.last_execution_success = None
         self.shutdown_event = threading.Event()
+        # Wakes the scheduler loop early when stopping or rescheduling
+        self._wakeup_event = threading.Event()
         
         # Monitoring and metrics
         self.metrics_collector = get_metrics_collector()
@@ -98,7 +102,9 @@ class SchedulerService:
         try:
             while self.is_running and not self.shutdown_event.is_set():
                 schedule.run_pending()
-                time.sleep(1)
+                # Sleep until the next job is due instead of polling every second
+                self._wakeup_event.wait(self._seconds_until_next_run())
+                self._wakeup_event.clear()
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received, shutting down gracefully")
         finally:
@@ -109,6 +115,7 @@ class SchedulerService:
         logger.info("Initiating graceful shutdown of scheduler")
         self.is_running = False
         self.shutdown_event.set()
+        self._wakeup_event.set()
         
         # Wait for current execution to complete if running
         if self.current_execution_thread and self.current_execution_thread.is_alive():
@@ -118,6 +125,19 @@ class SchedulerService:
         schedule.clear()
         logger.info("Scheduler stopped gracefully")
         
+    def _seconds_until_next_run(self) -> float:
+        """Seconds until the next scheduled job, clamped to [0, MAX_IDLE_SECONDS]"""
+        next_run = schedule.next_run()
+        if next_run is None:
+            return self.MAX_IDLE_SECONDS
+        
+        timeout = (next_run - datetime.now()).total_seconds()
+        if timeout < 0:
+            timeout = 0.0
+        elif timeout > self.MAX_IDLE_SECONDS:
+            timeout = self.MAX_IDLE_SECONDS
+        return timeout
+        
     def _cleanup(self):
         """Cleanup resources"""
         if self.current_execution_thread and self.current_execution_thread.is_alive():
@@ -227,4 +247,5 @@ class SchedulerService:
         if self.is_running:
             schedule.clear()
             schedule.every(self.interval_minutes).minutes.do(self._run_workflow_wrapper)
+            self._wakeup_event.set()
             logger.info("Schedule updated successfully")
\ No newline at end of file
@@ -33,6 +33,8 @@ class BlueskySocialTool(Tool):
     
     _max_retries: int = PrivateAttr(default=2)
     _client: Optional[Client] = PrivateAttr(default=None)
+    # AT Protocol client kept across logins so its HTTP connection pool is reused
+    _pooled_client: Optional[Client] = PrivateAttr(default=None)
     _authenticated_user: Optional[str] = PrivateAttr(default=None)
     
     def __init__(self, max_retries: int = 2, **kwargs):
@@ -45,6 +47,7 @@ class BlueskySocialTool(Tool):
         )
         self._max_retries = max_retries
         self._client = None
+        self._pooled_client = None
         self._authenticated_user = None
     
     @property
@@ -122,6 +125,27 @@ class BlueskySocialTool(Tool):
         # Should not reach here, but safety fallback
         return self._create_error_result(content, "Unknown error occurred", self.max_retries + 1)
     
+    def ensure_authenticated(self, username: str, password: str) -> bool:
+        """
+        Log in ahead of posting when there is no valid session
+        
+        Failures are logged rather than raised; _run() authenticates again if needed.
+        
+        Args:
+            username: Bluesky username
+            password: Bluesky password
+            
+        Returns:
+            True if a valid session is available
+        """
+        try:
+            if not self._is_authenticated(username):
+                self._authenticate(username, password)
+            return True
+        except Exception as e:
+            logger.warning(f"Bluesky pre-authentication failed: {str(e)}")
+            return False
+    
     def _is_authenticated(self, username: str) -> bool:
         """Check if we have a valid authenticated session"""
         return (self.client is not None and 
@@ -145,11 +169,13 @@ class BlueskySocialTool(Tool):
         logger.info(f"Authenticating with Bluesky for user: {username}")
         
         try:
-            # Create new client instance
-            self.client = Client()
+            # Reuse the pooled client so re-authentication doesn't open a new HTTP connection pool
+            if self._pooled_client is None:
+                self._pooled_client = Client()
             
             # Login with credentials
-            self.client.login(username, password)
+            self._pooled_client.login(username, password)
+            self.client = self._pooled_client
             self.authenticated_user = username
             
             logger.info("Successfully authenticated with Bluesky")
@@ -218,6 +244,17 @@ class BlueskySocialTool(Tool):
             'error_message': error_message
         }
     
+    def close(self) -> None:
+        """Close the pooled AT Protocol client and drop the session"""
+        client = self._pooled_client
+        self._pooled_client = None
+        self.client = None
+        self.authenticated_user = None
+        
+        request = getattr(client, 'request', None)
+        if request is not None and hasattr(request, 'close'):
+            request.close()
+    
     async def _arun(self, content: str, username: str, password: str) -> Dict[str, Any]:
         """Async version of _run method"""
         return self._run(content, username, password)
\ No newline at end of file
@@ -5,7 +5,7 @@ ContentGenerationTool - AI-powered content generation tool for creating viral cr
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from dataclasses import asdict
 
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field, PrivateAttr
 from ..models.data_models import NewsItem, GeneratedContent, ContentType
 from ..config.agent_config import AgentConfig
 from ..services.ab_testing_framework import ContentStrategy
+from ..utils.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -264,12 +265,13 @@ class ContentGenerationTool(Tool):
     def strategies(self) -> ViralContentStrategies:
         return self._strategies
     
-    def _run(self, news_data: str, content_type: str = "news", target_engagement: float = 0.8) -> str:
+    def _run(self, news_data: Union[str, Dict[str, Any], List[Dict[str, Any]]],
+             content_type: str = "news", target_engagement: float = 0.8) -> str:
         """
         Generate viral content from news data
         
         Args:
-            news_data: JSON string containing news items
+            news_data: News items as a JSON string, or already parsed when called in-process
             content_type: Type of content to generate
             target_engagement: Target engagement score
             
@@ -308,7 +310,7 @@ class ContentGenerationTool(Tool):
                     text=optimized_text,
                     hashtags=optimized_hashtags,
                     engagement_score=engagement_score,
-                    content_type=ContentType(content_type),
+                    content_type=ContentType.from_value(content_type),
                     source_news=primary_news,
                     metadata={
                         "generation_strategy": content_type,
@@ -329,21 +331,23 @@ class ContentGenerationTool(Tool):
             
             logger.info(f"Generated content with engagement score: {best_content.engagement_score:.2f}")
             
-            return json.dumps({
+            return dumps({
                 "success": True,
                 "content": best_content.to_dict(),
-                "alternatives": [content.to_dict() for content in generated_contents if content != best_content]
-            }, indent=2)
+                # Identity check; dataclass equality would compare every field of every alternative
+                "alternatives": [content.to_dict() for content in generated_contents if content is not best_content]
+            }, indent=True)
             
         except Exception as e:
             error_msg = f"Error generating content: {str(e)}"
             logger.error(error_msg)
             return self._create_error_result(error_msg)
     
-    def _parse_news_data(self, news_data: str) -> List[NewsItem]:
-        """Parse news data from JSON string"""
+    def _parse_news_data(self, news_data: Union[str, Dict[str, Any], List[Dict[str, Any]]]) -> List[NewsItem]:
+        """Parse news data from a JSON string or already parsed news data"""
         try:
-            data = json.loads(news_data)
+            # In-process callers pass parsed data; skip the JSON round trip for them
+            data = loads(news_data) if isinstance(news_data, (str, bytes)) else news_data
             
             if isinstance(data, dict) and "news_items" in data:
                 news_items_data = data["news_items"]
@@ -356,9 +360,12 @@ class ContentGenerationTool(Tool):
             news_items = []
             for item_data in news_items_data:
                 try:
-                    # Convert timestamp string back to datetime
+                    # Convert timestamp string back to datetime without mutating the caller's data
                     if isinstance(item_data.get("timestamp"), str):
-                        item_data["timestamp"] = datetime.fromisoformat(item_data["timestamp"].replace("Z", "+00:00"))
+                        item_data = {
+                            **item_data,
+                            "timestamp": datetime.fromisoformat(item_data["timestamp"])
+                        }
                     
                     news_item = NewsItem(**item_data)
                     news_items.append(news_item)
@@ -659,14 +666,15 @@ class ContentGenerationTool(Tool):
     
     def _create_error_result(self, error_message: str) -> str:
         """Create error result JSON"""
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": error_message,
             "content": None,
             "alternatives": []
-        }, indent=2)
+        }, indent=True)
     
-    async def _arun(self, news_data: str, content_type: str = "news", target_engagement: float = 0.8) -> str:
+    async def _arun(self, news_data: Union[str, Dict[str, Any], List[Dict[str, Any]]],
+                    content_type: str = "news", target_engagement: float = 0.8) -> str:
         """Async version of _run method"""
         return self._run(news_data, content_type, target_engagement)
 
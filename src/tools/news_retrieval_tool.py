@@ -4,7 +4,6 @@ NewsRetrievalTool for integrating with Perplexity API to retrieve cryptocurrency
 Enhanced with circuit breaker pattern and comprehensive error handling
 """
 import asyncio
-import json
 import logging
 import time
 from datetime import datetime
@@ -16,6 +15,7 @@ from ..models.data_models import NewsItem
 from ..config.agent_config import AgentConfig
 from ..utils.circuit_breaker import circuit_breaker, CircuitBreakerConfig, CircuitBreakerError
 from ..utils.error_handler import handle_errors, ErrorContext, get_error_handler
+from ..utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +51,10 @@ class PerplexityAPIClient:
             failure_status_codes=(429, 500, 502, 503, 504)
         )
     
+    def close(self):
+        """Close the pooled HTTP session"""
+        self.session.close()
+    
     def _calculate_backoff_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay"""
         return min(2 ** attempt, 30)  # Cap at 30 seconds
@@ -461,7 +465,7 @@ class NewsRetrievalTool:
                 }
                 logger.warning("No relevant news items found")
             
-            return json.dumps(result, indent=2)
+            return dumps(result, indent=True)
             
         except Exception as e:
             error_msg = f"Error retrieving news: {str(e)}"
@@ -474,7 +478,7 @@ class NewsRetrievalTool:
                 "error": error_msg
             }
             
-            return json.dumps(error_result, indent=2)
+            return dumps(error_result, indent=True)
     
     async def _arun(self, query: str) -> str:
         """
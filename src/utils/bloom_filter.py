@@ -0,0 +1,104 @@
+# src/utils/bloom_filter.py
+"""
+Compact Bloom filter for remembering which news items have already been processed
+"""
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Union
+
+# File header: magic, bit count, hash count, items added
+_HEADER = struct.Struct(">4sQIQ")
+_MAGIC = b"BLM1"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings
+
+    Membership tests may return false positives at roughly the configured error
+    rate once `capacity` items have been added, but never false negatives.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false positive rate at capacity
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be between 0.0 and 1.0")
+
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._init_bits(num_bits, num_hashes)
+
+    def _init_bits(self, num_bits: int, num_hashes: int, bits: bytearray = None, count: int = 0):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, item: str):
+        # Double hashing: derive all k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter"""
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        """Number of items added (including duplicates)"""
+        return self.count
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the filter to disk atomically
+
+        Args:
+            path: Destination file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.count))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BloomFilter":
+        """
+        Read a filter previously written with save()
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid Bloom filter
+        """
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Bloom filter file is truncated: {path}")
+
+        magic, num_bits, num_hashes, count = _HEADER.unpack_from(data)
+        bits = bytearray(data[_HEADER.size:])
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8 or num_hashes < 1:
+            raise ValueError(f"Invalid Bloom filter file: {path}")
+
+        bloom = cls.__new__(cls)
+        bloom._init_bits(num_bits, num_hashes, bits, count)
+        return bloom
@@ -70,6 +70,20 @@ class StructuredFormatter(logging.Formatter):
         return json.dumps(log_entry, ensure_ascii=False)
 
 
+class ContextLoggerAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter that adds a fixed context to every record's extra fields
+    
+    Unlike logging.LoggerAdapter, extra fields passed to an individual call are
+    kept and take precedence over the adapter's context.
+    """
+    
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+
 class LoggingConfig:
     """
     Centralized logging configuration for the Bluesky Crypto Agent
@@ -59,6 +59,25 @@ class MetricSummary:
         return asdict(self)
 
 
+class MetricCounter:
+    """
+    Counter name and component bound once, for counters incremented on every run
+    
+    The counter key is built at construction, so incrementing through
+    MetricsCollector.increment() or MetricsBatch.increment() skips formatting it.
+    """
+    
+    __slots__ = ("name", "component", "key")
+    
+    def __init__(self, name: str, component: str = "unknown"):
+        self.name = name
+        self.component = component
+        self.key = f"{component}.{name}"
+    
+    def __repr__(self) -> str:
+        return f"MetricCounter({self.name!r}, {self.component!r})"
+
+
 class MetricsCollector:
     """
     Thread-safe metrics collection system with aggregation and reporting
@@ -137,6 +156,28 @@ class MetricsCollector:
         # Also record as a metric point
         self.record_metric(name, increment, "count", component, {"type": "counter"})
     
+    def increment(self, counter: MetricCounter, increment: int = 1) -> None:
+        """
+        Increment a pre-bound counter, recording its metric point under the same lock
+        
+        Args:
+            counter: Counter to increment
+            increment: Amount to increment by
+        """
+        metric_point = MetricPoint(
+            name=counter.name,
+            value=increment,
+            unit="count",
+            timestamp=datetime.now(),
+            component=counter.component,
+            tags={"type": "counter"}
+        )
+        
+        with self._lock:
+            self._counters[counter.key] += increment
+            self._metrics[counter.key].append(metric_point)
+            self._cleanup_old_metrics(counter.key)
+    
     def set_gauge(self, name: str, value: float, component: str = "unknown", unit: str = "value") -> None:
         """
         Set a gauge metric value
@@ -345,6 +386,44 @@ class MetricsCollector:
         index = int(percentile * (len(sorted_values) - 1))
         return sorted_values[index]
     
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that stages metric updates and applies them in one locked pass on exit
+        
+        Usage:
+            with metrics_collector.batch() as metrics:
+                metrics.increment_counter("api_calls", "news_service")
+        """
+        batch = MetricsBatch()
+        try:
+            yield batch
+        finally:
+            self.apply_batch(batch)
+    
+    def apply_batch(self, batch: "MetricsBatch") -> None:
+        """
+        Apply staged metric updates under a single lock acquisition
+        
+        Args:
+            batch: Staged counter, gauge and metric point updates
+        """
+        with self._lock:
+            for counter_key, increment in batch.counters.items():
+                self._counters[counter_key] += increment
+            self._gauges.update(batch.gauges)
+            
+            metric_keys = set()
+            for metric_point in batch.points:
+                metric_key = f"{metric_point.component}.{metric_point.name}"
+                self._metrics[metric_key].append(metric_point)
+                metric_keys.add(metric_key)
+            
+            for metric_key in metric_keys:
+                self._cleanup_old_metrics(metric_key)
+        
+        logger.debug(f"Applied metrics batch with {len(batch.points)} points")
+    
     @contextmanager
     def timer(self, name: str, component: str = "unknown", tags: Optional[Dict[str, str]] = None):
         """
@@ -369,6 +448,61 @@ class MetricsCollector:
             )
 
 
+class MetricsBatch:
+    """
+    Staged metric updates with the same recording API as MetricsCollector
+    
+    Nothing is visible in a collector until the batch is passed to apply_batch().
+    Not thread-safe; use one batch per task.
+    """
+    
+    def __init__(self):
+        self.points: List[MetricPoint] = []
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.gauges: Dict[str, float] = {}
+    
+    def record_metric(self, 
+                     name: str, 
+                     value: float, 
+                     unit: str = "count",
+                     component: str = "unknown",
+                     tags: Optional[Dict[str, str]] = None) -> None:
+        """Stage a metric data point, timestamped now"""
+        self.points.append(MetricPoint(
+            name=name,
+            value=value,
+            unit=unit,
+            timestamp=datetime.now(),
+            component=component,
+            tags=tags if tags is not None else {}
+        ))
+    
+    def increment_counter(self, name: str, component: str = "unknown", increment: int = 1) -> None:
+        """Stage a counter increment"""
+        self.counters[f"{component}.{name}"] += increment
+        self.record_metric(name, increment, "count", component, {"type": "counter"})
+    
+    def increment(self, counter: MetricCounter, increment: int = 1) -> None:
+        """Stage an increment of a pre-bound counter"""
+        self.counters[counter.key] += increment
+        self.points.append(MetricPoint(
+            name=counter.name,
+            value=increment,
+            unit="count",
+            timestamp=datetime.now(),
+            component=counter.component,
+            tags={"type": "counter"}
+        ))
+    
+    def set_gauge(self, name: str, value: float, component: str = "unknown", unit: str = "value") -> None:
+        """Stage a gauge value; the last value set wins"""
+        self.gauges[f"{component}.{name}"] = value
+        self.record_metric(name, value, unit, component, {"type": "gauge"})
+    
+    # Records the duration through self.record_metric, so it stages like everything else
+    timer = MetricsCollector.timer
+
+
 # Global metrics collector instance
 _global_metrics_collector: Optional[MetricsCollector] = None
 
@@ -0,0 +1,86 @@
+# src/utils/serialization.py
+"""
+JSON serialization helpers that use orjson when it is installed
+"""
+import json
+from enum import Enum
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# orjson options that make its output match the stdlib fallback: datetimes and
+# dataclasses go through _default like they do for json, and non-str keys are
+# converted to strings
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+
+def _default(obj: Any) -> Any:
+    """Convert types JSON doesn't support, the same way for both backends"""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _dumps_orjson(obj: Any, indent: bool) -> bytes:
+    option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+def _dumps_json(obj: Any, indent: bool) -> str:
+    # Compact separators and raw UTF-8 match orjson's output
+    if indent:
+        return json.dumps(obj, indent=2, default=_default, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), default=_default, ensure_ascii=False)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON
+    
+    Args:
+        obj: Object to serialize; enums are converted to their values and
+            other unsupported types with str()
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return _dumps_orjson(obj, indent)
+    return _dumps_json(obj, indent).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string
+    
+    Args:
+        obj: Object to serialize; enums are converted to their values and
+            other unsupported types with str()
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        JSON document as str
+    """
+    if orjson is not None:
+        return _dumps_orjson(obj, indent).decode('utf-8')
+    return _dumps_json(obj, indent)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document
+    
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
@@ -132,6 +132,44 @@ class TestTestMetrics:
         assert metrics.clicks == 8
         assert metrics.engagements == 18  # likes + reposts + replies
         assert metrics.avg_engagement_score == 0.85
+    
+    def test_engagement_score_variance_tracks_running_scores(self, sample_post_result):
+        """Test running mean and variance match a batch computation"""
+        import statistics
+        
+        metrics = TestMetrics(variant_id="test_variant")
+        scores = [0.85, 0.4, 0.6, 0.95]
+        
+        assert metrics.engagement_score_variance == 0.0
+        for score in scores:
+            sample_post_result.content.engagement_score = score
+            metrics.update_metrics(sample_post_result)
+        
+        assert metrics.avg_engagement_score == pytest.approx(statistics.mean(scores))
+        assert metrics.engagement_score_variance == pytest.approx(statistics.variance(scores))
+
+    
+    def test_concurrent_updates_are_not_lost(self, sample_post_result):
+        """Test concurrent recorders do not drop counter updates"""
+        import threading
+        
+        metrics = TestMetrics(variant_id="test_variant")
+        engagement_data = {"likes": 1, "reposts": 1, "replies": 1, "clicks": 1}
+        
+        def record():
+            for _ in range(500):
+                metrics.update_metrics(sample_post_result, engagement_data)
+        
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert metrics.impressions == 2000
+        assert metrics.engagements == 6000
+        assert metrics.clicks == 2000
+        assert metrics.avg_engagement_score == pytest.approx(0.85)
 
 
 class TestABTest:
@@ -197,6 +235,73 @@ class TestABTest:
         test.status = TestStatus.ACTIVE
         test.end_date = datetime.now() - timedelta(days=1)
         assert test.is_active() is False
+        
+        # Clearing or extending the end date reactivates it
+        test.end_date = None
+        assert test.is_active() is True
+        test.end_date = datetime.now() + timedelta(days=1)
+        assert test.is_active() is True
+    
+    def test_is_active_expires_at_end_date_after_suspend(self):
+        """Test is_active rechecks the wall clock even if the monotonic clock stalled"""
+        import time
+        
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, 0.5),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, 0.5)
+        ]
+        
+        test = ABTest(
+            id="test_1",
+            name="Test AB Test",
+            description="Test description",
+            variants=variants,
+            end_date=datetime.now() + timedelta(hours=1)
+        )
+        
+        assert test.is_active() is True
+        
+        # Two hours of wall time pass while the monotonic clock moves a few seconds
+        later = datetime.now() + timedelta(hours=2)
+        
+        class _SuspendedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return later
+        
+        with patch('src.services.ab_testing_framework.datetime', _SuspendedDatetime), \
+             patch('src.services.ab_testing_framework.time.monotonic',
+                   return_value=time.monotonic() + 5):
+            assert test.is_active() is False
+            assert test.select_variant() is None
+    
+    def test_ab_test_pickle_round_trip(self):
+        """Test a pickled test recomputes its activity in the new process"""
+        import pickle
+        
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, 0.5),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, 0.5)
+        ]
+        
+        test = ABTest(
+            id="test_1",
+            name="Test AB Test",
+            description="Test description",
+            variants=variants,
+            end_date=datetime.now() + timedelta(hours=1)
+        )
+        assert test.is_active() is True
+        
+        restored = pickle.loads(pickle.dumps(test))
+        
+        assert restored._end_recheck_at is None
+        assert restored.is_active() is True
+        restored.end_date = datetime.now() - timedelta(seconds=1)
+        assert restored.is_active() is False
+        # Metrics get a fresh lock and keep recording
+        restored.metrics["v1"].update_metrics(Mock(content=Mock(engagement_score=1.0)))
+        assert restored.metrics["v1"].impressions == 1
     
     def test_select_variant(self):
         """Test variant selection"""
@@ -220,6 +325,44 @@ class TestABTest:
         with patch('random.random', return_value=0.8):
             selected = test.select_variant()
             assert selected.id == "v2"
+    
+    def test_select_variant_weight_boundaries(self):
+        """Test variant selection at cumulative weight boundaries"""
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, weight=0.2),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, weight=0.3),
+            TestVariant("v3", "Variant 3", ContentStrategy.EDUCATIONAL, weight=0.5)
+        ]
+        
+        test = ABTest(
+            id="test_1",
+            name="Test AB Test",
+            description="Test description",
+            variants=variants
+        )
+        
+        for rand, expected in [(0.0, "v1"), (0.2, "v1"), (0.21, "v2"), (0.5, "v2"), (0.51, "v3"), (1.0, "v3")]:
+            with patch('random.random', return_value=rand):
+                assert test.select_variant().id == expected
+    
+    def test_select_variant_with_inexact_weights(self):
+        """Test selection stays in range when weights sum within tolerance of 1.0"""
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, weight=1 / 3),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, weight=1 / 3),
+            TestVariant("v3", "Variant 3", ContentStrategy.EDUCATIONAL, weight=0.3332)
+        ]
+        
+        test = ABTest(
+            id="test_1",
+            name="Test AB Test",
+            description="Test description",
+            variants=variants
+        )
+        
+        for rand, expected in [(0.0, "v1"), (0.34, "v2"), (0.9999999, "v3"), (1.0, "v3")]:
+            with patch('random.random', return_value=rand):
+                assert test.select_variant().id == expected
 
 
 class TestStatisticalAnalyzer:
@@ -250,6 +393,52 @@ class TestStatisticalAnalyzer:
         assert "effect_size" in result
         assert isinstance(result["is_significant"], bool)
     
+    def test_welch_from_moments_matches_raw_data(self):
+        """Test moment-based significance agrees with the raw-data calculation"""
+        import statistics
+        
+        variant_a = [0.5, 0.6, 0.7, 0.8, 0.9]
+        variant_b = [0.3, 0.4, 0.5, 0.6, 0.7, 0.2]
+        
+        expected = StatisticalAnalyzer.calculate_statistical_significance(variant_a, variant_b)
+        result = StatisticalAnalyzer.welch_from_moments(
+            statistics.mean(variant_a), statistics.variance(variant_a), len(variant_a),
+            statistics.mean(variant_b), statistics.variance(variant_b), len(variant_b)
+        )
+        
+        assert result == pytest.approx(expected)
+        assert StatisticalAnalyzer.welch_from_moments(0.5, 0.0, 1, 0.4, 0.0, 5)["p_value"] == 1.0
+    
+    def test_confidence_interval_matches_statistics_module(self):
+        """Test single-pass moments agree with the statistics module"""
+        import statistics
+        
+        data = [0.12, 0.5, 0.33, 0.97, 0.41, 0.66, 0.05]
+        mean = statistics.mean(data)
+        margin = 2.0 * statistics.stdev(data) / len(data) ** 0.5
+        
+        ci = StatisticalAnalyzer.calculate_confidence_interval(data, 0.95)
+        
+        assert ci == pytest.approx((mean - margin, mean + margin))
+    
+    def test_p_value_uses_t_distribution(self):
+        """Test p-values match Student's t critical values"""
+        # Equal variances and sizes give df = 2n - 2; t = 2.228 is the 5% critical value at df = 10
+        se = (2 * 0.1 / 6) ** 0.5
+        result = StatisticalAnalyzer.welch_from_moments(0.5 + 2.228 * se, 0.1, 6, 0.5, 0.1, 6)
+        
+        assert result["degrees_of_freedom"] == pytest.approx(10.0)
+        assert result["t_statistic"] == pytest.approx(2.228)
+        assert result["p_value"] == pytest.approx(0.05, abs=1e-4)
+        
+        strong = StatisticalAnalyzer.welch_from_moments(0.9, 0.01, 50, 0.5, 0.01, 50)
+        assert strong["p_value"] < 0.001
+        assert strong["is_significant"] is True
+        
+        weak = StatisticalAnalyzer.welch_from_moments(0.52, 0.1, 10, 0.5, 0.1, 10)
+        assert weak["p_value"] > 0.5
+        assert weak["is_significant"] is False
+    
     def test_insufficient_data_handling(self):
         """Test handling of insufficient data"""
         variant_a = [0.5]
@@ -354,6 +543,36 @@ class TestABTestingFramework:
         assert metrics.reposts == 5
         assert metrics.replies == 3
     
+    def test_record_results_batch(self, sample_post_result):
+        """Test recording a batch of results across tests"""
+        framework = ABTestingFramework()
+        
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, 0.5),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, 0.5)
+        ]
+        
+        test_a = framework.create_test("Test A", "Description", variants)
+        test_b = framework.create_test("Test B", "Description", variants)
+        
+        with patch.object(framework, '_check_test_completion',
+                          wraps=framework._check_test_completion) as check:
+            framework.record_results([
+                (test_a, "v1", sample_post_result, {"likes": 2}),
+                (test_a, "v2", sample_post_result, None),
+                (test_b, "v1", sample_post_result, {"likes": 1}),
+                (test_a, "v1", sample_post_result, {"likes": 3}),
+                ("missing", "v1", sample_post_result, None),
+                (test_b, "unknown", sample_post_result, None)
+            ])
+        
+        assert [c.args[0] for c in check.call_args_list] == [test_a, test_b]
+        assert framework.active_tests[test_a].metrics["v1"].impressions == 2
+        assert framework.active_tests[test_a].metrics["v1"].likes == 5
+        assert framework.active_tests[test_a].metrics["v2"].impressions == 1
+        assert framework.active_tests[test_b].get_sample_size() == 1
+        assert len(framework.performance_history) == 4
+    
     def test_analyze_test(self, sample_post_result):
         """Test analyzing A/B test results"""
         framework = ABTestingFramework()
@@ -377,6 +596,39 @@ class TestABTestingFramework:
         assert "winner" in analysis
         assert len(analysis["variants"]) == 2
     
+    def test_analyze_test_reuses_analysis_until_new_results(self, sample_post_result):
+        """Test analysis is cached per sample size and status"""
+        framework = ABTestingFramework()
+        
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, 0.5),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, 0.5)
+        ]
+        
+        test_id = framework.create_test("Test", "Description", variants)
+        framework.record_result(test_id, "v1", sample_post_result)
+        
+        first = framework._cached_analysis(test_id)
+        assert framework._cached_analysis(test_id) is first
+        
+        # Callers get copies, so annotating one doesn't leak into later results
+        returned = framework.analyze_test(test_id)
+        assert returned == first
+        returned["variants"]["v1"]["note"] = "annotated"
+        returned["winner"]["variant_id"] = "tampered"
+        assert "note" not in framework.analyze_test(test_id)["variants"]["v1"]
+        assert framework.export_test_results(test_id)["analysis"]["winner"]["variant_id"] == "v1"
+        
+        framework.record_result(test_id, "v2", sample_post_result)
+        second = framework._cached_analysis(test_id)
+        assert second is not first
+        assert second["sample_size"] == 2
+        
+        framework._complete_test(test_id, "Manual")
+        completed = framework._cached_analysis(test_id)
+        assert completed is not second
+        assert completed["status"] == "completed"
+    
     def test_get_optimization_recommendations(self, sample_post_result):
         """Test getting optimization recommendations"""
         framework = ABTestingFramework()
@@ -418,6 +670,30 @@ class TestABTestingFramework:
         assert "analysis" in export_data
         assert "recommendations" in export_data
 
+    
+    def test_export_reflects_reassigned_strategy_status_and_start_date(self):
+        """Test cached export strings follow attribute reassignment"""
+        framework = ABTestingFramework()
+        
+        variants = [
+            TestVariant("v1", "Variant 1", ContentStrategy.VIRAL_HOOKS, 0.5),
+            TestVariant("v2", "Variant 2", ContentStrategy.ANALYTICAL, 0.5)
+        ]
+        
+        test_id = framework.create_test("Test", "Description", variants)
+        test = framework.active_tests[test_id]
+        
+        variants[0].strategy = ContentStrategy.EDUCATIONAL
+        test.status = TestStatus.PAUSED
+        test.start_date = datetime(2024, 1, 2, 3, 4, 5)
+        
+        export_data = framework.export_test_results(test_id)
+        
+        assert export_data["test_config"]["variants"][0]["strategy"] == "educational"
+        assert export_data["test_config"]["status"] == "paused"
+        assert export_data["test_config"]["start_date"] == "2024-01-02T03:04:05"
+        assert framework.get_active_tests()[0]["status"] == "paused"
+
 
 class TestIntegration:
     """Integration tests for A/B testing framework"""
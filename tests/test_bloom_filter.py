@@ -0,0 +1,61 @@
+# tests/test_bloom_filter.py
+"""
+Tests for the Bloom filter utility
+"""
+import pytest
+
+from src.utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    """Test cases for BloomFilter"""
+    
+    def test_added_items_are_members(self):
+        """Test that every added item is reported as present"""
+        bloom = BloomFilter(capacity=100, error_rate=0.01)
+        urls = [f"https://example.com/news/{i}" for i in range(100)]
+        
+        for url in urls:
+            bloom.add(url)
+        
+        assert all(url in bloom for url in urls)
+        assert len(bloom) == 100
+    
+    def test_false_positive_rate_near_target(self):
+        """Test that unseen items are rarely reported as present"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"seen-{i}")
+        
+        false_positives = sum(f"unseen-{i}" in bloom for i in range(5000))
+        
+        assert false_positives / 5000 < 0.03
+    
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test that a saved filter loads with the same contents"""
+        bloom = BloomFilter(capacity=50)
+        bloom.add("https://example.com/a")
+        path = tmp_path / "state" / "seen.bloom"
+        
+        bloom.save(path)
+        loaded = BloomFilter.load(path)
+        
+        assert "https://example.com/a" in loaded
+        assert "https://example.com/b" not in loaded
+        assert len(loaded) == 1
+        assert loaded.num_bits == bloom.num_bits
+    
+    def test_load_rejects_invalid_file(self, tmp_path):
+        """Test that corrupt files raise ValueError"""
+        path = tmp_path / "seen.bloom"
+        path.write_bytes(b"not a bloom filter")
+        
+        with pytest.raises(ValueError):
+            BloomFilter.load(path)
+    
+    def test_invalid_parameters(self):
+        """Test parameter validation"""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
@@ -6,12 +6,15 @@ import unittest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import asyncio
 import json
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any
 
 from src.agents.bluesky_crypto_agent import BlueskyCryptoAgent
 from src.models.data_models import NewsItem, GeneratedContent, PostResult, ContentType
 from src.config.agent_config import AgentConfig
+from src.utils.bloom_filter import BloomFilter
+from src.services.management_interface import ManagementInterface
 
 
 class TestBlueskyCryptoAgent(unittest.TestCase):
@@ -65,7 +68,8 @@ class TestBlueskyCryptoAgent(unittest.TestCase):
         # Verify initialization
         self.assertEqual(agent.config, self.config)
         self.assertEqual(agent.llm, self.mock_llm)
-        self.assertIsInstance(agent.content_history, list)
+        self.assertIsInstance(agent.content_history, deque)
+        self.assertEqual(agent.content_history.maxlen, 50)
         self.assertEqual(len(agent.content_history), 0)
         
         # Verify tools were created
@@ -407,6 +411,12 @@ class TestBlueskyCryptoAgent(unittest.TestCase):
         self.assertEqual(parsed.text, self.test_content.text)
         self.assertEqual(parsed.hashtags, self.test_content.hashtags)
         self.assertEqual(parsed.engagement_score, self.test_content.engagement_score)
+        
+        # UTC timestamps with a trailing 'Z' are accepted
+        content_data = self.test_content.to_dict()
+        content_data['source_news']['timestamp'] = "2024-01-15T10:30:00Z"
+        parsed = agent._parse_generated_content(content_data)
+        self.assertEqual(parsed.source_news.timestamp, datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc))
     
     @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
     @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
@@ -431,11 +441,10 @@ class TestBlueskyCryptoAgent(unittest.TestCase):
         """Test error result creation"""
         agent = BlueskyCryptoAgent(self.mock_llm, self.config)
         
-        start_time = datetime.now()
         error_msg = "Test error message"
         
         # Create error result without content
-        result = agent._create_error_result(error_msg, start_time)
+        result = agent._create_error_result(error_msg)
         
         # Verify error result
         self.assertFalse(result.success)
@@ -443,14 +452,273 @@ class TestBlueskyCryptoAgent(unittest.TestCase):
         self.assertEqual(result.error_message, error_msg)
         self.assertIsNotNone(result.content)
         self.assertEqual(result.content.text, "Workflow execution failed")
+        self.assertFalse(result.retryable)
+        self.assertTrue(agent._create_error_result(error_msg, retryable=True).retryable)
+        # Each error result gets its own placeholder, so mutating one leaves the others intact
+        result.content.hashtags.append("#changed")
+        result.content.source_news.topics.append("changed")
+        other = agent._create_error_result(error_msg)
+        self.assertIsNot(other.content, result.content)
+        self.assertEqual(other.content.hashtags, [])
+        self.assertEqual(other.content.source_news.topics, ["Error"])
         
         # Create error result with content
-        result_with_content = agent._create_error_result(error_msg, start_time, self.test_content)
+        result_with_content = agent._create_error_result(error_msg, self.test_content)
         
         # Verify error result with content
         self.assertFalse(result_with_content.success)
         self.assertEqual(result_with_content.content, self.test_content)
 
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_get_news_uses_ttl_cache(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that repeated news queries are served from the cache until it expires"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        news_data = {"success": True, "news_items": [self.test_news.to_dict()]}
+        agent._retrieve_news = AsyncMock(return_value=news_data)
+        
+        self.assertEqual(asyncio.run(agent._get_news("Bitcoin news")), news_data)
+        self.assertEqual(asyncio.run(agent._get_news("Bitcoin news")), news_data)
+        self.assertEqual(agent._retrieve_news.await_count, 1)
+        
+        # Expire the entry and query again
+        fetched_at, cached = agent._news_cache["Bitcoin news"]
+        agent._news_cache["Bitcoin news"] = (fetched_at - self.config.news_cache_ttl_seconds, cached)
+        asyncio.run(agent._get_news("Bitcoin news"))
+        self.assertEqual(agent._retrieve_news.await_count, 2)
+        
+        agent.clear_news_cache()
+        self.assertEqual(agent._news_cache, {})
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_get_news_does_not_cache_fallback(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that failed or fallback news retrievals are not cached"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        agent._retrieve_news = AsyncMock(side_effect=[
+            {"success": False, "error": "API down"},
+            agent._get_fallback_news_data("Bitcoin news"),
+        ])
+        
+        asyncio.run(agent._get_news("Bitcoin news"))
+        asyncio.run(agent._get_news("Bitcoin news"))
+        
+        self.assertEqual(agent._news_cache, {})
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_get_content_caches_by_news_batch(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that generated content is reused for the same news batch until discarded"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        content_data = {"success": True, "content": self.test_content.to_dict()}
+        agent._generate_content = AsyncMock(return_value=content_data)
+        
+        news_data = {"success": True, "news_items": [self.test_news.to_dict()]}
+        # Same headline with different case and spacing is the same batch
+        same_batch = {"success": True, "news_items": [{
+            **self.test_news.to_dict(),
+            "headline": "  " + self.test_news.headline.upper()
+        }]}
+        
+        self.assertEqual(asyncio.run(agent._get_content(news_data)), content_data)
+        self.assertEqual(asyncio.run(agent._get_content(same_batch)), content_data)
+        self.assertEqual(agent._generate_content.await_count, 1)
+        
+        agent._discard_cached_content(news_data)
+        asyncio.run(agent._get_content(news_data))
+        self.assertEqual(agent._generate_content.await_count, 2)
+        
+        # Fallback content is never cached
+        agent.clear_content_cache()
+        agent._generate_content = AsyncMock(return_value=agent._get_fallback_content_data(news_data))
+        asyncio.run(agent._get_content(news_data))
+        self.assertEqual(len(agent._content_cache), 0)
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_overrides_pushed_by_management_interface(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that the agent tracks overrides pushed by the management interface"""
+        management = ManagementInterface()
+        management.set_manual_override('skip_posting', True, 60)
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config, management)
+        
+        self.assertTrue(agent._is_override_active('skip_posting'))
+        self.assertFalse(agent._is_override_active('force_content_approval'))
+        
+        result = asyncio.run(agent.execute_workflow("test query"))
+        self.assertFalse(result.success)
+        self.assertIn("manual override", result.error_message.lower())
+        
+        management.remove_manual_override('skip_posting')
+        self.assertFalse(agent._is_override_active('skip_posting'))
+        
+        # Expired overrides stop applying even before the interface cleans them up
+        agent._on_override_change('force_content_approval', datetime.now() - timedelta(minutes=1))
+        self.assertFalse(agent._is_override_active('force_content_approval'))
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_overrides_checked_on_interface_without_subscriptions(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that interfaces without subscribe_overrides are asked directly"""
+        class PollingInterface:
+            def __init__(self):
+                self.active = set()
+            
+            def is_override_active(self, override_type):
+                return override_type in self.active, None
+        
+        management = PollingInterface()
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config, management)
+        self.assertFalse(agent._is_override_active('skip_posting'))
+        
+        management.active.add('skip_posting')
+        self.assertTrue(agent._is_override_active('skip_posting'))
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_get_content_limits_concurrent_generations(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that concurrent content generations are capped by max_concurrent_llm_calls"""
+        self.config.max_concurrent_llm_calls = 1
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        in_flight = []
+        peak = []
+        
+        async def generate(news_data):
+            in_flight.append(news_data)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(news_data)
+            return {"success": False}
+        
+        agent._generate_content = generate
+        
+        async def run_batches():
+            await asyncio.gather(*(
+                agent._get_content({"news_items": [{"headline": f"Headline {i}"}]}) for i in range(3)
+            ))
+        
+        asyncio.run(run_batches())
+        self.assertEqual(len(peak), 3)
+        self.assertEqual(max(peak), 1)
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_render_post_text(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that hashtags are appended only when the full post fits"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        hashtag_text = " ".join(self.test_content.hashtags)
+        
+        self.assertEqual(agent._render_post_text(self.test_content), f"{self.test_content.text} {hashtag_text}")
+        
+        # Exactly at the limit the hashtags still fit
+        agent._max_post_length = len(self.test_content.text) + 1 + len(hashtag_text)
+        self.assertEqual(agent._render_post_text(self.test_content), f"{self.test_content.text} {hashtag_text}")
+        
+        agent._max_post_length = len(self.test_content.text) + len(hashtag_text)
+        self.assertEqual(agent._render_post_text(self.test_content), self.test_content.text)
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_aclose_closes_news_client(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that aclose releases the tools' HTTP sessions"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        
+        asyncio.run(agent.aclose())
+        
+        mock_news_tool.return_value.api_client.close.assert_called_once()
+        mock_social_tool.return_value.close.assert_called_once()
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_drop_seen_news(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that news already posted about is removed before content generation"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        agent.seen_news = BloomFilter(capacity=100)
+        agent.seen_news.add(agent._news_key("https://example.com/seen", "Seen headline"))
+        
+        news_data = {"success": True, "count": 3, "news_items": [
+            {"headline": "Seen headline", "url": "https://example.com/seen"},
+            {"headline": "Fresh headline", "url": "https://example.com/fresh"},
+            {"headline": "No URL headline", "url": None},
+        ]}
+        
+        filtered = agent._drop_seen_news(news_data)
+        
+        self.assertEqual([item["headline"] for item in filtered["news_items"]],
+                         ["Fresh headline", "No URL headline"])
+        self.assertEqual(filtered["count"], 2)
+        self.assertEqual(len(news_data["news_items"]), 3)
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_execute_workflow_authenticates_during_retrieval(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that Bluesky login is started alongside news retrieval"""
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        
+        async def retrieve_news(query):
+            # Let the authentication task start before retrieval completes
+            await asyncio.sleep(0.01)
+            return {"success": False, "error": "API down"}
+        agent._retrieve_news = retrieve_news
+        
+        asyncio.run(agent.execute_workflow("Bitcoin news"))
+        
+        mock_social_tool.return_value.ensure_authenticated.assert_called_once_with("test_user", "test_pass")
+    
+    @patch('src.agents.bluesky_crypto_agent.create_news_retrieval_tool')
+    @patch('src.agents.bluesky_crypto_agent.create_content_generation_tool')
+    @patch('src.agents.bluesky_crypto_agent.BlueskySocialTool')
+    def test_execute_workflow_reuses_login_after_early_return(self, mock_social_tool, mock_content_tool, mock_news_tool):
+        """Test that a login left running by an early return is reused by the next workflow"""
+        import threading
+        
+        agent = BlueskyCryptoAgent(self.mock_llm, self.config)
+        release_login = threading.Event()
+        
+        def ensure_authenticated(username, password):
+            release_login.wait(5)
+            raise RuntimeError("login failed")
+        mock_social_tool.return_value.ensure_authenticated.side_effect = ensure_authenticated
+        
+        async def retrieve_news(query):
+            return {"success": False, "error": "API down"}
+        agent._retrieve_news = retrieve_news
+        
+        async def run():
+            loop = asyncio.get_running_loop()
+            unhandled = []
+            loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+            first = await agent.execute_workflow("Bitcoin news")
+            login_task = agent._login_task
+            still_running = not login_task.done()
+            second = await agent.execute_workflow("Bitcoin news")
+            reused = agent._login_task is login_task
+            release_login.set()
+            logged_in = await login_task
+            return first, second, still_running, reused, logged_in, unhandled
+        
+        first, second, still_running, reused, logged_in, unhandled = asyncio.run(run())
+        
+        self.assertFalse(first.success)
+        self.assertFalse(second.success)
+        # A failed retrieval is transient, so the runner may retry early
+        self.assertTrue(first.retryable)
+        self.assertTrue(still_running)
+        self.assertTrue(reused)
+        self.assertFalse(logged_in)
+        mock_social_tool.return_value.ensure_authenticated.assert_called_once()
+        self.assertEqual(unhandled, [])
 
 if __name__ == '__main__':
     # Run async tests
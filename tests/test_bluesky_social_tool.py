@@ -6,9 +6,23 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
+from langchain.tools import Tool
+
 from src.tools.bluesky_social_tool import BlueskySocialTool, BlueskySocialInput
 
 
+@pytest.fixture
+def detached_tool():
+    """BlueskySocialTool built without running LangChain's model validation
+    
+    Session handling doesn't depend on the LangChain model, so these tests
+    still run where the installed LangChain and pydantic versions disagree.
+    """
+    with patch.object(Tool, '__init__', lambda self, **kwargs: None), \
+         patch.object(BlueskySocialTool, '__setattr__', object.__setattr__):
+        yield BlueskySocialTool()
+
+
 class TestBlueskySocialTool:
     """Test cases for BlueskySocialTool"""
     
@@ -309,4 +323,46 @@ class TestBlueskySocialToolIntegration:
             assert result['success'] is True
             assert result['post_id'] == "at://recovery_uri"
             assert result['retry_count'] == 1
-            assert mock_client.send_post.call_count == 2
\ No newline at end of file
+            assert mock_client.send_post.call_count == 2
+
+
+class TestBlueskySocialToolSession:
+    """Test cases for BlueskySocialTool session reuse"""
+    
+    test_username = "testuser.bsky.social"
+    test_password = "testpassword"
+    
+    def test_ensure_authenticated_logs_in_once(self, detached_tool):
+        """Test pre-authentication only logs in when there is no valid session"""
+        def login(username, password):
+            detached_tool.client = Mock(me={'handle': username})
+            detached_tool.authenticated_user = username
+        
+        with patch.object(detached_tool, '_authenticate', side_effect=login) as mock_auth:
+            assert detached_tool.ensure_authenticated(self.test_username, self.test_password) is True
+            assert detached_tool.ensure_authenticated(self.test_username, self.test_password) is True
+        
+        mock_auth.assert_called_once_with(self.test_username, self.test_password)
+    
+    def test_ensure_authenticated_failure_is_not_raised(self, detached_tool):
+        """Test pre-authentication failures are reported instead of raised"""
+        with patch.object(detached_tool, '_authenticate', side_effect=Exception("Authentication failed")):
+            assert detached_tool.ensure_authenticated(self.test_username, self.test_password) is False
+    
+    @patch('src.tools.bluesky_social_tool.Client')
+    def test_reauthentication_reuses_client(self, mock_client_class, detached_tool):
+        """Test that logging in again reuses the pooled client"""
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        
+        detached_tool._authenticate(self.test_username, self.test_password)
+        detached_tool.client = None
+        detached_tool._authenticate(self.test_username, self.test_password)
+        
+        mock_client_class.assert_called_once()
+        assert mock_client.login.call_count == 2
+        assert detached_tool.client is mock_client
+        
+        detached_tool.close()
+        mock_client.request.close.assert_called_once()
+        assert detached_tool.client is None
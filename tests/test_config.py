@@ -4,6 +4,7 @@ Unit tests for configuration management
 """
 import os
 import pytest
+from dataclasses import asdict
 from unittest.mock import patch
 from src.config.agent_config import AgentConfig
 
@@ -63,6 +64,13 @@ class TestAgentConfig:
         assert config.min_engagement_score == 0.8
         assert config.duplicate_threshold == 0.9
     
+    @patch.dict(os.environ, {'CONTENT_THEMES': ' Bitcoin, ,Ethereum,'})
+    def test_config_from_env_skips_blank_themes(self):
+        """Test that blank entries in CONTENT_THEMES are dropped"""
+        config = AgentConfig.from_env()
+        
+        assert config.content_themes == ['Bitcoin', 'Ethereum']
+    
     @patch.dict(os.environ, {}, clear=True)
     def test_config_from_env_defaults(self):
         """Test loading configuration from environment with default values"""
@@ -142,6 +150,19 @@ class TestAgentConfig:
         assert config_dict['bluesky_username'] == 'test_user'
         assert config_dict['posting_interval_minutes'] == 30
     
+    def test_config_to_dict_is_memoized_and_invalidated(self):
+        """Test that to_dict reuses its cached view until an attribute changes"""
+        config = AgentConfig(bluesky_username="test_user")
+        
+        first = config.to_dict()
+        first['bluesky_username'] = "mutated"
+        assert config.to_dict()['bluesky_username'] == "test_user"
+        assert config._dict_view() is config._dict_view()
+        
+        config.bluesky_username = "other_user"
+        assert config.to_dict()['bluesky_username'] == "other_user"
+        assert '_dict_cache' not in asdict(config)
+    
     def test_config_to_dict_empty_secrets(self):
         """Test converting configuration with empty secrets to dictionary"""
         config = AgentConfig()
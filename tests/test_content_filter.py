@@ -4,6 +4,7 @@ Unit tests for ContentFilter class
 """
 import pytest
 from datetime import datetime, timedelta
+from difflib import SequenceMatcher
 from unittest.mock import patch
 
 from src.services.content_filter import ContentFilter, ContentHistoryItem
@@ -101,6 +102,45 @@ class TestContentFilter:
         assert not is_duplicate
         assert similarity < 0.5
     
+    def test_duplicate_prescreen_matches_full_scoring(self):
+        """Test that the similarity pre-screen reports the same best score as scoring every pair"""
+        history_texts = [
+            "Ethereum staking rewards climb as validators join the network #ETH",
+            "DeFi protocols see record inflows this week #DeFi #Crypto",
+            "Bitcoin hashrate reaches new highs amid miner expansion #Bitcoin",
+            "NFT trading volume drops sharply across major marketplaces #NFT",
+        ]
+        for text in history_texts:
+            self.content_filter.add_to_history(self.create_sample_content(text))
+        
+        candidate = "Bitcoin miners expand as hashrate climbs to record levels #Bitcoin"
+        expected = max(
+            SequenceMatcher(None, candidate.lower(), text.lower()).ratio() * 0.7 +
+            self.content_filter._calculate_word_similarity(candidate, text) * 0.3
+            for text in history_texts
+        )
+        
+        is_duplicate, similarity = self.content_filter._check_duplicates(candidate)
+        
+        assert not is_duplicate
+        assert similarity == pytest.approx(expected)
+        
+        # History matchers are reused across candidates without carrying over state
+        other = "Ethereum validators see staking rewards climb across the network #ETH"
+        expected_other = max(
+            SequenceMatcher(None, other.lower(), text.lower()).ratio() * 0.7 +
+            self.content_filter._calculate_word_similarity(other, text) * 0.3
+            for text in history_texts
+        )
+        assert self.content_filter._check_duplicates(other)[1] == pytest.approx(expected_other)
+        assert self.content_filter._check_duplicates(candidate)[1] == pytest.approx(expected)
+        
+        # Filters holding the same history text keep their own matchers
+        other_filter = ContentFilter()
+        other_filter.add_to_history(self.create_sample_content(history_texts[0]))
+        other_filter._check_duplicates(other)
+        assert other_filter.recent_posts[0]._matcher is not self.content_filter.recent_posts[0]._matcher
+    
     def test_quality_scoring_high_quality(self):
         """Test quality scoring for high-quality content"""
         high_quality_text = "Bitcoin technical analysis reveals strong adoption trends and innovative development in the ecosystem #Bitcoin #Analysis"
@@ -392,6 +432,20 @@ class TestContentFilter:
         hash5 = self.content_filter._generate_content_hash("hello world")
         assert hash4 == hash5
     
+    def test_exact_duplicate_skips_similarity_scan(self):
+        """Test that re-filtering content already in history is a hash lookup"""
+        content = self.create_sample_content(
+            "Bitcoin analysis shows strong technical indicators and development trends #Bitcoin #Analysis"
+        )
+        self.content_filter.add_to_history(content)
+        
+        with patch('src.services.content_filter.SequenceMatcher') as mock_matcher:
+            approved, details = self.content_filter.filter_content(content)
+        
+        assert not approved
+        assert details['scores']['similarity'] == 1.0
+        mock_matcher.assert_not_called()
+    
     def test_hashtag_balance_scoring(self):
         """Test that quality scoring considers hashtag balance"""
         # Optimal hashtag count (2-4)
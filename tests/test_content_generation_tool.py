@@ -7,6 +7,8 @@ import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+from langchain.tools import Tool
+
 from src.tools.content_generation_tool import (
     ContentGenerationTool,
     ViralContentStrategies,
@@ -219,6 +221,13 @@ class TestContentGenerationTool:
         """Create ContentGenerationTool instance"""
         return ContentGenerationTool(config)
     
+    @pytest.fixture
+    def detached_tool(self, config):
+        """Create ContentGenerationTool without running LangChain's model validation"""
+        with patch.object(Tool, '__init__', lambda self, **kwargs: None), \
+             patch.object(ContentGenerationTool, '__setattr__', object.__setattr__):
+            yield ContentGenerationTool(config)
+    
     @pytest.fixture
     def sample_news_item(self):
         """Create sample news item for testing"""
@@ -264,6 +273,17 @@ class TestContentGenerationTool:
         assert len(news_items) == 1
         assert isinstance(news_items[0], NewsItem)
     
+    def test_parse_news_data_parsed_dict(self, detached_tool, sample_news_item):
+        """Test parsing news data that was already decoded in-process"""
+        item_data = json.loads(json.dumps(sample_news_item.to_dict()))
+        news_data = {"success": True, "news_items": [item_data]}
+        news_items = detached_tool._parse_news_data(news_data)
+        
+        assert len(news_items) == 1
+        assert news_items[0].headline == sample_news_item.headline
+        # The caller's data is left untouched
+        assert isinstance(item_data["timestamp"], str)
+    
     def test_parse_news_data_invalid_json(self, tool):
         """Test parsing invalid JSON"""
         invalid_json = "invalid json string"
@@ -428,6 +428,22 @@ class TestContentOptimizationService:
         assert len(service.automated_optimizer.strategy_optimizer.optimization_history) == 1
         assert len(service.performance_analytics.performance_data) == 1
     
+    def test_record_post_performance_bulk(self, sample_config, sample_generated_content, sample_post_result):
+        """Test recording a batch of post performance records"""
+        service = ContentOptimizationService(sample_config)
+        
+        records = [
+            (sample_generated_content, sample_post_result, {"likes": i})
+            for i in range(3)
+        ]
+        
+        assert service.record_post_performance_bulk(records) == 3
+        assert len(service.performance_analytics.performance_data) == 3
+        assert service.performance_analytics.performance_data[-1]["engagement_data"] == {"likes": 2}
+        
+        strategy_optimizer = service.automated_optimizer.strategy_optimizer
+        assert sum(len(scores) for scores in strategy_optimizer.strategy_performance.values()) == 3
+    
     def test_run_optimization_cycle(self, sample_config, sample_post_result):
         """Test running optimization cycle"""
         service = ContentOptimizationService(sample_config)
@@ -7,6 +7,18 @@ from datetime import datetime
 from src.models.data_models import NewsItem, GeneratedContent, PostResult, ContentType
 
 
+class TestContentType:
+    """Test cases for ContentType enum"""
+    
+    def test_from_value(self):
+        """Test value lookup matches calling the enum"""
+        for member in ContentType:
+            assert ContentType.from_value(member.value) is ContentType(member.value)
+        
+        with pytest.raises(ValueError):
+            ContentType.from_value("unknown")
+
+
 class TestNewsItem:
     """Test cases for NewsItem data model"""
     
@@ -97,6 +109,45 @@ class TestNewsItem:
         assert result['timestamp'] == timestamp.isoformat()
         assert result['relevance_score'] == 0.8
         assert result['topics'] == ["Bitcoin", "Test"]
+    
+    def test_news_item_from_rows(self):
+        """Test building NewsItems from row tuples with a shared timestamp"""
+        timestamp = datetime.now()
+        rows = (
+            ("Headline 1", "Summary 1", "Source 1", 0.9, ("Bitcoin", "Price")),
+            ("Headline 2", "Summary 2", "Source 2", 0.7, ("Ethereum",), "https://example.com/2"),
+        )
+        
+        items = NewsItem.from_rows(rows, timestamp=timestamp)
+        
+        assert len(items) == 2
+        assert items[0].headline == "Headline 1"
+        assert items[0].topics == ["Bitcoin", "Price"]
+        assert items[0].url is None
+        assert items[1].url == "https://example.com/2"
+        assert all(item.timestamp == timestamp for item in items)
+    
+    def test_news_item_topics_interned(self):
+        """Test that equal topic strings from different sources share one object"""
+        topic = "".join(["Bit", "coin"])
+        item1 = NewsItem.from_rows([("Headline 1", "Summary 1", "Source", 0.9, [topic])])[0]
+        item2 = NewsItem.from_rows([("Headline 2", "Summary 2", "Source", 0.9, ["Bitcoin"])])[0]
+        
+        assert item1.topics == ["Bitcoin"]
+        assert item1.topics[0] is item2.topics[0]
+    
+    def test_news_item_source_interned(self):
+        """Test that equal source names share one object"""
+        source = "".join(["Coin", "Desk"])
+        item1 = NewsItem.from_rows([("Headline 1", "Summary 1", source, 0.9, ["Bitcoin"])])[0]
+        item2 = NewsItem.from_rows([("Headline 2", "Summary 2", "CoinDesk", 0.9, ["Bitcoin"])])[0]
+        
+        assert item1.source is item2.source
+    
+    def test_news_item_from_rows_validates(self):
+        """Test that from_rows applies the regular NewsItem validation"""
+        with pytest.raises(ValueError, match="topics cannot be empty"):
+            NewsItem.from_rows([("Headline", "Summary", "Source", 0.5, ())])
 
 
 class TestGeneratedContent:
@@ -314,4 +365,17 @@ class TestPostResult:
         assert result_dict['timestamp'] == timestamp.isoformat()
         assert 'content' in result_dict
         assert result_dict['retry_count'] == 1
-        assert 'execution_time' in result_dict
\ No newline at end of file
+        assert 'execution_time' in result_dict
+    
+    def test_models_use_slots(self):
+        """Test data model instances carry no per-instance __dict__"""
+        content = self.create_sample_generated_content()
+        result = PostResult(
+            success=True,
+            post_id="12345",
+            timestamp=datetime.now(),
+            content=content
+        )
+        
+        for instance in (content.source_news, content, result):
+            assert not hasattr(instance, '__dict__')
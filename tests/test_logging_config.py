@@ -12,7 +12,7 @@ from datetime import datetime
 from pathlib import Path
 
 from src.utils.logging_config import (
-    StructuredFormatter, LoggingConfig, setup_logging, log_performance
+    StructuredFormatter, LoggingConfig, setup_logging, log_performance, ContextLoggerAdapter
 )
 
 
@@ -392,6 +392,25 @@ class TestSetupLoggingFunction(unittest.TestCase):
             self.assertFalse(call_args['enable_console'])
 
 
+class TestContextLoggerAdapter(unittest.TestCase):
+    """Test cases for ContextLoggerAdapter"""
+    
+    def test_merges_call_extra_with_context(self):
+        """Test per-call extra fields are kept alongside the adapter context"""
+        logger = logging.getLogger("test_context_adapter")
+        adapter = ContextLoggerAdapter(logger, {"component": "agent", "step": "default"})
+        
+        with self.assertLogs(logger, level="INFO") as captured:
+            adapter.info("with extra", extra={"step": "posting"})
+            adapter.info("without extra")
+        
+        first, second = captured.records
+        self.assertEqual(first.component, "agent")
+        self.assertEqual(first.step, "posting")
+        self.assertEqual(second.component, "agent")
+        self.assertEqual(second.step, "default")
+
+
 class TestLogPerformanceDecorator(unittest.TestCase):
     """Test cases for log_performance decorator"""
     
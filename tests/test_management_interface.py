@@ -5,6 +5,7 @@ Tests for the management interface functionality
 import pytest
 import json
 import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -124,6 +125,41 @@ class TestManagementInterface:
         assert len(errors) > 0
         assert any("PERPLEXITY_API_KEY" in error for error in errors)
     
+    def test_validate_configuration_fail_fast(self, management_interface):
+        """Test that fail_fast stops at the first missing required setting"""
+        invalid_config = AgentConfig(
+            perplexity_api_key="",
+            bluesky_username="",
+            bluesky_password="test_pass",
+            max_post_length=10
+        )
+        
+        is_valid, errors = management_interface.validate_configuration(invalid_config, fail_fast=True)
+        
+        assert is_valid is False
+        assert errors == ["PERPLEXITY_API_KEY is required"]
+    
+    def test_validate_configuration_reuses_unchanged_results(self, management_interface, sample_config):
+        """Test that revalidation tracks changed fields and reuses the rest"""
+        is_valid, _ = management_interface.validate_configuration(sample_config)
+        assert is_valid is True
+        
+        sample_config.content_themes.extend(f"Theme {i}" for i in range(10))
+        sample_config.max_retries = -1
+        is_valid, errors = management_interface.validate_configuration(sample_config)
+        
+        assert is_valid is False
+        assert errors == [
+            "max_retries must be non-negative",
+            "Too many content themes (max 10 recommended)"
+        ]
+        
+        sample_config.max_retries = 3
+        del sample_config.content_themes[2:]
+        is_valid, errors = management_interface.validate_configuration(sample_config)
+        assert is_valid is True
+        assert errors == []
+    
     def test_load_configuration_from_file_success(self, management_interface, sample_config):
         """Test loading configuration from file successfully"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -208,6 +244,45 @@ class TestManagementInterface:
         assert status['components']['agent']['status'] == 'active'
         assert status['components']['scheduler']['status'] == 'active'
     
+    def test_get_system_status_cached(self, management_interface):
+        """Test that system status is served from cache within the TTL"""
+        first = management_interface.get_system_status()
+        second = management_interface.get_system_status()
+        
+        assert second == first
+        assert management_interface.agent.get_workflow_stats.call_count == 1
+        
+        # Callers get their own copy, so changing one doesn't alter later responses
+        second['annotated_by_caller'] = True
+        assert 'annotated_by_caller' not in management_interface.get_system_status()
+        
+        refreshed = management_interface.get_system_status(force_refresh=True)
+        assert refreshed is not first
+        assert management_interface.agent.get_workflow_stats.call_count == 2
+    
+    def test_system_status_cache_expires(self, management_interface):
+        """Test that cached system status is rebuilt after the TTL"""
+        first = management_interface.get_system_status()
+        
+        with patch('src.services.management_interface.time.monotonic',
+                   return_value=time.monotonic() + management_interface.STATUS_CACHE_TTL_SECONDS + 1):
+            second = management_interface.get_system_status()
+        
+        assert second is not first
+    
+    def test_report_cache_invalidated_by_changes(self, management_interface):
+        """Test that overrides and component changes invalidate cached reports"""
+        first = management_interface.get_system_status()
+        
+        management_interface.set_manual_override('skip_posting', True, 30)
+        second = management_interface.get_system_status()
+        assert second is not first
+        assert second['manual_overrides']['overrides'] == ['skip_posting']
+        
+        management_interface.scheduler = None
+        third = management_interface.get_system_status()
+        assert third['components']['scheduler']['status'] == 'not_initialized'
+    
     def test_get_performance_metrics(self, management_interface):
         """Test getting performance metrics"""
         with patch.object(management_interface.metrics_collector, 'get_metrics_for_period') as mock_get_metrics:
@@ -276,6 +351,33 @@ class TestManagementInterface:
         
         assert success is False
     
+    def test_set_manual_overrides_bulk(self, management_interface):
+        """Test setting several overrides in one call"""
+        results = management_interface.set_manual_overrides({
+            'skip_posting': (True, 60),
+            'force_content_approval': (True, 30),
+            'bad_duration': (True, 'not a number')
+        })
+        
+        assert results == {'skip_posting': True, 'force_content_approval': True, 'bad_duration': False}
+        assert management_interface.manual_overrides['skip_posting']['duration_minutes'] == 60
+        assert management_interface.manual_overrides['force_content_approval']['duration_minutes'] == 30
+        assert 'bad_duration' not in management_interface.manual_overrides
+        assert (management_interface.manual_overrides['skip_posting']['set_at'] ==
+                management_interface.manual_overrides['force_content_approval']['set_at'])
+    
+    def test_remove_manual_overrides_bulk(self, management_interface):
+        """Test removing several overrides in one call"""
+        management_interface.set_manual_overrides({
+            'skip_posting': (True, 60),
+            'force_content_approval': (True, 30)
+        })
+        
+        results = management_interface.remove_manual_overrides(['skip_posting', 'nonexistent'])
+        
+        assert results == {'skip_posting': True, 'nonexistent': False}
+        assert list(management_interface.manual_overrides) == ['force_content_approval']
+    
     def test_get_active_overrides(self, management_interface):
         """Test getting active overrides"""
         # Set some overrides
@@ -303,6 +405,22 @@ class TestManagementInterface:
         assert is_active is True
         assert value is True
     
+    def test_subscribe_overrides(self, management_interface):
+        """Test that override changes are pushed to subscribers"""
+        management_interface.set_manual_override('skip_posting', True, 60)
+        changes = []
+        
+        # Existing overrides are replayed on subscription
+        management_interface.subscribe_overrides(lambda name, expires_at: changes.append((name, expires_at)))
+        assert changes == [('skip_posting', management_interface.manual_overrides['skip_posting']['expires_at'])]
+        
+        management_interface.set_manual_overrides({'force_content_approval': (True, 30)})
+        assert changes[-1] == ('force_content_approval',
+                               management_interface.manual_overrides['force_content_approval']['expires_at'])
+        
+        management_interface.remove_manual_overrides(['skip_posting', 'force_content_approval'])
+        assert changes[-2:] == [('skip_posting', None), ('force_content_approval', None)]
+    
     def test_cleanup_expired_overrides(self, management_interface):
         """Test cleanup of expired overrides"""
         # Set an override that expires immediately
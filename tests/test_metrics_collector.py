@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from unittest.mock import patch, Mock
 
 from src.utils.metrics_collector import (
-    MetricPoint, MetricSummary, MetricsCollector,
+    MetricPoint, MetricSummary, MetricsCollector, MetricsBatch, MetricCounter,
     get_metrics_collector, initialize_metrics_collector,
     record_metric, increment_counter, set_gauge, timer
 )
@@ -128,6 +128,21 @@ class TestMetricsCollector(unittest.TestCase):
         self.assertIn(metric_key, self.collector._metrics)
         self.assertEqual(len(self.collector._metrics[metric_key]), 3)
     
+    def test_increment_bound_counter(self):
+        """Test that pre-bound counters match increment_counter directly and through a batch"""
+        requests = MetricCounter("requests", "api_service")
+        
+        self.collector.increment(requests)
+        batch = MetricsBatch()
+        batch.increment(requests, 4)
+        self.collector.apply_batch(batch)
+        self.collector.increment_counter("requests", "api_service", 2)
+        
+        self.assertEqual(self.collector.get_counter("requests", "api_service"), 7)
+        points = self.collector._metrics["api_service.requests"]
+        self.assertEqual([point.value for point in points], [1, 4, 2])
+        self.assertTrue(all(point.tags == {"type": "counter"} for point in points))
+    
     def test_set_gauge(self):
         """Test setting a gauge value"""
         self.collector.set_gauge("memory_usage", 75.5, "system", "percent")
@@ -293,6 +308,25 @@ class TestMetricsCollector(unittest.TestCase):
         point = self.collector._metrics[metric_key][0]
         self.assertGreater(point.value, 0.01)
     
+    def test_batch_applies_on_exit(self):
+        """Test that batched updates are staged until the batch exits"""
+        with self.collector.batch() as batch:
+            self.assertIsInstance(batch, MetricsBatch)
+            batch.increment_counter("requests", "api_service", 2)
+            batch.increment_counter("requests", "api_service", 3)
+            batch.set_gauge("queue_depth", 4, "api_service")
+            with batch.timer("call", "api_service"):
+                pass
+            
+            # Nothing is visible until the batch is applied
+            self.assertEqual(self.collector.get_counter("requests", "api_service"), 0)
+            self.assertIsNone(self.collector.get_gauge("queue_depth", "api_service"))
+        
+        self.assertEqual(self.collector.get_counter("requests", "api_service"), 5)
+        self.assertEqual(self.collector.get_gauge("queue_depth", "api_service"), 4)
+        self.assertEqual(len(self.collector._metrics["api_service.requests"]), 2)
+        self.assertEqual(len(self.collector._metrics["api_service.call_duration"]), 1)
+    
     def test_metric_retention(self):
         """Test metric retention and cleanup"""
         # Create collector with very short retention
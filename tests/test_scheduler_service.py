@@ -105,6 +105,21 @@ class TestSchedulerService:
         assert scheduler.is_running is False
         mock_schedule.clear.assert_called()
     
+    @patch('src.services.scheduler_service.schedule')
+    def test_seconds_until_next_run_clamped(self, mock_schedule, scheduler):
+        """Test that the idle time follows the next run and stays within bounds"""
+        mock_schedule.next_run.return_value = None
+        assert scheduler._seconds_until_next_run() == scheduler.MAX_IDLE_SECONDS
+        
+        mock_schedule.next_run.return_value = datetime.now() - timedelta(seconds=5)
+        assert scheduler._seconds_until_next_run() == 0.0
+        
+        mock_schedule.next_run.return_value = datetime.now() + timedelta(hours=1)
+        assert scheduler._seconds_until_next_run() == scheduler.MAX_IDLE_SECONDS
+        
+        mock_schedule.next_run.return_value = datetime.now() + timedelta(seconds=10)
+        assert 0.0 < scheduler._seconds_until_next_run() <= 10.0
+    
     def test_run_once(self, scheduler):
         """Test manual single execution"""
         with patch.object(scheduler, '_run_workflow') as mock_run:
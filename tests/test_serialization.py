@@ -0,0 +1,95 @@
+# tests/test_serialization.py
+"""
+Unit tests for JSON serialization helpers
+"""
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import serialization
+from src.utils.serialization import dumps, dumps_bytes, loads
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request):
+    """Run each test with orjson (when installed) and with the stdlib fallback"""
+    if request.param == 'orjson':
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        yield request.param
+    else:
+        with patch.object(serialization, 'orjson', None):
+            yield request.param
+
+
+class TestSerialization:
+    """Test cases for serialization helpers"""
+    
+    def test_round_trip(self, backend):
+        """Test that data survives a dumps/loads round trip"""
+        data = {'name': 'agent', 'themes': ['Bitcoin', 'Ethereum'], 'threshold': 0.8, 'retries': 3}
+        
+        encoded = dumps_bytes(data)
+        
+        assert isinstance(encoded, bytes)
+        assert loads(encoded) == data
+    
+    def test_indent(self, backend):
+        """Test pretty-printed output"""
+        encoded = dumps_bytes({'a': 1}, indent=True)
+        
+        assert encoded.decode('utf-8') == '{\n  "a": 1\n}'
+    
+    def test_dumps_returns_str(self, backend):
+        """Test that dumps produces text matching dumps_bytes"""
+        data = {'headline': 'Bitcoin', 'topics': ['BTC'], 'when': datetime(2024, 1, 15, 10, 30)}
+        
+        encoded = dumps(data, indent=True)
+        
+        assert isinstance(encoded, str)
+        assert encoded == dumps_bytes(data, indent=True).decode('utf-8')
+    
+    def test_unsupported_types_serialized(self, backend):
+        """Test that non-JSON types are still serialized"""
+        encoded = dumps_bytes({'when': datetime(2024, 1, 15, 10, 30)})
+        
+        assert loads(encoded)['when'].startswith('2024-01-15')
+    
+    @pytest.mark.parametrize('indent', [False, True])
+    def test_backends_produce_identical_output(self, indent):
+        """Test that orjson and the stdlib fallback encode the same document"""
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        
+        class Status(Enum):
+            ACTIVE = "active"
+        
+        @dataclass
+        class Point:
+            x: int
+        
+        data = {
+            'when': datetime(2024, 1, 15, 10, 30, 5, 123456),
+            'status': Status.ACTIVE,
+            'point': Point(1),
+            'headline': 'Bitcoin € rally',
+            'counts': {1: 'one'},
+            'topics': ['BTC', 'ETH'],
+        }
+        
+        with_orjson = dumps(data, indent=indent)
+        with patch.object(serialization, 'orjson', None):
+            with_stdlib = dumps(data, indent=indent)
+        
+        assert with_orjson == with_stdlib
+        assert loads(with_orjson)['when'] == '2024-01-15 10:30:05.123456'
+        assert loads(with_orjson)['status'] == 'active'
+    
+    def test_invalid_json_raises_decode_error(self, backend):
+        """Test that invalid documents raise json.JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            loads('invalid json content')
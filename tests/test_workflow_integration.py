@@ -14,6 +14,7 @@ from src.agents.bluesky_crypto_agent import BlueskyCryptoAgent
 from src.config.agent_config import AgentConfig
 from src.models.data_models import NewsItem, GeneratedContent, PostResult, ContentType
 from src.services.content_filter import ContentFilter
+from src.utils.metrics_collector import MetricsCollector
 
 
 class TestWorkflowIntegration:
@@ -334,13 +335,8 @@ class TestWorkflowIntegration:
         with patch.object(agent.news_tool, '_arun') as mock_news, \
              patch.object(agent.content_tool, '_arun') as mock_content, \
              patch.object(agent.social_tool, '_arun') as mock_social, \
-             patch('src.agents.bluesky_crypto_agent.get_metrics_collector') as mock_metrics:
+             patch.object(agent, '_metrics', MetricsCollector()) as collector:
             
-            # Setup mock metrics collector
-            mock_collector = Mock()
-            mock_metrics.return_value = mock_collector
-            mock_collector.timer.return_value.__enter__ = Mock()
-            mock_collector.timer.return_value.__exit__ = Mock()
             
             # Setup successful workflow
             mock_news.return_value = json.dumps(sample_news_data)
@@ -367,9 +363,10 @@ class TestWorkflowIntegration:
             
             # Verify metrics collection
             assert result.success is True
-            mock_collector.increment_counter.assert_called()
-            mock_collector.record_metric.assert_called()
-            mock_collector.timer.assert_called()
+            assert collector.get_counter("workflow_success", "bluesky_crypto_agent") == 1
+            assert collector.get_counter("posts_published", "bluesky_crypto_agent") == 1
+            assert collector.get_gauge("active_workflows", "bluesky_crypto_agent") == 0
+            assert collector.get_metric_summary("news_retrieval_duration", "bluesky_crypto_agent") is not None
     
     def test_workflow_statistics_tracking(self, mock_config, mock_llm):
         """Test workflow statistics tracking"""